@@ -0,0 +1,109 @@
+"""
+Cache de sons em memória com orçamento de bytes.
+
+Compartilhado entre o Sintetizador e o ChordSampler: guarda os
+pygame.Sound prontos, contabiliza o tamanho PCM de cada entrada e remove
+as menos usadas (LRU) quando o total passa do orçamento. Contadores de
+acertos, falhas e remoções ficam disponíveis em stats().
+"""
+
+import threading
+from collections import OrderedDict
+
+from src.audio.device import obter_audio
+
+
+def tamanho_som(som) -> int:
+    """Tamanho em bytes do PCM de um pygame.Sound (formato do mixer)."""
+    dispositivo = obter_audio()
+    bytes_frame = (abs(dispositivo.format) // 8) * dispositivo.channels
+    return int(round(som.get_length() * dispositivo.frequency)) * bytes_frame
+
+
+class AudioCacheManager:
+    """Cache LRU de sons limitado pelo total de bytes PCM."""
+
+    def __init__(self, max_bytes: int = 48 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Orçamento total de memória PCM
+        """
+        self.max_bytes = max_bytes
+        self._entradas = OrderedDict()  # chave -> (som, bytes), do menos ao mais usado
+        self._lock = threading.Lock()   # Acessado pelo jogo e pelos workers de renderização
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, chave) -> bool:
+        """Consulta sem afetar contadores nem a ordem LRU."""
+        with self._lock:
+            return chave in self._entradas
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entradas)
+
+    def get(self, chave, default=None):
+        """Retorna o som da chave (marcando como usado) ou default."""
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is None:
+                self.misses += 1
+                return default
+            self._entradas.move_to_end(chave)
+            self.hits += 1
+            return entrada[0]
+
+    def put(self, chave, som, nbytes: int = None):
+        """
+        Guarda um som e remove os menos usados se passar do orçamento.
+
+        Args:
+            chave: Identificador do som (qualquer valor hashable)
+            som: pygame.Sound
+            nbytes: Tamanho PCM em bytes (padrão: calculado pelo formato do mixer)
+        """
+        if nbytes is None:
+            nbytes = tamanho_som(som)
+        with self._lock:
+            anterior = self._entradas.pop(chave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            self._entradas[chave] = (som, nbytes)
+            self._bytes += nbytes
+            self._evict()
+
+    def _evict(self):
+        """Remove as entradas menos usadas até caber no orçamento (com lock)."""
+        # A entrada recém-inserida fica, mesmo que sozinha passe do limite
+        while self._bytes > self.max_bytes and len(self._entradas) > 1:
+            _, (_, nbytes) = self._entradas.popitem(last=False)
+            self._bytes -= nbytes
+            self.evictions += 1
+
+    def clear(self):
+        """Esvazia o cache (os contadores são mantidos)."""
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+
+    @property
+    def bytes_usados(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def stats(self) -> dict:
+        """Contadores do cache: acertos, falhas, remoções e ocupação."""
+        with self._lock:
+            consultas = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / consultas if consultas else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entradas),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,135 @@
+"""
+Backing track sintetizado a partir do mapa de acordes.
+
+Quando a pasta de assets não tem a música, a faixa é gerada com os
+timbres do Sintetizador: cada acorde do mapa é tocado do seu início ao
+fim, re-atacado a cada ``passo`` segundos. A saída é mixada em blocos e
+gravada direto em um WAV no cache do usuário, sem manter a música
+inteira em memória; o engine toca esse WAV como a música normal.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+from src.audio.synthesizer import Sintetizador, Timbre
+from src.audio.wav_io import abrir_wav, escrever_wav_em_blocos, mono_para_int16_estereo
+from src.utils.paths import get_user_cache_path
+
+# Incrementar quando a geração mudar (invalida as faixas em cache)
+BACKING_VERSION = 1
+
+BLOCO_BACKING = 16384   # Frames por bloco gravado
+NIVEL_GOLPE = 0.5       # Pico de cada ataque do acorde (sobra para o reverb)
+FADE_GOLPE = 0.01       # Fade-out (s) no corte de cada ataque
+
+
+class _Mixagem:
+    """Buffer float32 que soma os ataques e libera os frames já completos."""
+
+    def __init__(self):
+        self.posicao = 0    # Frame da música no início do buffer
+        self.buffer = np.zeros(0, dtype=np.float32)
+
+    def somar(self, inicio: int, onda: np.ndarray):
+        """Soma uma onda a partir do frame ``inicio``."""
+        if inicio < self.posicao:
+            # Acordes sobrepostos no mapa: o trecho já liberado se perde
+            onda = onda[self.posicao - inicio:]
+            inicio = self.posicao
+        offset = inicio - self.posicao
+        falta = offset + len(onda) - len(self.buffer)
+        if falta > 0:
+            self.buffer = np.concatenate((self.buffer, np.zeros(falta, dtype=np.float32)))
+        self.buffer[offset:offset + len(onda)] += onda
+
+    def liberar(self, ate: int):
+        """Gera blocos float32 até o frame ``ate`` (silêncio onde não há som)."""
+        while self.posicao < ate:
+            n = min(BLOCO_BACKING, ate - self.posicao)
+            bloco = self.buffer[:n]
+            if len(bloco) < n:
+                bloco = np.concatenate((bloco, np.zeros(n - len(bloco), dtype=np.float32)))
+            self.buffer = self.buffer[n:]
+            self.posicao += n
+            yield bloco
+
+
+def _assinatura(chart, synth: Sintetizador, timbre: Timbre, passo: float) -> str:
+    """Identifica a faixa: mapa de acordes, timbre, motor, efeitos e taxa."""
+    efeitos = synth.efeitos.assinatura if synth.efeitos is not None else "seco"
+    eventos = ";".join(f"{e.start:.3f}-{e.end:.3f}-{e.chord_majmin}" for e in chart)
+    eventos = hashlib.sha1(eventos.encode("utf-8")).hexdigest()
+    return f"backing-v{BACKING_VERSION}|{timbre.value}|{synth.motor}|{efeitos}|{synth.sample_rate}|{passo}|{eventos}"
+
+
+def caminho_backing_track(assinatura: str) -> str:
+    """Arquivo da faixa em cache para uma assinatura."""
+    nome = hashlib.sha1(assinatura.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(get_user_cache_path("backing"), f"backing_{nome}.wav")
+
+
+def _golpes(chart, synth: Sintetizador, timbre: Timbre, passo: float):
+    """Gera (frame inicial, onda float32) de cada ataque, em ordem de tempo."""
+    sr = synth.sample_rate
+    for evento in chart:
+        frequencias = evento.chord.frequencies
+        t = evento.start
+        while t < evento.end - 1e-3:
+            duracao = min(passo, evento.end - t)
+            # Fim do acorde sem clique (o próximo pode começar logo em seguida)
+            onda = synth.renderizar_onda(frequencias, timbre, duracao, pico=NIVEL_GOLPE, fade_out=FADE_GOLPE)
+            yield int(round(t * sr)), onda
+            t += passo
+
+
+def _blocos_pcm(chart, synth: Sintetizador, timbre: Timbre, passo: float, n_frames: int):
+    """Mixa os ataques e gera blocos int16 estéreo prontos para gravar."""
+    mixagem = _Mixagem()
+    for inicio, onda in _golpes(chart, synth, timbre, passo):
+        inicio = min(inicio, n_frames)
+        # Tudo antes deste ataque já está completo
+        for bloco in mixagem.liberar(inicio):
+            yield mono_para_int16_estereo(bloco)
+        mixagem.somar(inicio, onda[:max(0, n_frames - inicio)])
+    for bloco in mixagem.liberar(n_frames):
+        yield mono_para_int16_estereo(bloco)
+
+
+def gerar_backing_track(chart, synth: Sintetizador, timbre: Timbre = Timbre.PAD, passo: float = 2.0) -> str:
+    """
+    Retorna o WAV do backing track da música, gerando-o se necessário.
+
+    Args:
+        chart: Mapa de acordes compilado (src.utils.chart.Chart)
+        synth: Sintetizador (taxa, motor e efeitos da faixa)
+        timbre: Timbre dos acordes
+        passo: Intervalo (s) entre ataques de um acorde longo
+
+    Returns:
+        str: Caminho do WAV (None se o mapa estiver vazio ou a gravação falhar)
+    """
+    if len(chart) == 0:
+        return None
+
+    assinatura = _assinatura(chart, synth, timbre, passo)
+    path = caminho_backing_track(assinatura)
+    if os.path.exists(path):
+        try:
+            if abrir_wav(path).assinatura == assinatura:
+                return path
+        except ValueError:
+            pass
+
+    n_frames = int(round(float(chart.ends.max()) * synth.sample_rate))
+    print(f"Gerando backing track ({n_frames / synth.sample_rate:.0f}s, {timbre.value})...")
+    try:
+        escrever_wav_em_blocos(
+            path, _blocos_pcm(chart, synth, timbre, passo, n_frames),
+            n_frames, 2, synth.sample_rate, assinatura,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Não foi possível gerar o backing track: {e}")
+        return None
+    return path
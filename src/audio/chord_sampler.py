@@ -2,13 +2,30 @@
 Gerenciador de samples reais de acordes extraídos da música.
 
 Usa arquivo WAV para extrair samples específicos nos timestamps
-dos acordes definidos no chords.json.
+dos acordes definidos no chords.json. Músicas em MP3/OGG são
+decodificadas uma única vez para um WAV em cache.
 """
 
 import pygame
 import numpy as np
-import wave
 import os
+import threading
+
+from src.audio.audio_cache import AudioCacheManager
+from src.audio.device import obter_audio
+from src.audio.voices import obter_vozes, GRUPO_SAMPLES
+from src.audio.resample import ReamostradorPolifasico, para_int16
+from src.audio.wav_io import abrir_wav, escrever_wav, escrever_wav_em_blocos, para_int16_estereo
+from src.utils.config import AUDIO_CACHE_MAX_MB
+from src.utils.file_cache import cache_path_for, source_signature
+
+# Formatos comprimidos decodificados pelo mixer do pygame
+FORMATOS_COMPRIMIDOS = (".mp3", ".ogg")
+
+# Incrementar quando a decodificação/reamostragem mudar (invalida os WAVs em cache)
+DECODE_CACHE_VERSION = 1
+RESAMPLE_CACHE_VERSION = 1
+DECODE_CACHE_SUFFIX = ".pcm.wav"
 
 
 class ChordSampler:
@@ -19,13 +36,14 @@ class ChordSampler:
     Cada sample é convertido em pygame.Sound para reprodução.
     """
     
-    def __init__(self, music_path: str, sample_duration: float = 1.5):
+    def __init__(self, music_path: str, sample_duration: float = 1.5, cache: AudioCacheManager = None):
         """
         Inicializa o sampler de acordes.
         
         Args:
-            music_path: Caminho para o arquivo de música (WAV preferido)
+            music_path: Caminho para o arquivo de música (WAV preferido; None = sem música)
             sample_duration: Duração padrão do sample em segundos
+            cache: Cache de sons em memória (compartilhável com o Sintetizador)
         """
         self.music_path = music_path
         self.sample_duration = sample_duration
@@ -34,25 +52,34 @@ class ChordSampler:
         self._current_sound = None
         self._sample_channel = None
         
+        # Configuração efetiva do mixer
+        self._dispositivo = obter_audio()
+        
         # Dados do áudio carregado
         self._audio_data = None
-        self._sample_rate = 44100
+        self._sample_rate = self._dispositivo.frequency
         self._num_channels = 2
         
-        # Cache de samples (evita recriar)
-        self._sample_cache = {}
+        self._fades = {}  # Curvas de fade por tamanho
+        self._thread_extracao = None
+        self._thread_preparo = None      # Decodificação/reamostragem em segundo plano
+        self._extracao_pendente = None  # Lote pedido enquanto a música é preparada
+        
+        # Cache de samples (evita recriar), chaveado pelo intervalo em frames
+        self._sample_cache = cache if cache is not None else AudioCacheManager(AUDIO_CACHE_MAX_MB * 1024 * 1024)
         
-        # Reservar um canal para samples
-        if pygame.mixer.get_num_channels() < 16:
-            pygame.mixer.set_num_channels(16)
-        self._sample_channel = pygame.mixer.Channel(15)
+        # Canais do grupo de samples (src.audio.voices)
+        self._vozes = obter_vozes()
         
         self._carregar_musica()
     
     def _carregar_musica(self):
-        """Carrega a música WAV para sampling."""
-        # Tentar WAV primeiro, depois MP3
-        wav_path = self.music_path.replace('.mp3', '.wav')
+        """Carrega a música WAV para sampling (ou decodifica MP3/OGG uma vez)."""
+        if self.music_path is None:
+            return  # Jogo sem música: só o som sintetizado
+        # Tentar WAV primeiro, depois os formatos comprimidos
+        base = os.path.splitext(self.music_path)[0]
+        wav_path = base + ".wav"
         
         if os.path.exists(wav_path):
             try:
@@ -61,46 +88,132 @@ class ChordSampler:
             except Exception as e:
                 print(f"ChordSampler: Erro ao carregar WAV: {e}")
         
-        if os.path.exists(self.music_path):
-            print(f"ChordSampler: Música encontrada: {self.music_path}")
-            print("ChordSampler: Para samples reais, converta para WAV:")
-            print(f"  -> {wav_path}")
-            self.music_loaded = False
-        else:
-            print(f"ChordSampler: Nenhuma música encontrada")
-            self.music_loaded = False
+        for ext in FORMATOS_COMPRIMIDOS:
+            comprimido = base + ext
+            if os.path.exists(comprimido):
+                self._carregar_comprimido(comprimido)
+                return
+        
+        print(f"ChordSampler: Nenhuma música encontrada")
+        self.music_loaded = False
+    
+    def _carregar_comprimido(self, path: str):
+        """
+        Usa o PCM decodificado em cache ou decodifica em segundo plano.
+        
+        O resultado é um WAV 16-bit no formato do mixer, reaproveitado pelo
+        caminho com memory mapping nas próximas execuções.
+        """
+        frequencia, canais = self._dispositivo.frequency, self._dispositivo.channels
+        assinatura = f"{source_signature(path, DECODE_CACHE_VERSION)}|{frequencia}|{canais}"
+        cache_path = cache_path_for(path, DECODE_CACHE_SUFFIX, "audio")
+        
+        if os.path.exists(cache_path):
+            try:
+                if abrir_wav(cache_path).assinatura == assinatura:
+                    self._load_wav(cache_path)
+                    return
+            except (OSError, ValueError) as e:
+                print(f"ChordSampler: Cache de PCM inválido ({e})")
+        
+        print(f"ChordSampler: Decodificando {os.path.basename(path)} em segundo plano...")
+        self._preparar_em_segundo_plano(self._decodificar, path, cache_path, assinatura)
+    
+    def _preparar_em_segundo_plano(self, alvo, *args):
+        """Roda a preparação da música em uma thread; samples ficam indisponíveis até o fim."""
+        self.music_loaded = False
+        self._thread_preparo = threading.Thread(target=alvo, args=args, name="sampler-prep", daemon=True)
+        self._thread_preparo.start()
+    
+    def _musica_pronta(self):
+        """Executa a extração em lote pedida enquanto a música era preparada."""
+        if self._extracao_pendente is not None:
+            self.extrair_samples(*self._extracao_pendente)
+            self._extracao_pendente = None
+    
+    def _decodificar(self, path: str, cache_path: str, assinatura: str):
+        """Decodifica com o mixer, grava o WAV em cache e o carrega (thread de fundo)."""
+        try:
+            som = pygame.mixer.Sound(path)
+            pcm = pygame.sndarray.samples(som)  # View do buffer decodificado
+            if pcm.dtype != np.int16:
+                pcm = para_int16_estereo(pcm if pcm.ndim == 2 else pcm[:, None])
+            escrever_wav(cache_path, pcm, self._dispositivo.frequency, assinatura)
+            del pcm, som
+            self._load_wav(cache_path)
+        except (pygame.error, OSError, ValueError) as e:
+            print(f"ChordSampler: Não foi possível decodificar {path}: {e}")
+            return
+        self._musica_pronta()
+    
+    def _carregar_reamostrado(self, wav, frequencia: int):
+        """
+        Usa a versão do WAV na taxa do mixer em cache ou reamostra em segundo plano.
+        
+        Sem isso a música tocaria com altura e velocidade erradas
+        (make_sound não converte a taxa).
+        """
+        assinatura = f"{source_signature(wav.path, RESAMPLE_CACHE_VERSION)}|{frequencia}"
+        cache_path = cache_path_for(wav.path, f".{frequencia}{DECODE_CACHE_SUFFIX}", "audio")
+        
+        if os.path.exists(cache_path):
+            try:
+                cache = abrir_wav(cache_path)
+                if cache.assinatura == assinatura and cache.sample_rate == frequencia:
+                    self._load_wav(cache_path)
+                    return
+            except (OSError, ValueError) as e:
+                print(f"ChordSampler: Cache de PCM inválido ({e})")
+        
+        print(f"ChordSampler: Reamostrando {wav.sample_rate}Hz -> {frequencia}Hz em segundo plano...")
+        self._preparar_em_segundo_plano(self._reamostrar, wav, cache_path, assinatura, frequencia)
+    
+    def _reamostrar(self, wav, cache_path: str, assinatura: str, frequencia: int):
+        """Reamostra o WAV em blocos direto para o arquivo em cache (thread de fundo)."""
+        reamostrador = ReamostradorPolifasico(wav.sample_rate, frequencia)
+        converter = None
+        if wav.frames.dtype == np.uint8:
+            converter = lambda trecho: (trecho.astype(np.float32) - 128) * 256
+        try:
+            blocos = (para_int16(bloco) for bloco in reamostrador.processar(wav.frames, converter))
+            escrever_wav_em_blocos(
+                cache_path, blocos, reamostrador.tamanho_saida(len(wav)),
+                wav.num_channels, frequencia, assinatura,
+            )
+            self._load_wav(cache_path)
+        except (OSError, ValueError) as e:
+            print(f"ChordSampler: Não foi possível reamostrar {wav.path}: {e}")
+            return
+        self._musica_pronta()
     
     def _load_wav(self, wav_path: str):
-        """Carrega arquivo WAV na memória."""
+        """Mapeia o WAV em memória (sem ler o arquivo inteiro)."""
         print(f"ChordSampler: Carregando WAV: {wav_path}")
         
-        with wave.open(wav_path, 'rb') as wf:
-            self._sample_rate = wf.getframerate()
-            self._num_channels = wf.getnchannels()
-            n_frames = wf.getnframes()
-            
-            # Ler todos os frames
-            raw_data = wf.readframes(n_frames)
-            
-            # Converter para numpy array
-            if wf.getsampwidth() == 2:  # 16-bit
-                self._audio_data = np.frombuffer(raw_data, dtype=np.int16)
-            elif wf.getsampwidth() == 1:  # 8-bit
-                self._audio_data = np.frombuffer(raw_data, dtype=np.uint8).astype(np.int16) * 256 - 32768
-            else:
-                raise ValueError(f"Formato não suportado: {wf.getsampwidth()} bytes por sample")
-            
-            # Reshape para stereo se necessário
-            if self._num_channels == 2:
-                self._audio_data = self._audio_data.reshape(-1, 2)
-            elif self._num_channels == 1:
-                # Converter mono para stereo
-                self._audio_data = np.column_stack((self._audio_data, self._audio_data))
-        
-        duration = len(self._audio_data) / self._sample_rate
-        print(f"ChordSampler: WAV carregado! {duration:.1f}s, {self._sample_rate}Hz, {self._num_channels}ch")
+        wav = abrir_wav(wav_path)
+        frequencia = self._dispositivo.frequency
+        if wav.sample_rate != frequencia:
+            self._carregar_reamostrado(wav, frequencia)
+            return
+        
+        self._sample_rate = wav.sample_rate
+        self._num_channels = wav.num_channels
+        # View sem cópia; conversão de formato/canais só no trecho extraído
+        self._audio_data = wav.frames
+        
+        print(f"ChordSampler: WAV carregado! {wav.duracao:.1f}s, {self._sample_rate}Hz, {self._num_channels}ch")
         self.music_loaded = True
     
+    def audio_mapeado(self):
+        """Frames da música na taxa do mixer (np.memmap) ou None se ainda não estão prontos."""
+        return self._audio_data if self.music_loaded else None
+    
+    def _intervalo(self, start_time: float, duration: float):
+        """Intervalo [início, fim) em frames, limitado ao tamanho do áudio."""
+        start_frame = max(0, int(start_time * self._sample_rate))
+        end_frame = min(int((start_time + duration) * self._sample_rate), len(self._audio_data))
+        return start_frame, end_frame
+    
     def _extract_sample(self, start_time: float, duration: float) -> pygame.mixer.Sound:
         """
         Extrai um sample do áudio carregado.
@@ -115,37 +228,100 @@ class ChordSampler:
         if self._audio_data is None:
             return None
         
-        # Calcular índices
-        start_frame = int(start_time * self._sample_rate)
-        end_frame = int((start_time + duration) * self._sample_rate)
-        
-        # Garantir que não ultrapasse o final
-        end_frame = min(end_frame, len(self._audio_data))
-        start_frame = max(0, start_frame)
-        
+        start_frame, end_frame = self._intervalo(start_time, duration)
         if start_frame >= end_frame:
             return None
         
-        # Extrair segmento
-        sample_data = self._audio_data[start_frame:end_frame].copy()
+        # Extrair segmento (lê só estas páginas do arquivo) em int16 estéreo
+        sample_data = para_int16_estereo(self._audio_data[start_frame:end_frame])
         
-        # Aplicar fade in/out para evitar cliques
+        # Aplicar fade in/out para evitar cliques (os dois canais de uma vez, no lugar)
         fade_samples = min(int(0.02 * self._sample_rate), len(sample_data) // 4)  # 20ms fade
         if fade_samples > 0:
-            # Fade in
-            fade_in = np.linspace(0, 1, fade_samples)
-            sample_data[:fade_samples, 0] = (sample_data[:fade_samples, 0] * fade_in).astype(np.int16)
-            sample_data[:fade_samples, 1] = (sample_data[:fade_samples, 1] * fade_in).astype(np.int16)
-            
-            # Fade out
-            fade_out = np.linspace(1, 0, fade_samples)
-            sample_data[-fade_samples:, 0] = (sample_data[-fade_samples:, 0] * fade_out).astype(np.int16)
-            sample_data[-fade_samples:, 1] = (sample_data[-fade_samples:, 1] * fade_out).astype(np.int16)
+            fade_in, fade_out = self._curvas_fade(fade_samples)
+            np.multiply(sample_data[:fade_samples], fade_in, out=sample_data[:fade_samples], casting="unsafe")
+            np.multiply(sample_data[-fade_samples:], fade_out, out=sample_data[-fade_samples:], casting="unsafe")
         
-        # Criar Sound object
-        sound = pygame.sndarray.make_sound(sample_data)
+        # Criar Sound direto do buffer contíguo (sem a cópia extra do sndarray)
+        if (self._dispositivo.format, self._dispositivo.channels) == (-16, 2):
+            return pygame.mixer.Sound(buffer=sample_data)
+        return pygame.sndarray.make_sound(sample_data)
+    
+    def _curvas_fade(self, n: int):
+        """Curvas de fade in/out (n, 1) em float32, calculadas uma vez por tamanho."""
+        curvas = self._fades.get(n)
+        if curvas is None:
+            fade_in = np.linspace(0, 1, n, dtype=np.float32)[:, None]
+            curvas = (fade_in, np.ascontiguousarray(fade_in[::-1]))
+            self._fades[n] = curvas
+        return curvas
+    
+    def _obter_sample(self, start_time: float, duration: float):
+        """Retorna o sample do cache, extraindo na primeira vez."""
+        cache_key = ("sample",) + self._intervalo(start_time, duration)
+        sound = self._sample_cache.get(cache_key)
+        if sound is None:
+            sound = self._extract_sample(start_time, duration)
+            if sound:
+                self._sample_cache.put(cache_key, sound)
         return sound
     
+    def preparar_sample(self, start_time: float, duration: float = None):
+        """
+        Extrai e guarda no cache um sample sem tocá-lo.
+        
+        Pode ser chamado de uma thread de fundo para que tocar_sample
+        não precise recortar o áudio na hora.
+        """
+        if not self.music_loaded or self._audio_data is None:
+            return
+        self._obter_sample(start_time, duration if duration is not None else self.sample_duration)
+    
+    def extrair_samples(self, start_times, duration: float = None):
+        """
+        Extrai em segundo plano os samples de todos os acordes da música.
+        
+        Percorre o arquivo em ordem (leitura sequencial do mapeamento) e
+        para quando o cache de sons atinge o orçamento de memória, para não
+        remover os samples dos primeiros acordes.
+        
+        Args:
+            start_times: Inícios dos acordes em segundos
+            duration: Duração dos samples (usa sample_duration se None)
+        
+        Returns:
+            threading.Thread da extração (ou None se não há música)
+        """
+        if not self.music_loaded or self._audio_data is None:
+            # Música ainda sendo preparada (decodificação ou reamostragem): extrair quando terminar
+            if self._thread_preparo is not None and self._thread_preparo.is_alive():
+                self._extracao_pendente = (start_times, duration)
+            return None
+        if duration is None:
+            duration = self.sample_duration
+        
+        inicios = sorted(set(start_times))
+        self._thread_extracao = threading.Thread(
+            target=self._extrair_todos, args=(inicios, duration), name="sampler", daemon=True
+        )
+        self._thread_extracao.start()
+        return self._thread_extracao
+    
+    def _extrair_todos(self, inicios, duration: float):
+        """Loop da extração em lote (roda na thread de fundo)."""
+        bytes_sample = int(duration * self._sample_rate) * 4  # int16 estéreo
+        cache = self._sample_cache
+        for inicio in inicios:
+            if cache.bytes_usados + bytes_sample > cache.max_bytes:
+                print("ChordSampler: orçamento de memória atingido, extração em lote interrompida")
+                return
+            cache_key = ("sample",) + self._intervalo(inicio, duration)
+            if cache_key in cache:
+                continue
+            sound = self._extract_sample(inicio, duration)
+            if sound:
+                cache.put(cache_key, sound)
+    
     def tocar_sample(self, start_time: float, duration: float = None):
         """
         Toca um sample da música a partir do timestamp especificado.
@@ -163,22 +339,15 @@ class ChordSampler:
         # Parar sample anterior
         self.parar_sample()
         
-        # Verificar cache
-        cache_key = f"{start_time:.2f}_{duration:.2f}"
-        if cache_key not in self._sample_cache:
-            sound = self._extract_sample(start_time, duration)
-            if sound:
-                self._sample_cache[cache_key] = sound
-        
-        if cache_key in self._sample_cache:
-            self._current_sound = self._sample_cache[cache_key]
-            self._current_sound.set_volume(0.8)
-            self._sample_channel.play(self._current_sound)
-            self.is_playing = True
+        sound = self._obter_sample(start_time, duration)
+        if sound:
+            self._current_sound = sound
+            self._sample_channel = self._vozes.tocar(GRUPO_SAMPLES, sound, volume=0.8)
+            self.is_playing = self._sample_channel is not None
     
     def parar_sample(self):
         """Para o sample atual se estiver tocando."""
-        if self._sample_channel:
+        if self._sample_channel and self._sample_channel.get_sound() is self._current_sound:
             self._sample_channel.stop()
         self.is_playing = False
     
@@ -193,5 +362,5 @@ class ChordSampler:
     def is_sample_playing(self) -> bool:
         """Retorna True se um sample está tocando."""
         if self._sample_channel:
-            return self._sample_channel.get_busy()
+            return self._sample_channel.get_busy() and self._sample_channel.get_sound() is self._current_sound
         return False
@@ -0,0 +1,78 @@
+"""
+Configuração central do dispositivo de áudio.
+
+Abre o mixer uma única vez, antes de pygame.init(), para que o buffer
+pedido realmente valha (pre_init depois de pygame.init não tem efeito).
+Todas as classes de áudio leem a taxa e o formato efetivos daqui.
+"""
+
+import pygame
+
+from src.utils.config import AUDIO_FREQUENCY, AUDIO_BUFFER, AUDIO_NUM_CHANNELS
+
+
+class AudioDevice:
+    """Configuração efetiva do mixer aberto."""
+
+    __slots__ = ("frequency", "format", "channels", "buffer", "num_channels")
+
+    def __init__(self, frequency, format, channels, buffer, num_channels):
+        self.frequency = frequency        # Taxa real (o driver pode não aceitar a pedida)
+        self.format = format              # Ex: -16 (int16 com sinal)
+        self.channels = channels          # Canais de saída (2 = estéreo)
+        self.buffer = buffer              # Buffer pedido em amostras (pygame não informa o real)
+        self.num_channels = num_channels  # Canais de mixagem (vozes simultâneas)
+
+    @property
+    def latencia_buffer(self) -> float:
+        """Latência de um buffer em segundos."""
+        return self.buffer / self.frequency
+
+    def __str__(self):
+        return (
+            f"{self.frequency}Hz, formato {self.format}, {self.channels}ch, "
+            f"buffer {self.buffer} amostras ({self.latencia_buffer * 1000:.1f} ms), "
+            f"{self.num_channels} canais de mixagem"
+        )
+
+
+_dispositivo = None
+
+
+def iniciar_audio(frequency: int = AUDIO_FREQUENCY, buffer: int = AUDIO_BUFFER,
+                  num_channels: int = AUDIO_NUM_CHANNELS) -> AudioDevice:
+    """
+    Abre o mixer (int16 estéreo) e informa a configuração obtida.
+
+    Deve rodar antes de pygame.init(); chamadas seguintes retornam o
+    dispositivo já aberto.
+
+    Args:
+        frequency: Taxa de amostragem pedida
+        buffer: Tamanho do buffer em amostras (menor = menos latência)
+        num_channels: Canais de mixagem
+    """
+    global _dispositivo
+    if _dispositivo is not None:
+        return _dispositivo
+
+    if pygame.mixer.get_init() is not None:
+        # Alguém abriu o mixer antes: o buffer pedido aqui não vale mais
+        print("Áudio: mixer já estava aberto, buffer configurado não aplicado")
+    else:
+        pygame.mixer.pre_init(frequency, -16, 2, buffer)
+        pygame.mixer.init()
+
+    freq_real, formato, canais = pygame.mixer.get_init()
+    pygame.mixer.set_num_channels(num_channels)
+    _dispositivo = AudioDevice(freq_real, formato, canais, buffer, pygame.mixer.get_num_channels())
+
+    if freq_real != frequency:
+        print(f"Áudio: taxa pedida {frequency}Hz, obtida {freq_real}Hz")
+    print(f"Áudio: {_dispositivo}")
+    return _dispositivo
+
+
+def obter_audio() -> AudioDevice:
+    """Dispositivo de áudio atual (abre com a configuração padrão se preciso)."""
+    return _dispositivo if _dispositivo is not None else iniciar_audio()
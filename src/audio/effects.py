@@ -0,0 +1,235 @@
+"""
+Efeitos para o som sintetizado: reverb por convolução e chorus.
+
+O reverb convolui a onda com respostas ao impulso (IR) geradas
+proceduralmente (ruído com decaimento exponencial e reflexões iniciais)
+por overlap-add no domínio da frequência: a onda é dividida em blocos,
+todos transformados de uma vez com rfft e multiplicados pelo espectro da
+IR. O chorus mistura uma cópia atrasada por um atraso modulado (LFO).
+
+EffectsBus.aplicar() processa um render inteiro (cacheado depois);
+EffectsBus.criar_processador() cria o estado por voz para o streaming.
+"""
+
+import numpy as np
+
+
+# IRs procedurais: (duração em s, tempo de decaimento RT60 em s, brilho 0..1)
+TIPOS_REVERB = {
+    "sala": (0.8, 0.6, 0.5),
+    "salao": (2.0, 1.8, 0.35),
+    "placa": (1.2, 1.0, 0.8),
+}
+
+
+def gerar_ir(tipo: str, sample_rate: int, semente: int = 7) -> np.ndarray:
+    """
+    Gera uma resposta ao impulso mono (float32, energia unitária).
+
+    Ruído com envelope exponencial (-60 dB no RT60), suavizado por um
+    passa-baixas que escurece a cauda, mais algumas reflexões iniciais.
+    A semente fixa torna a IR (e o cache dos sons) reproduzível.
+    """
+    duracao, rt60, brilho = TIPOS_REVERB[tipo]
+    n = int(duracao * sample_rate)
+    rng = np.random.default_rng(semente)
+    t = np.arange(n, dtype=np.float32) / sample_rate
+
+    ir = rng.standard_normal(n).astype(np.float32) * np.exp(-6.9 * t / rt60)
+
+    # Passa-baixas por média móvel (via cumsum): menos brilho = janela maior
+    janela = max(1, int((1.0 - brilho) * 24) + 1)
+    if janela > 1:
+        acumulado = np.cumsum(np.concatenate(([0.0], ir)), dtype=np.float64)
+        ir[janela - 1:] = ((acumulado[janela:] - acumulado[:-janela]) / janela).astype(np.float32)
+
+    # Reflexões iniciais nos primeiros 40 ms
+    atrasos = rng.integers(int(0.005 * sample_rate), int(0.04 * sample_rate), size=6)
+    ir[atrasos] += rng.uniform(0.3, 0.7, size=6).astype(np.float32) * np.sign(rng.standard_normal(6)).astype(np.float32)
+
+    ir[0] = 0.0  # O sinal seco é misturado separadamente
+    return ir / np.sqrt(np.sum(ir * ir))
+
+
+def _proxima_potencia_2(n: int) -> int:
+    return 1 << max(0, int(n - 1).bit_length())
+
+
+class ReverbConvolucao:
+    """Convolução por overlap-add com o espectro da IR pré-calculado."""
+
+    def __init__(self, ir: np.ndarray, bloco: int):
+        """
+        Args:
+            ir: Resposta ao impulso (float32)
+            bloco: Amostras de entrada por bloco
+        """
+        self.ir = ir
+        self.bloco = bloco
+        self.n_fft = _proxima_potencia_2(bloco + len(ir) - 1)
+        self.espectro_ir = np.fft.rfft(ir, self.n_fft).astype(np.complex64)
+
+    def convoluir(self, onda: np.ndarray) -> np.ndarray:
+        """Convolução completa (len(onda) + len(ir) - 1), todos os blocos de uma vez."""
+        n_blocos = -(-len(onda) // self.bloco)
+        blocos = np.zeros((n_blocos, self.bloco), dtype=np.float32)
+        blocos.ravel()[:len(onda)] = onda
+
+        # Um rfft/irfft vetorizado para todos os blocos
+        saidas = np.fft.irfft(np.fft.rfft(blocos, self.n_fft, axis=1) * self.espectro_ir, self.n_fft, axis=1)
+
+        # Overlap-add: a saída do bloco k começa em k * bloco. Cada saída é
+        # cortada em fatias de bloco amostras; a fatia j de todos os blocos
+        # é somada de uma vez em y[j * bloco:], vista como (n_blocos, bloco).
+        fatias = -(-self.n_fft // self.bloco)
+        if fatias * self.bloco > self.n_fft:
+            saidas = np.pad(saidas, ((0, 0), (0, fatias * self.bloco - self.n_fft)))
+        saidas = saidas.reshape(n_blocos, fatias, self.bloco)
+        y = np.zeros((n_blocos + fatias - 1) * self.bloco, dtype=np.float32)
+        for j in range(fatias):
+            inicio = j * self.bloco
+            y[inicio:inicio + n_blocos * self.bloco].reshape(n_blocos, self.bloco)[:] += saidas[:, j]
+        return y[:len(onda) + len(self.ir) - 1]
+
+
+class Chorus:
+    """Cópia atrasada com atraso modulado por um LFO senoidal."""
+
+    def __init__(self, sample_rate: int, taxa_hz: float = 0.8, atraso_ms: float = 12.0,
+                 profundidade_ms: float = 3.0):
+        self.sample_rate = sample_rate
+        self.taxa = taxa_hz
+        self.atraso = atraso_ms * sample_rate / 1000.0
+        self.profundidade = profundidade_ms * sample_rate / 1000.0
+        self.historico = int(np.ceil(self.atraso + self.profundidade)) + 2
+
+    def atrasado(self, onda: np.ndarray, anterior: np.ndarray, inicio: int) -> np.ndarray:
+        """
+        Sinal atrasado para uma onda (ou bloco).
+
+        Args:
+            onda: Amostras atuais
+            anterior: Últimas self.historico amostras antes de onda (zeros no início)
+            inicio: Índice absoluto da primeira amostra (fase do LFO contínua entre blocos)
+        """
+        x = np.concatenate((anterior, onda))
+        n = np.arange(len(onda), dtype=np.float64) + inicio
+        atraso = self.atraso + self.profundidade * np.sin(2 * np.pi * self.taxa * n / self.sample_rate)
+        posicoes = np.arange(len(onda)) + len(anterior) - atraso
+        return np.interp(posicoes, np.arange(len(x)), x).astype(np.float32)
+
+
+class ProcessadorEfeitos:
+    """Estado dos efeitos de uma voz em streaming (cauda do reverb e histórico do chorus)."""
+
+    def __init__(self, bus):
+        self.bus = bus
+        self._cauda = np.zeros(0, dtype=np.float32)
+        self._historico = np.zeros(bus.chorus.historico, dtype=np.float32)
+        self._posicao = 0
+        # Amostras que os efeitos ainda produzem depois da última entrada com som
+        self._duracao_cauda = (bus.chorus.historico if bus.chorus_mix > 0.0 else 0) + (
+            len(bus.reverb.ir) - 1 if bus.reverb is not None else 0)
+        self._restante = 0
+
+    def processar(self, bloco: np.ndarray) -> np.ndarray:
+        """Aplica os efeitos a um bloco, continuando o estado do bloco anterior."""
+        seco = self.bus._chorus(bloco, self._historico, self._posicao)
+        self._historico = np.concatenate((self._historico, bloco))[-len(self._historico):]
+        self._posicao += len(bloco)
+        if np.any(bloco):
+            self._restante = self._duracao_cauda
+        else:
+            self._restante = max(0, self._restante - len(bloco))
+
+        if self.bus.reverb is None:
+            return seco
+        molhado = self.bus.reverb.convoluir(seco)
+        molhado[:len(self._cauda)] += self._cauda
+        self._cauda = molhado[len(bloco):]
+        return seco + self.bus.reverb_mix * molhado[:len(bloco)]
+
+    @property
+    def cauda_restante(self) -> int:
+        """Amostras de chorus/reverb que ainda vão soar após o último bloco."""
+        return self._restante
+
+
+class EffectsBus:
+    """Cadeia chorus -> reverb aplicada ao som sintetizado."""
+
+    def __init__(self, sample_rate: int, reverb_tipo: str = "sala", reverb_mix: float = 0.25,
+                 chorus_mix: float = 0.0, bloco: int = None):
+        """
+        Args:
+            sample_rate: Taxa de amostragem
+            reverb_tipo: Tipo de IR (TIPOS_REVERB) ou None para desligar o reverb
+            reverb_mix: Nível do sinal com reverb somado ao seco
+            chorus_mix: Nível da cópia do chorus (0 desliga)
+            bloco: Amostras por bloco do overlap-add em renders completos
+                (padrão: o maior bloco cuja FFT tem o tamanho mínimo para a IR)
+        """
+        self.sample_rate = sample_rate
+        self.reverb_tipo = reverb_tipo
+        self.reverb_mix = reverb_mix
+        self.chorus_mix = chorus_mix
+        self.chorus = Chorus(sample_rate)
+        self.reverb = None
+        if reverb_tipo:
+            ir = gerar_ir(reverb_tipo, sample_rate)
+            if bloco is None:
+                # Poucas FFTs grandes: um acorde curto cabe em um único bloco
+                n_fft = _proxima_potencia_2(len(ir))
+                if n_fft - len(ir) + 1 < len(ir):
+                    n_fft *= 2
+                bloco = n_fft - len(ir) + 1
+            self.reverb = ReverbConvolucao(ir, bloco)
+        self._reverb_streaming = {}
+
+    @property
+    def assinatura(self) -> str:
+        """Identifica a configuração (entra na chave dos caches de som)."""
+        return f"fx-{self.reverb_tipo}-{self.reverb_mix}-{self.chorus_mix}"
+
+    @property
+    def cauda(self) -> int:
+        """Amostras acrescentadas ao fim de um render pelo reverb."""
+        return len(self.reverb.ir) - 1 if self.reverb is not None else 0
+
+    def _chorus(self, onda, anterior, inicio):
+        if self.chorus_mix <= 0.0:
+            return onda
+        return onda + self.chorus_mix * self.chorus.atrasado(onda, anterior, inicio)
+
+    def aplicar(self, onda: np.ndarray) -> np.ndarray:
+        """Aplica os efeitos a um render completo (a saída inclui as caudas do chorus e do reverb)."""
+        if self.chorus_mix > 0.0:
+            # Espaço para a cópia atrasada soar depois do fim da onda
+            onda = np.concatenate((onda, np.zeros(self.chorus.historico, dtype=np.float32)))
+        seco = self._chorus(onda, np.zeros(self.chorus.historico, dtype=np.float32), 0)
+        if self.reverb is None:
+            return seco
+        saida = self.reverb_mix * self.reverb.convoluir(seco)
+        saida[:len(seco)] += seco
+        return saida
+
+    def criar_processador(self, bloco: int) -> ProcessadorEfeitos:
+        """Estado de efeitos para uma voz em streaming com blocos de `bloco` amostras."""
+        processador = ProcessadorEfeitos(self)
+        if self.reverb is not None:
+            # Reverb com FFT dimensionada para o bloco do streaming (compartilhada)
+            if bloco not in self._reverb_streaming:
+                self._reverb_streaming[bloco] = ReverbConvolucao(self.reverb.ir, bloco)
+            processador.bus = _BusStreaming(self, self._reverb_streaming[bloco])
+        return processador
+
+
+class _BusStreaming:
+    """Visão do EffectsBus com o reverb dimensionado para blocos de streaming."""
+
+    def __init__(self, bus: EffectsBus, reverb: ReverbConvolucao):
+        self.chorus = bus.chorus
+        self.reverb = reverb
+        self.reverb_mix = bus.reverb_mix
+        self.chorus_mix = bus.chorus_mix
+        self._chorus = bus._chorus
@@ -0,0 +1,54 @@
+"""
+Preparação antecipada dos sons tocados durante o jogo.
+
+Mantém prontos, em uma thread de fundo, o acorde curto sintetizado e o
+sample real dos próximos acordes do mapa. Ao aceitar um gesto o jogo só
+busca o som no cache, sem sintetizar nem recortar áudio no frame.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.audio.synthesizer import INCLINACAO_CAMADAS
+
+
+class LookaheadPreparer:
+    """Prepara os sons dos próximos N acordes em segundo plano."""
+
+    def __init__(self, synth, sampler, chart, janela: int = 4, duracao_synth: float = 0.3):
+        """
+        Args:
+            synth: Sintetizador (acordes curtos de feedback)
+            sampler: ChordSampler (samples reais da música)
+            chart: Mapa de acordes compilado (Chart)
+            janela: Quantos acordes a partir do atual manter prontos
+            duracao_synth: Duração do acorde curto tocado pelo jogo
+        """
+        self.synth = synth
+        self.sampler = sampler
+        self.chart = chart
+        self.janela = janela
+        self.duracao_synth = duracao_synth
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lookahead")
+
+    def preparar(self, index: int):
+        """Agenda a preparação dos acordes [index, index + janela)."""
+        fim = min(index + self.janela, len(self.chart))
+        for i in range(max(0, index), fim):
+            try:
+                self._executor.submit(self._preparar_acorde, i)
+            except RuntimeError:  # Pool já encerrado
+                return
+
+    def _preparar_acorde(self, index: int):
+        """Gera (ou encontra no cache) os sons de um acorde. Roda no worker."""
+        evento = self.chart[index]
+        # Acorde curto no timbre e tom atuais, em todas as camadas de brilho (consulta ao cache se já existir)
+        for camada in range(len(INCLINACAO_CAMADAS)):
+            self.synth.acorde_para_tocar(evento.chord_majmin, self.duracao_synth, camada=camada)
+        # Sempre conferir o cache: o sample pode ter sido removido pelo LRU
+        if self.sampler.music_loaded:
+            self.sampler.preparar_sample(evento.start)
+
+    def encerrar(self):
+        """Cancela as preparações pendentes e encerra o worker."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
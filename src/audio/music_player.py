@@ -0,0 +1,278 @@
+"""
+Reprodução da música com relógio em amostras.
+
+``pygame.mixer.music.get_pos()`` tem resolução de milissegundos, depende
+do buffer e continua contando desde o play() mesmo com pausas. Aqui a
+música (o WAV mapeado em memória na taxa do mixer) é tocada por nós:
+blocos int16 enfileirados com Channel.queue em um canal reservado. Como
+sabemos exatamente qual frame cada bloco começa, o relógio é a posição
+em amostras do nosso próprio stream, extrapolada pelo perf_counter entre
+blocos, corrigida a cada troca de bloco e atrasada pela latência de
+saída do mixer.
+
+Com ``MUSIC_IN_MEMORY``, o PCM é copiado uma vez para a memória (int16
+estéreo, em segundo plano): os blocos viram fatias sem conversão e voltar
+para qualquer acorde, repetir após um FAIL ou recomeçar a música não
+lê nem decodifica o arquivo de novo.
+
+Enquanto o PCM não está disponível (ex: MP3 ainda sendo decodificado),
+a reprodução cai para pygame.mixer.music com o relógio antigo.
+"""
+
+import threading
+import time
+
+import pygame
+
+from src.audio.device import obter_audio
+from src.audio.voices import obter_vozes, GRUPO_MUSICA, PRIORIDADE_ALTA
+from src.audio.wav_io import para_int16_estereo
+from src.utils.config import MUSIC_IN_MEMORY
+
+BLOCO_MUSICA = 2048      # Frames por bloco enfileirado (~46 ms a 44.1 kHz)
+LATENCIA_BUFFERS = 2     # Buffers do mixer entre a mixagem e a saída
+
+
+class MusicPlayer:
+    """Toca a música em blocos e informa a posição audível em segundos."""
+
+    def __init__(self, bloco: int = BLOCO_MUSICA):
+        """
+        Args:
+            bloco: Frames por bloco enfileirado no canal
+        """
+        dispositivo = obter_audio()
+        self.sample_rate = dispositivo.frequency
+        self.latencia = LATENCIA_BUFFERS * dispositivo.latencia_buffer
+        self._buffer_direto = (dispositivo.format, dispositivo.channels) == (-16, 2)
+        self.bloco = bloco
+        self.fonte_pcm = None    # Função que retorna os frames mapeados (ou None)
+        self.carregada = False
+        self.pausada = True
+        self.volume = 1.0
+
+        self._canal = obter_vozes().reservar(GRUPO_MUSICA, PRIORIDADE_ALTA)
+        self._pcm = None         # Frames (n, canais) na taxa do mixer
+        self._em_memoria = False # _pcm já é int16 estéreo em memória
+        self._preparado = None   # Primeiro bloco após posicionar() (retomar instantâneo)
+        self._usando_pcm = False # Reprodução atual pelo canal (False = mixer.music)
+        self._offset = 0.0       # mixer.music: posição (s) do último play()
+
+        # Relógio: frame de mixagem no instante _t_base (perf_counter)
+        self._frame_base = 0
+        self._t_base = 0.0
+        self._proximo = 0        # Próximo frame a enfileirar
+        self._blocos = ()        # (frame inicial, Sound) tocando e na fila
+        self._ultima_conferencia = 0.0
+
+        self._lock = threading.Lock()
+        self._acordar = threading.Event()
+        self._ativo = True
+        self._thread = threading.Thread(target=self._loop, name="music-player", daemon=True)
+        self._thread.start()
+
+    def carregar(self, path: str, volume: float):
+        """Carrega a música no mixer.music (usado até o PCM ficar disponível)."""
+        pygame.mixer.music.load(path)
+        self.set_volume(volume)
+        self.carregada = True
+
+    def set_volume(self, volume: float):
+        """Volume da música (0.0 a 1.0) nos dois modos de reprodução."""
+        self.volume = volume
+        pygame.mixer.music.set_volume(volume)
+        if self._canal is not None:
+            self._canal.set_volume(volume)
+
+    # --- Controle ---
+
+    def posicionar(self, tempo: float):
+        """Deixa a música pausada em uma posição (segundos), pronta para retomar()."""
+        pcm = self._obter_pcm()
+        with self._lock:
+            self._parar_canal()
+            if pcm is not None:
+                if not self._usando_pcm and self.carregada:
+                    pygame.mixer.music.stop()  # Troca do mixer.music para o PCM
+                self._usando_pcm = True
+                self._frame_base = self._proximo = min(max(0, int(round(tempo * self.sample_rate))), len(pcm))
+                self._preparado = self._proximo_som()
+            else:
+                self._usando_pcm = False
+                self._posicionar_mixer_music(tempo)
+            self.pausada = True
+
+    def pausar(self):
+        """Pausa na posição atual."""
+        with self._lock:
+            if self.pausada:
+                return
+            if self._usando_pcm:
+                # Guardar a posição audível (a mesma que tempo() informava tocando)
+                audivel = self._frame_mixagem(time.perf_counter()) - self.latencia * self.sample_rate
+                self._frame_base = max(0, int(round(audivel)))
+                self._canal.pause()
+            else:
+                pygame.mixer.music.pause()
+            self.pausada = True
+
+    def retomar(self):
+        """Continua a reprodução de onde parou (ou da posição de posicionar())."""
+        with self._lock:
+            if not self.pausada:
+                return
+            self.pausada = False
+            if not self._usando_pcm:
+                pygame.mixer.music.unpause()
+                return
+            agora = time.perf_counter()
+            if self._blocos:
+                self._canal.unpause()
+                # _frame_base é a posição audível: a mixagem está uma latência à frente
+                self._t_base = agora - self.latencia
+            else:
+                self._alimentar()
+                self._t_base = agora
+            self._ultima_conferencia = agora
+        self._acordar.set()
+
+    def parar(self):
+        """Interrompe a música."""
+        with self._lock:
+            self._parar_canal()
+            if not self._usando_pcm:
+                pygame.mixer.music.stop()
+            self.pausada = True
+
+    def encerrar(self):
+        """Para a música e a thread de alimentação."""
+        self.parar()
+        self._ativo = False
+        self._acordar.set()
+
+    # --- Relógio ---
+
+    def tempo(self) -> float:
+        """Posição audível da música em segundos."""
+        if not self._usando_pcm:
+            # get_pos conta a partir do último play(); somar a posição inicial
+            return self._offset + max(0, pygame.mixer.music.get_pos()) / 1000.0
+        with self._lock:
+            if self.pausada:
+                return self._frame_base / self.sample_rate
+            # O que foi mixado agora só sai após a latência do mixer
+            decorrido = max(0.0, time.perf_counter() - self._t_base - self.latencia)
+            frame = min(self._frame_base + decorrido * self.sample_rate, self._proximo)
+            return frame / self.sample_rate
+
+    def ocupado(self) -> bool:
+        """True enquanto a música toca (equivalente a mixer.music.get_busy())."""
+        if not self._usando_pcm:
+            return pygame.mixer.music.get_busy()
+        return not self.pausada and (bool(self._blocos) or self._proximo < len(self._pcm))
+
+    # --- Interno ---
+
+    def _obter_pcm(self):
+        """Frames da música na taxa do mixer, quando a fonte já os tiver prontos."""
+        if self._pcm is None and self.fonte_pcm is not None and self._canal is not None:
+            self._pcm = self.fonte_pcm()
+            if self._pcm is not None and MUSIC_IN_MEMORY:
+                threading.Thread(
+                    target=self._carregar_em_memoria, args=(self._pcm,), name="music-load", daemon=True
+                ).start()
+        return self._pcm
+
+    def _carregar_em_memoria(self, frames):
+        """Copia a música mapeada para a memória já em int16 estéreo (thread de fundo)."""
+        try:
+            pcm = para_int16_estereo(frames)
+        except (OSError, MemoryError) as e:
+            print(f"MusicPlayer: música continua lida do disco ({e})")
+            return
+        with self._lock:
+            # Mesmos índices de frame: a troca não altera a posição
+            self._pcm = pcm
+            self._em_memoria = True
+        print(f"MusicPlayer: música em memória ({pcm.nbytes / 1024 / 1024:.1f} MB)")
+
+    def _posicionar_mixer_music(self, tempo: float):
+        """Fallback: play(start) + pause no mixer.music."""
+        try:
+            pygame.mixer.music.play(start=tempo)
+            self._offset = tempo
+        except pygame.error:
+            # Formato sem suporte a seek: recomeça do início
+            pygame.mixer.music.play()
+            self._offset = 0.0
+        pygame.mixer.music.pause()
+
+    def _parar_canal(self):
+        """Interrompe o canal e descarta os blocos enfileirados."""
+        if self._canal is not None and self._blocos:
+            self._canal.stop()
+        self._blocos = ()
+        self._preparado = None
+
+    def _frame_mixagem(self, agora: float) -> int:
+        """Frame sendo mixado agora (sem a latência de saída)."""
+        frame = self._frame_base + (agora - self._t_base) * self.sample_rate
+        return int(min(frame, self._proximo))
+
+    def _proximo_som(self):
+        """Próximo bloco como pygame.Sound (None no fim da música)."""
+        inicio = self._proximo
+        fim = min(inicio + self.bloco, len(self._pcm))
+        if inicio >= fim:
+            return None
+        if self._em_memoria:
+            pcm = self._pcm[inicio:fim]  # Fatia contígua, sem conversão
+        else:
+            pcm = para_int16_estereo(self._pcm[inicio:fim])
+        self._proximo = fim
+        if self._buffer_direto:
+            return inicio, pygame.mixer.Sound(buffer=pcm)
+        return inicio, pygame.sndarray.make_sound(pcm)
+
+    def _alimentar(self):
+        """Mantém um bloco tocando e outro na fila; corrige o relógio a cada troca."""
+        agora = time.perf_counter()
+        if not self._canal.get_busy():
+            # Primeiro bloco (ou a fila esvaziou)
+            bloco, self._preparado = self._preparado or self._proximo_som(), None
+            if bloco is None:
+                self._blocos = ()
+                return
+            self._canal.play(bloco[1])
+            self._blocos = (bloco,)
+            self._frame_base, self._t_base = bloco[0], agora
+        elif self._canal.get_queue() is None:
+            if len(self._blocos) == 2:
+                # O bloco da fila começou entre a última conferência e agora
+                self._corrigir(self._blocos[1][0], agora)
+                self._blocos = self._blocos[1:]
+            bloco = self._proximo_som()
+            if bloco is not None:
+                self._canal.queue(bloco[1])
+                self._blocos = self._blocos + (bloco,)
+        self._ultima_conferencia = agora
+
+    def _corrigir(self, inicio_bloco: int, agora: float):
+        """Mantém a extrapolação dentro do intervalo em que o bloco pode ter começado."""
+        minimo = inicio_bloco
+        maximo = inicio_bloco + (agora - self._ultima_conferencia) * self.sample_rate
+        frame = self._frame_base + (agora - self._t_base) * self.sample_rate
+        if frame < minimo or frame > maximo:
+            self._frame_base = min(max(frame, minimo), maximo)
+            self._t_base = agora
+
+    def _loop(self):
+        """Confere a fila quatro vezes por bloco enquanto a música toca."""
+        periodo = self.bloco / self.sample_rate / 4
+        while self._ativo:
+            with self._lock:
+                tocando = self._usando_pcm and not self.pausada
+                if tocando:
+                    self._alimentar()
+            self._acordar.wait(periodo if tocando else None)
+            self._acordar.clear()
@@ -0,0 +1,113 @@
+"""
+Cache persistente em disco de buffers PCM renderizados.
+
+Guarda cada som sintetizado como um arquivo .npy (int16 estéreo) na pasta
+de cache do usuário. A leitura usa memory mapping, então inicializações
+seguintes pulam a síntese. O tamanho total é limitado: ao passar do
+limite, os arquivos usados há mais tempo (mtime) são removidos.
+"""
+
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from src.utils.file_cache import atomic_write
+from src.utils.paths import get_user_cache_path
+
+
+class PCMCache:
+    """Cache LRU em disco de buffers PCM, limitado por tamanho total."""
+
+    def __init__(self, diretorio: str = None, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            diretorio: Pasta do cache (padrão: cache do usuário/pcm)
+            max_bytes: Tamanho máximo somado dos arquivos do cache
+        """
+        self.diretorio = diretorio or get_user_cache_path("pcm")
+        os.makedirs(self.diretorio, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()  # Contabilidade compartilhada entre threads de renderização
+        self._total_bytes = sum(size for _, size, _ in self._listar())
+
+    def _caminho(self, chave: str) -> str:
+        """Arquivo correspondente a uma chave (hash para nome seguro)."""
+        nome = hashlib.sha1(chave.encode("utf-8")).hexdigest()[:24]
+        return os.path.join(self.diretorio, nome + ".npy")
+
+    def _listar(self):
+        """Lista (caminho, tamanho, mtime) das entradas do cache."""
+        entradas = []
+        for entry in os.scandir(self.diretorio):
+            if entry.is_file() and entry.name.endswith(".npy"):
+                stat = entry.stat()
+                entradas.append((entry.path, stat.st_size, stat.st_mtime_ns))
+        return entradas
+
+    def carregar(self, chave: str):
+        """
+        Lê um buffer do cache via memory mapping.
+
+        Returns:
+            np.ndarray (somente leitura) ou None se não existir/for inválido
+        """
+        caminho = self._caminho(chave)
+        if not os.path.exists(caminho):
+            return None
+        try:
+            pcm = np.load(caminho, mmap_mode="r")
+            os.utime(caminho)  # Marca como usado recentemente (LRU)
+            return pcm
+        except (OSError, ValueError) as e:
+            print(f"PCMCache: entrada inválida descartada ({e})")
+            self._remover(caminho)
+            return None
+
+    def salvar(self, chave: str, pcm: np.ndarray):
+        """Grava um buffer no cache (atômico) e aplica o limite de tamanho."""
+        caminho = self._caminho(chave)
+        with self._lock:
+            anterior = os.path.getsize(caminho) if os.path.exists(caminho) else 0
+            try:
+                atomic_write(caminho, lambda f: np.save(f, np.ascontiguousarray(pcm)))
+            except OSError as e:
+                print(f"PCMCache: não foi possível gravar ({e})")
+                return
+            self._total_bytes += os.path.getsize(caminho) - anterior
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Remove as entradas menos usadas até caber no limite."""
+        entradas = sorted(self._listar(), key=lambda e: e[2])
+        self._total_bytes = sum(size for _, size, _ in entradas)
+        for caminho, size, _ in entradas:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remover(caminho)
+            self._total_bytes -= size
+
+    def _remover(self, caminho: str):
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+    def obter(self, chave: str, renderizar):
+        """
+        Retorna o buffer da chave, renderizando e gravando se necessário.
+
+        Args:
+            chave: Identificador completo do som (nome, timbre, duração, taxa, versão)
+            renderizar: Função sem argumentos que gera o PCM int16 estéreo
+
+        Returns:
+            np.ndarray com o PCM
+        """
+        pcm = self.carregar(chave)
+        if pcm is None:
+            pcm = renderizar()
+            self.salvar(chave, pcm)
+        return pcm
@@ -0,0 +1,200 @@
+"""
+Síntese em streaming para acordes sustentados.
+
+Em vez de um buffer de duração fixa por acorde e timbre, cada voz gera
+blocos pequenos (wavetable com fase contínua entre blocos) e os enfileira
+no seu canal com Channel.queue. O acorde soa enquanto o gesto é mantido
+e entra em release quando soltar() é chamado. A memória por voz é
+constante e o ataque começa após um bloco de latência.
+"""
+
+import threading
+
+import numpy as np
+import pygame
+
+from src.audio.device import obter_audio
+from src.audio.synthesizer import Timbre, CAMADA_PADRAO
+from src.audio.voices import obter_vozes, GRUPO_SYNTH, PRIORIDADE_NORMAL
+from src.audio.wav_io import mono_para_int16_estereo
+from src.utils.config import SYNTH_STREAM_BLOCK
+from src.utils.music_theory import chord_frequencies
+
+
+# Envelope sustentado por timbre: (ataque em s, decaimento exponencial por s)
+ENVELOPE_STREAMING = {
+    Timbre.PIANO: (0.02, 2.5),
+    Timbre.GUITAR: (0.01, 3.0),
+    Timbre.SYNTH: (0.05, 0.0),
+    Timbre.PAD: (0.2, 0.5),
+    Timbre.ORGAN: (0.02, 0.0),
+}
+
+RELEASE_STREAMING = 0.1  # Duração do release em segundos
+
+
+class StreamingVoice:
+    """Um acorde sustentado tocando em blocos em um canal do mixer."""
+
+    def __init__(self, canal, wavetable, frequencias, sample_rate: int, bloco: int, timbre: Timbre,
+                 efeitos=None):
+        self.canal = canal
+        self.wavetable = wavetable
+        self.frequencias = frequencias
+        self.sample_rate = sample_rate
+        self.bloco = bloco
+        self.fases = None
+        self.posicao = 0            # Amostras já geradas
+        self.inicio_release = None  # Amostra em que o release começou
+        self.terminada = False
+        self._blocos = ()           # Sons no canal (tocando, na fila)
+        self.efeitos = efeitos      # ProcessadorEfeitos da voz (ou None)
+        dispositivo = obter_audio()
+        self._buffer_direto = (dispositivo.format, dispositivo.channels) == (-16, 2)
+
+        ataque, self.decaimento = ENVELOPE_STREAMING[timbre]
+        self.ataque = max(1, int(ataque * sample_rate))
+        self.release = max(1, int(RELEASE_STREAMING * sample_rate))
+        # Ganho que garante |onda| <= 1 (soma das amplitudes de todos os osciladores)
+        self.ganho = 1.0 / float(wavetable.osciladores(frequencias)[2].sum())
+
+    def soltar(self):
+        """Inicia o release (o som termina RELEASE_STREAMING segundos depois)."""
+        if self.inicio_release is None:
+            self.inicio_release = self.posicao
+
+    def parar(self):
+        """Interrompe a voz imediatamente."""
+        self.terminada = True
+        if self._foi_roubada():
+            return
+        self.canal.stop()
+
+    def _foi_roubada(self) -> bool:
+        """True se outro som assumiu o canal desta voz."""
+        som = self.canal.get_sound()
+        return som is not None and all(som is not b for b in self._blocos)
+
+    def _proximo_bloco(self):
+        """Gera o próximo bloco (pygame.Sound) ou None se o release acabou."""
+        if self.inicio_release is not None and self.posicao >= self.inicio_release + self.release:
+            # Depois do release, só a cauda do reverb (se houver)
+            if self.efeitos is None or self.efeitos.cauda_restante <= 0:
+                return None
+            cauda = self.efeitos.processar(np.zeros(self.bloco, dtype=np.float32))
+            return self._para_som(cauda)
+
+        onda, self.fases = self.wavetable.renderizar(self.frequencias, self.bloco, self.fases)
+
+        # Envelope do bloco: ataque linear, decaimento exponencial e release linear
+        n = self.posicao + np.arange(self.bloco, dtype=np.float32)
+        envelope = np.minimum(n / self.ataque, 1.0)
+        if self.decaimento:
+            envelope *= np.exp(-self.decaimento * n / self.sample_rate)
+        if self.inicio_release is not None:
+            envelope *= np.clip(1.0 - (n - self.inicio_release) / self.release, 0.0, 1.0)
+        onda *= envelope * self.ganho
+        self.posicao += self.bloco
+        if self.efeitos is not None:
+            onda = self.efeitos.processar(onda)
+        return self._para_som(onda)
+
+    def _para_som(self, onda: np.ndarray):
+        """Bloco float32 -> pygame.Sound int16 estéreo (saturando: o reverb pode passar de 1)."""
+        pcm = mono_para_int16_estereo(onda)
+        if self._buffer_direto:
+            return pygame.mixer.Sound(buffer=pcm)
+        return pygame.sndarray.make_sound(pcm)
+
+    def alimentar(self):
+        """Mantém um bloco tocando e outro na fila. Retorna False quando a voz acabou."""
+        if self.terminada:
+            return False
+        if self._blocos and self._foi_roubada():
+            self.terminada = True
+            return False
+
+        if not self.canal.get_busy():
+            # Primeiro bloco (ou a fila esvaziou): tocar direto
+            som = self._proximo_bloco()
+            if som is None:
+                self.terminada = True
+                return False
+            self.canal.play(som)
+            self._blocos = (som,)
+        elif self.canal.get_queue() is None:
+            som = self._proximo_bloco()
+            if som is None:
+                # Último bloco tocando; termina quando o canal esvaziar
+                return True
+            self.canal.queue(som)
+            self._blocos = (self._blocos[-1], som)
+        return True
+
+
+class SintetizadorStreaming:
+    """Cria vozes sustentadas e as alimenta em uma thread de fundo."""
+
+    def __init__(self, synth, bloco: int = SYNTH_STREAM_BLOCK):
+        """
+        Args:
+            synth: Sintetizador (fornece as wavetables e a taxa de amostragem)
+            bloco: Amostras por bloco (latência do ataque = um bloco)
+        """
+        self.synth = synth
+        self.bloco = bloco
+        self.periodo = bloco / synth.sample_rate / 2  # Conferir a fila duas vezes por bloco
+        self._vozes = []
+        self._lock = threading.Lock()
+        self._acordar = threading.Event()
+        self._ativo = True
+        self._thread = threading.Thread(target=self._loop, name="synth-stream", daemon=True)
+        self._thread.start()
+
+    def iniciar(self, nome_acorde_full: str, timbre: Timbre = None, volume: float = 0.5,
+                prioridade: int = PRIORIDADE_NORMAL, oitava: int = 0, camada: int = CAMADA_PADRAO):
+        """
+        Começa a tocar um acorde sustentado.
+        
+        A transposição do sintetizador e a oitava escalam o incremento de
+        fase da wavetable (sem tabelas novas); a camada de brilho escolhe a
+        wavetable do timbre com a inclinação espectral correspondente.
+
+        Returns:
+            StreamingVoice (chamar soltar() para encerrar) ou None se não há canal livre
+        """
+        timbre = timbre or self.synth.timbre_atual
+        canal = obter_vozes().reservar(GRUPO_SYNTH, prioridade, volume)
+        if canal is None:
+            return None
+
+        razao = 2.0 ** ((self.synth.transposicao + 12 * oitava) / 12.0)
+        frequencias = tuple(f * razao for f in chord_frequencies(nome_acorde_full))
+        efeitos = self.synth.efeitos.criar_processador(self.bloco) if self.synth.efeitos is not None else None
+        voz = StreamingVoice(
+            canal, self.synth._wavetable(timbre, camada), frequencias,
+            self.synth.sample_rate, self.bloco, timbre, efeitos,
+        )
+        voz.alimentar()  # Primeiro bloco já neste frame
+        with self._lock:
+            self._vozes.append(voz)
+        self._acordar.set()
+        return voz
+
+    def _loop(self):
+        """Alimenta as filas das vozes ativas; dorme quando não há nenhuma."""
+        while self._ativo:
+            with self._lock:
+                self._vozes = [voz for voz in self._vozes if voz.alimentar()]
+                ociosa = not self._vozes
+            self._acordar.wait(None if ociosa else self.periodo)
+            self._acordar.clear()
+
+    def encerrar(self):
+        """Para todas as vozes e a thread de alimentação."""
+        self._ativo = False
+        with self._lock:
+            for voz in self._vozes:
+                voz.parar()
+            self._vozes = []
+        self._acordar.set()
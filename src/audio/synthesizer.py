@@ -5,10 +5,32 @@ Suporta diferentes tipos de instrumentos (piano, guitarra, synth, pad)
 e sons de feedback específicos por gesto.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 import numpy as np
 from enum import Enum
-from src.utils.config import NOTAS_BASE, INTERVALOS
+from src.audio.audio_cache import AudioCacheManager
+from src.audio.device import obter_audio
+from src.audio.effects import EffectsBus
+from src.audio.voices import obter_vozes, GRUPO_UI, PRIORIDADE_ALTA
+from src.audio.pcm_cache import PCMCache
+from src.audio.wav_io import mono_para_int16_estereo
+from src.audio.wavetable import Wavetable
+from src.utils.config import (
+    TRANSPOSE_SEMITONES,
+    SYNTH_ENGINE,
+    PCM_CACHE_ENABLED,
+    PCM_CACHE_MAX_MB,
+    SYNTH_WORKERS,
+    AUDIO_CACHE_MAX_MB,
+    EFFECTS_ENABLED,
+    REVERB_TYPE,
+    REVERB_MIX,
+    CHORUS_MIX,
+)
+from src.utils.music_theory import chord_frequencies
 
 
 class Timbre(Enum):
@@ -20,17 +42,82 @@ class Timbre(Enum):
     ORGAN = "organ"           # Órgão elétrico
 
 
+# Parciais de cada timbre: (razão da frequência fundamental, amplitude)
+PARCIAIS_TIMBRE = {
+    # Piano elétrico: harmônicos decrescentes
+    Timbre.PIANO: ((1, 0.6), (2, 0.25), (3, 0.1), (4, 0.05)),
+    # Guitarra: mais harmônicos + leve inharmonicidade para realismo
+    Timbre.GUITAR: ((1, 0.5), (2, 0.2), (3, 0.15), (4, 0.08), (5, 0.05), (2.01, 0.02)),
+    # Synth lead: dente de serra (1/h), normalizada
+    Timbre.SYNTH: tuple((h, 1 / h / 3) for h in range(1, 8)),
+    # Pad: poucas harmônicas + chorus/detune (ganho 0.8)
+    Timbre.PAD: ((1, 0.7 * 0.8), (2, 0.2 * 0.8), (1.005, 0.1 * 0.8)),
+    # Órgão: drawbars 8', 4', 2 2/3', 2' e 16' (ganho 0.7)
+    Timbre.ORGAN: ((1, 0.5 * 0.7), (2, 0.3 * 0.7), (3, 0.2 * 0.7), (4, 0.15 * 0.7), (0.5, 0.1 * 0.7)),
+}
+
+# Parciais do acorde curto de feedback (independe do timbre)
+PARCIAIS_CURTO = ((1, 0.6), (2, 0.25), (3, 0.1))
+
+# Amostras por bloco na síntese vetorizada (limita o pico de memória)
+BLOCO_SINTESE = 4096
+
+# Camadas de brilho escolhidas pela velocidade da mão: inclinação espectral
+# aplicada às amplitudes dos parciais (amplitude * razão ** inclinação)
+INCLINACAO_CAMADAS = (-1.0, 0.0, 0.8)
+CAMADA_PADRAO = 1
+
+
+def camada_por_velocidade(velocidade: float) -> int:
+    """Camada de brilho (0 = suave .. 2 = brilhante) para uma velocidade de 0.0 a 1.0."""
+    return min(int(velocidade * len(INCLINACAO_CAMADAS)), len(INCLINACAO_CAMADAS) - 1)
+
+
+def ganho_por_velocidade(velocidade: float, minimo: float, maximo: float) -> float:
+    """Volume de reprodução para uma velocidade de 0.0 a 1.0."""
+    return minimo + (maximo - minimo) * max(0.0, min(1.0, velocidade))
+
+
+# Versão do som gerado: incrementar ao mudar timbres/envelopes (invalida o cache em disco)
+SYNTH_VERSION = 1
+
+
 class Sintetizador:
     """Sintetizador de acordes com múltiplos timbres."""
     
-    def __init__(self, timbre: Timbre = Timbre.PIANO):
-        pygame.mixer.pre_init(44100, -16, 2, 1024)
-        pygame.mixer.init()
-        pygame.init()
-        
-        self.sample_rate = 44100
-        self.cache_acordes = {}
+    def __init__(self, timbre: Timbre = Timbre.PIANO, cache: AudioCacheManager = None):
+        """
+        Args:
+            timbre: Timbre inicial
+            cache: Cache de sons em memória (compartilhável com o ChordSampler)
+        """
+        # Taxa e formato efetivos do mixer (aberto por src.audio.device)
+        dispositivo = obter_audio()
+        self.sample_rate = dispositivo.frequency
+        self._buffer_direto = (dispositivo.format, dispositivo.channels) == (-16, 2)
+        # Um Sound por (acorde, timbre[, duração]); limitado pelo orçamento de memória
+        self.cache_acordes = cache if cache is not None else AudioCacheManager(AUDIO_CACHE_MAX_MB * 1024 * 1024)
         self.timbre_atual = timbre
+        # Tom da música em semitons (sons transpostos derivam dos já renderizados)
+        self.transposicao = TRANSPOSE_SEMITONES
+        
+        # Pré-renderização dos outros timbres em segundo plano
+        self._lock = threading.Lock()
+        self._pendentes = {}        # cache_key -> Future ainda em renderização
+        self._executor = ThreadPoolExecutor(max_workers=SYNTH_WORKERS, thread_name_prefix="synth")
+        self._acordes_musica = ()   # Acordes da música atual
+        self._duracao_curta = None  # Duração do acorde curto usada pelo jogo
+        
+        # Motor de síntese dos acordes ("aditivo" ou "wavetable")
+        self.motor = SYNTH_ENGINE
+        self._wavetables = {}   # Tabelas por (timbre, camada de brilho); timbre None = acorde curto
+        self._envelopes = {}    # Curvas de envelope por (timbre, amostras, taxa)
+        
+        # Reverb/chorus aplicados uma vez a cada render (antes do cache)
+        self.efeitos = EffectsBus(self.sample_rate, REVERB_TYPE, REVERB_MIX, CHORUS_MIX) if EFFECTS_ENABLED else None
+        
+        # Cache persistente dos PCMs renderizados (pula a síntese em inicializações seguintes)
+        self.pcm_cache = PCMCache(max_bytes=PCM_CACHE_MAX_MB * 1024 * 1024) if PCM_CACHE_ENABLED else None
         
         # Sons de feedback
         self.som_erro = None
@@ -41,14 +128,123 @@ class Sintetizador:
         self._criar_sons_gesto()
     
     def set_timbre(self, timbre: Timbre):
-        """Muda o timbre e limpa o cache."""
+        """Muda o timbre mantendo os sons já renderizados de todos os timbres."""
         if timbre != self.timbre_atual:
             self.timbre_atual = timbre
-            self.cache_acordes.clear()
+            # O novo timbre passa na frente da fila de pré-renderização
+            self.pre_renderizar(self._acordes_musica, self._duracao_curta, timbres=(timbre,))
             print(f"Timbre alterado para: {timbre.value}")
     
+    def set_transposicao(self, semitons: int):
+        """Muda o tom da música (instantâneo: não sintetiza de novo)."""
+        self.transposicao = int(semitons)
+        print(f"Transposição: {self.transposicao:+d} semitons")
+    
+    def pre_renderizar(self, nomes_acordes, duracao_curta: float = None, timbres=None):
+        """
+        Agenda em segundo plano a síntese dos acordes da música em cada timbre.
+        
+        Enquanto a renderização não termina, o jogo toca o melhor som já
+        disponível (ver _som_disponivel).
+        
+        Args:
+            nomes_acordes: Acordes da música (ex: 'G:maj')
+            duracao_curta: Duração do acorde curto de feedback (None = não gerar)
+            timbres: Timbres a renderizar (padrão: todos, começando pelo atual)
+        """
+        self._acordes_musica = tuple(nomes_acordes)
+        self._duracao_curta = duracao_curta
+        if timbres is None:
+            timbres = [self.timbre_atual] + [t for t in Timbre if t != self.timbre_atual]
+        
+        # O acorde curto não depende do timbre: uma renderização por acorde
+        if duracao_curta is not None:
+            for nome in self._acordes_musica:
+                self._agendar(self._chave_curto(nome, duracao_curta), self.gerar_acorde_curto, nome, duracao_curta)
+        for timbre in timbres:
+            for nome in self._acordes_musica:
+                self._agendar(self._chave_acorde(nome, timbre), self.gerar_acorde, nome, timbre)
+    
+    def _agendar(self, cache_key: str, funcao, *args):
+        """Envia uma renderização ao pool, a menos que já exista ou esteja pendente."""
+        with self._lock:
+            if cache_key in self.cache_acordes or cache_key in self._pendentes:
+                return
+            try:
+                future = self._executor.submit(funcao, *args)
+            except RuntimeError:  # Pool já encerrado
+                return
+            self._pendentes[cache_key] = future
+        future.add_done_callback(lambda f: self._concluir(cache_key, f))
+    
+    def _concluir(self, cache_key: str, future):
+        """Remove uma renderização terminada dos pendentes (callback do pool)."""
+        with self._lock:
+            # Só a própria entrada: uma renderização mais nova da chave continua pendente
+            if self._pendentes.get(cache_key) is future:
+                del self._pendentes[cache_key]
+    
+    def encerrar(self):
+        """Cancela as renderizações pendentes e encerra o pool de threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _som_disponivel(self, cache_key: str, nome_acorde_full: str, sufixo: str):
+        """
+        Som para tocar enquanto cache_key ainda está sendo renderizada em
+        segundo plano: o mesmo acorde em outro timbre, se já existir.
+        
+        Args:
+            cache_key: Chave do som desejado
+            nome_acorde_full: Nome do acorde
+            sufixo: Parte da chave após o timbre
+        """
+        if cache_key not in self._pendentes:
+            return None
+        nome = nome_acorde_full
+        for timbre in Timbre:
+            chave = f"{nome}_{timbre.value}{sufixo}"
+            if chave in self.cache_acordes:
+                return self.cache_acordes.get(chave)
+        return None
+    
+    @staticmethod
+    def _chave_acorde(nome_acorde_full: str, timbre: Timbre) -> str:
+        return f"{nome_acorde_full}_{timbre.value}"
+    
+    @staticmethod
+    def _chave_curto(nome_acorde_full: str, duracao: float, camada: int = CAMADA_PADRAO) -> str:
+        chave = f"{nome_acorde_full}_short_{duracao}"
+        return chave if camada == CAMADA_PADRAO else f"{chave}_b{camada}"
+    
+    def _som_em_cache(self, chave: str, renderizar):
+        """
+        Cria um pygame.Sound a partir do cache em disco ou renderizando.
+        
+        Args:
+            chave: Identificação do som (sem taxa/versão, que são adicionadas aqui)
+            renderizar: Função sem argumentos que gera o PCM int16 estéreo
+        """
+        if self.pcm_cache is None:
+            return pygame.sndarray.make_sound(renderizar())
+        
+        chave_completa = f"{chave}|{self.sample_rate}|v{SYNTH_VERSION}"
+        pcm = self.pcm_cache.obter(chave_completa, renderizar)
+        return pygame.sndarray.make_sound(pcm)
+    
+    def _com_efeitos(self, onda: np.ndarray) -> np.ndarray:
+        """Aplica o EffectsBus (se ativo) a uma onda; a cauda do reverb alonga o som."""
+        return self.efeitos.aplicar(onda) if self.efeitos is not None else onda
+    
+    def _chave_efeitos(self) -> str:
+        """Trecho da chave do cache em disco que identifica os efeitos."""
+        return f"|{self.efeitos.assinatura}" if self.efeitos is not None else ""
+    
     def _criar_som_erro(self):
-        """Cria um som dissonante de erro (acorde diminuto + ruído)."""
+        """Cria o som de erro (do cache em disco quando disponível)."""
+        self.som_erro = self._som_em_cache("erro", self._renderizar_som_erro)
+    
+    def _renderizar_som_erro(self):
+        """Renderiza um som dissonante de erro (acorde diminuto + ruído)."""
         duracao = 0.8
         n_samples = int(self.sample_rate * duracao)
         t = np.linspace(0, duracao, n_samples, False)
@@ -75,9 +271,7 @@ class Sintetizador:
 
         # Converter para 16-bit PCM
         onda = (onda * 32767).astype(np.int16)
-        audio_stereo = np.column_stack((onda, onda))
-
-        self.som_erro = pygame.sndarray.make_sound(audio_stereo)
+        return np.column_stack((onda, onda))
     
     def _criar_sons_gesto(self):
         """Cria sons de feedback para cada tipo de gesto (sons curtos e satisfatórios)."""
@@ -93,7 +287,14 @@ class Sintetizador:
         self.sons_gesto["rock"] = self._criar_som_bleep(440.00, 0.2, tipo="rock")         # A4
     
     def _criar_som_bleep(self, freq: float, duracao: float, tipo: str = "acerto"):
-        """Cria um som curto de feedback."""
+        """Cria um som curto de feedback (do cache em disco quando disponível)."""
+        return self._som_em_cache(
+            f"bleep|{freq}|{duracao}|{tipo}",
+            lambda: self._renderizar_bleep(freq, duracao, tipo),
+        )
+    
+    def _renderizar_bleep(self, freq: float, duracao: float, tipo: str):
+        """Renderiza um som curto de feedback (PCM 16-bit estéreo)."""
         n_samples = int(self.sample_rate * duracao)
         t = np.linspace(0, duracao, n_samples, False)
         
@@ -148,230 +349,319 @@ class Sintetizador:
         
         onda = onda * envelope * 0.6
         onda = (onda * 32767).astype(np.int16)
-        audio_stereo = np.column_stack((onda, onda))
-        
-        return pygame.sndarray.make_sound(audio_stereo)
+        return np.column_stack((onda, onda))
     
     def tocar_som_erro(self):
         """Toca o som de erro/penalidade."""
         if self.som_erro:
-            self.som_erro.set_volume(0.8)
-            self.som_erro.play()
+            obter_vozes().tocar(GRUPO_UI, self.som_erro, PRIORIDADE_ALTA, volume=0.8)
     
     def tocar_som_gesto(self, gesto: str):
         """Toca o som de feedback para um gesto específico."""
-        gesto_lower = gesto.lower()
-        if gesto_lower in self.sons_gesto:
-            self.sons_gesto[gesto_lower].set_volume(0.5)
-            self.sons_gesto[gesto_lower].play()
-        elif "acerto" in self.sons_gesto:
-            self.sons_gesto["acerto"].set_volume(0.5)
-            self.sons_gesto["acerto"].play()
-
-    def criar_onda(self, freq: float, duracao: float = 1.0, volume: float = 0.5):
-        """Cria uma onda sonora com o timbre atual."""
-        n_samples = int(self.sample_rate * duracao)
-        t = np.linspace(0, duracao, n_samples, False)
+        som = self.sons_gesto.get(gesto.lower(), self.sons_gesto.get("acerto"))
+        if som:
+            obter_vozes().tocar(GRUPO_UI, som, volume=0.5)
+
+    def criar_onda(self, freq: float, duracao: float = 1.0):
+        """
+        Cria uma onda sonora com o timbre atual (PCM 16-bit estéreo).
         
-        if self.timbre_atual == Timbre.PIANO:
-            onda = self._onda_piano(freq, t, volume)
-        elif self.timbre_atual == Timbre.GUITAR:
-            onda = self._onda_guitar(freq, t, volume)
-        elif self.timbre_atual == Timbre.SYNTH:
-            onda = self._onda_synth(freq, t, volume)
-        elif self.timbre_atual == Timbre.PAD:
-            onda = self._onda_pad(freq, t, volume)
-        elif self.timbre_atual == Timbre.ORGAN:
-            onda = self._onda_organ(freq, t, volume)
+        O volume não é gravado na onda: é aplicado ao tocar (canal/VoiceManager).
+        """
+        onda = self._renderizar((freq,), self.timbre_atual, duracao)
+        return self._para_pcm_estereo(onda)
+
+    def _parciais(self, timbre, camada: int = CAMADA_PADRAO):
+        """Parciais de um timbre (None = acorde curto de feedback) em uma camada de brilho."""
+        parciais = PARCIAIS_CURTO if timbre is None else PARCIAIS_TIMBRE[timbre]
+        inclinacao = INCLINACAO_CAMADAS[camada]
+        if inclinacao == 0.0:
+            return parciais
+        return tuple((razao, amp * razao ** inclinacao) for razao, amp in parciais)
+
+    def _wavetable(self, timbre, camada: int = CAMADA_PADRAO) -> Wavetable:
+        """Wavetable de um timbre, construída na primeira vez que é usada."""
+        chave = (timbre, camada)
+        if chave not in self._wavetables:
+            self._wavetables[chave] = Wavetable(self._parciais(timbre, camada), self.sample_rate)
+        return self._wavetables[chave]
+
+    def _renderizar(self, frequencias, timbre, duracao: float, camada: int = CAMADA_PADRAO,
+                    guardar_envelope: bool = True) -> np.ndarray:
+        """
+        Renderiza notas com o motor configurado e aplica o envelope.
+
+        Args:
+            guardar_envelope: False para durações únicas (ex: backing track),
+                que não devem ficar no cache de envelopes
+
+        Returns:
+            np.ndarray: Onda mono float32 (sem normalizar).
+        """
+        if self.motor == "wavetable":
+            n_samples = int(self.sample_rate * duracao)
+            onda, _ = self._wavetable(timbre, camada).renderizar(frequencias, n_samples)
         else:
-            onda = self._onda_piano(freq, t, volume)
-        
-        # Converter para 16-bit PCM
-        onda = (onda * 32767).astype(np.int16)
-        return np.column_stack((onda, onda))
-    
-    def _onda_piano(self, freq: float, t: np.ndarray, volume: float):
-        """Timbre de piano elétrico."""
-        # Síntese aditiva com harmônicos de piano
-        onda = 0.6 * np.sin(2 * np.pi * freq * t)
-        onda += 0.25 * np.sin(2 * np.pi * freq * 2 * t)
-        onda += 0.1 * np.sin(2 * np.pi * freq * 3 * t)
-        onda += 0.05 * np.sin(2 * np.pi * freq * 4 * t)
-        
-        # Envelope ADSR do piano (ataque rápido, decay longo)
-        envelope = np.exp(-2.5 * t) * (1 - np.exp(-50 * t))
-        return onda * envelope * volume
-    
-    def _onda_guitar(self, freq: float, t: np.ndarray, volume: float):
-        """Timbre de guitarra acústica."""
-        # Mais harmônicos ímpares para som mais "rico"
-        onda = 0.5 * np.sin(2 * np.pi * freq * t)
-        onda += 0.2 * np.sin(2 * np.pi * freq * 2 * t)
-        onda += 0.15 * np.sin(2 * np.pi * freq * 3 * t)
-        onda += 0.08 * np.sin(2 * np.pi * freq * 4 * t)
-        onda += 0.05 * np.sin(2 * np.pi * freq * 5 * t)
-        
-        # Pequena inharmonicidade para realismo
-        onda += 0.02 * np.sin(2 * np.pi * freq * 2.01 * t)
-        
-        # Envelope com pico de ataque (como uma corda)
-        envelope = np.exp(-3 * t) * (1 - np.exp(-100 * t))
-        return onda * envelope * volume
-    
-    def _onda_synth(self, freq: float, t: np.ndarray, volume: float):
-        """Timbre de sintetizador lead."""
-        # Onda dente de serra (rica em harmônicos)
-        onda = np.zeros_like(t)
-        for harm in range(1, 8):
-            onda += (1 / harm) * np.sin(2 * np.pi * freq * harm * t)
-        onda = onda / 3  # Normalizar
-        
-        # Envelope sustentado
-        duracao = len(t) / self.sample_rate
-        envelope = np.ones_like(t)
-        attack_samples = int(0.05 * self.sample_rate)
-        release_samples = int(0.1 * self.sample_rate)
-        
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-        envelope[-release_samples:] = np.linspace(1, 0, release_samples)
-        
-        return onda * envelope * volume
-    
-    def _onda_pad(self, freq: float, t: np.ndarray, volume: float):
-        """Timbre de pad atmosférico."""
-        # Onda suave com poucas harmônicas
-        onda = 0.7 * np.sin(2 * np.pi * freq * t)
-        onda += 0.2 * np.sin(2 * np.pi * freq * 2 * t)
-        
-        # Leve chorus/detune
-        onda += 0.1 * np.sin(2 * np.pi * freq * 1.005 * t)
-        
-        # Envelope lento (fade in/out)
-        duracao = len(t) / self.sample_rate
-        attack_time = 0.2
-        release_time = 0.3
-        
-        attack_samples = int(attack_time * self.sample_rate)
-        release_samples = int(release_time * self.sample_rate)
-        
-        envelope = np.ones_like(t) * np.exp(-0.5 * t)
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples) * envelope[:attack_samples]
-        
-        return onda * envelope * volume * 0.8
-    
-    def _onda_organ(self, freq: float, t: np.ndarray, volume: float):
-        """Timbre de órgão elétrico (drawbars)."""
-        # Simular drawbars do Hammond
-        onda = 0.5 * np.sin(2 * np.pi * freq * t)          # 8'
-        onda += 0.3 * np.sin(2 * np.pi * freq * 2 * t)     # 4'
-        onda += 0.2 * np.sin(2 * np.pi * freq * 3 * t)     # 2 2/3'
-        onda += 0.15 * np.sin(2 * np.pi * freq * 4 * t)    # 2'
-        onda += 0.1 * np.sin(2 * np.pi * freq * 0.5 * t)   # 16'
-        
-        # Envelope sustentado (órgão não decai)
-        envelope = np.ones_like(t)
-        attack_samples = int(0.02 * self.sample_rate)
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-        
-        return onda * envelope * volume * 0.7
+            onda = self._renderizar_notas(frequencias, self._parciais(timbre, camada), duracao)
+        if guardar_envelope:
+            onda *= self._envelope(timbre, len(onda))
+        else:
+            onda *= self._calcular_envelope(timbre, len(onda))
+        return onda
 
-    def gerar_acorde(self, nome_acorde_full: str):
-        """Gera um acorde completo. Ex: 'G:maj' ou 'A:min'."""
-        cache_key = f"{nome_acorde_full}_{self.timbre_atual.value}"
-        
-        if cache_key in self.cache_acordes:
-            return self.cache_acordes[cache_key]
+    def renderizar_onda(self, frequencias, timbre: Timbre, duracao: float, pico: float = None,
+                        fade_out: float = 0.0) -> np.ndarray:
+        """
+        Onda float32 de um acorde com os efeitos aplicados, sem criar Sound nem usar caches.
 
-        try:
-            if ":" in nome_acorde_full:
-                tonica, tipo = nome_acorde_full.split(":")
-            else:
-                tonica = nome_acorde_full
-                tipo = "maj"
+        Para renders de duração única (ex: os ataques do backing track).
+
+        Args:
+            frequencias: Frequências das notas do acorde
+            timbre: Timbre do som
+            duracao: Duração em segundos (a cauda dos efeitos é acrescentada)
+            pico: Se informado, normaliza a onda seca para esse pico
+            fade_out: Fade-out linear (s) no fim da onda seca, antes dos efeitos
+        """
+        onda = self._renderizar(frequencias, timbre, duracao, guardar_envelope=False)
+        if pico is not None:
+            max_val = np.max(np.abs(onda)) if len(onda) else 0
+            if max_val > 0:
+                onda *= np.float32(pico / max_val)
+        n = min(int(fade_out * self.sample_rate), len(onda))
+        if n > 0:
+            onda[len(onda) - n:] *= np.linspace(1, 0, n, dtype=np.float32)
+        return self._com_efeitos(onda)
+
+    def _envelope(self, timbre, n_samples: int) -> np.ndarray:
+        """Envelope de amplitude de um timbre (float32, compartilhado e somente leitura)."""
+        chave = (timbre, n_samples, self.sample_rate)
+        envelope = self._envelopes.get(chave)
+        if envelope is None:
+            envelope = self._calcular_envelope(timbre, n_samples)
+            envelope.flags.writeable = False
+            self._envelopes[chave] = envelope
+        return envelope
+
+    def _calcular_envelope(self, timbre, n_samples: int) -> np.ndarray:
+        """Calcula o envelope de amplitude de um timbre (float32)."""
+        t = np.arange(n_samples, dtype=np.float32) / np.float32(self.sample_rate)
+
+        if timbre == Timbre.GUITAR:
+            # Pico de ataque (como uma corda)
+            return np.exp(-3 * t) * (1 - np.exp(-100 * t))
+
+        if timbre == Timbre.SYNTH:
+            # Envelope sustentado com ataque e release lineares
+            envelope = np.ones(n_samples, dtype=np.float32)
+            attack_samples = min(int(0.05 * self.sample_rate), n_samples)
+            release_samples = min(int(0.1 * self.sample_rate), n_samples)
+            envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+            envelope[n_samples - release_samples:] = np.linspace(1, 0, release_samples)
+            return envelope
+
+        if timbre == Timbre.PAD:
+            # Envelope lento (fade in + decaimento suave)
+            envelope = np.exp(-0.5 * t)
+            attack_samples = min(int(0.2 * self.sample_rate), n_samples)
+            envelope[:attack_samples] *= np.linspace(0, 1, attack_samples, dtype=np.float32)
+            return envelope
+
+        if timbre == Timbre.ORGAN:
+            # Órgão não decai
+            envelope = np.ones(n_samples, dtype=np.float32)
+            attack_samples = min(int(0.02 * self.sample_rate), n_samples)
+            envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+            return envelope
+
+        if timbre is None:
+            # Acorde curto: ataque rápido e decay
+            return np.exp(-3 * t) * (1 - np.exp(-50 * t))
 
-            freq_base = NOTAS_BASE.get(tonica, 261.63)
-            intervalos = INTERVALOS.get(tipo, INTERVALOS["maj"])
+        # Piano (padrão): ataque rápido, decay longo
+        return np.exp(-2.5 * t) * (1 - np.exp(-50 * t))
 
-            # Misturar as notas do acorde
-            audio_final = None
+    def _renderizar_notas(self, frequencias, parciais, duracao: float) -> np.ndarray:
+        """
+        Soma aditiva de todas as notas × parciais em float32.
+
+        Monta as frequências angulares de notas × parciais, avalia um único
+        ``np.sin`` em broadcast contra o tempo e reduz com um produto
+        matricial pelos pesos. O cálculo é feito em blocos de amostras
+        para manter o pico de memória baixo.
 
-            for semi_tons in intervalos:
-                freq_nota = freq_base * (2 ** (semi_tons / 12.0))
-                onda_nota = self.criar_onda(freq_nota)
+        Returns:
+            np.ndarray: Onda mono float32 (sem envelope e sem normalizar).
+        """
+        n_samples = int(self.sample_rate * duracao)
+        razoes = np.array([razao for razao, _ in parciais], dtype=np.float32)
+        amplitudes = np.array([amp for _, amp in parciais], dtype=np.float32)
 
-                if audio_final is None:
-                    audio_final = onda_nota
-                else:
-                    audio_final = audio_final + onda_nota
+        # (notas × parciais,) frequências angulares e pesos correspondentes
+        omega = (2 * np.pi * np.outer(np.asarray(frequencias, dtype=np.float32), razoes)).ravel()
+        omega = omega.astype(np.float32)
+        pesos = np.tile(amplitudes, len(frequencias))
 
-            # Normalizar para evitar distorção
-            max_val = np.max(np.abs(audio_final))
+        t = np.arange(n_samples, dtype=np.float32) / np.float32(self.sample_rate)
+        onda = np.empty(n_samples, dtype=np.float32)
+        fases = np.empty((len(omega), min(BLOCO_SINTESE, n_samples)), dtype=np.float32)
+
+        for inicio in range(0, n_samples, BLOCO_SINTESE):
+            fim = min(inicio + BLOCO_SINTESE, n_samples)
+            bloco = fases[:, :fim - inicio]
+            np.multiply.outer(omega, t[inicio:fim], out=bloco)
+            np.sin(bloco, out=bloco)
+            np.dot(pesos, bloco, out=onda[inicio:fim])
+
+        return onda
+
+    def _para_pcm_estereo(self, onda: np.ndarray, pico: float = None) -> np.ndarray:
+        """
+        Converte uma onda float32 para PCM 16-bit estéreo (uma única conversão).
+
+        Args:
+            onda: Onda mono float32 (-1.0 a 1.0 se ``pico`` for None)
+            pico: Se informado, normaliza a onda para esse pico (0.0-1.0)
+        """
+        if pico is not None:
+            max_val = np.max(np.abs(onda)) if len(onda) else 0
             if max_val > 0:
-                audio_final = (audio_final / max_val * 32767).astype(np.int16)
+                onda = onda * np.float32(pico / max_val)
+        return mono_para_int16_estereo(onda)
+
+    def gerar_acorde(self, nome_acorde_full: str, timbre: Timbre = None):
+        """
+        Gera um acorde completo. Ex: 'G:maj' ou 'A:min'.
+        
+        Args:
+            nome_acorde_full: Nome do acorde
+            timbre: Timbre do som (padrão: timbre atual)
+        """
+        timbre = timbre or self.timbre_atual
+        cache_key = self._chave_acorde(nome_acorde_full, timbre)
+        
+        som = self.cache_acordes.get(cache_key)
+        if som is not None:
+            return som
+        
+        # Renderização em segundo plano ainda não terminou: usar outro timbre
+        if threading.current_thread() is threading.main_thread():
+            som = self._som_disponivel(cache_key, nome_acorde_full, "")
+            if som is not None:
+                return som
+
+        try:
+            frequencias = chord_frequencies(nome_acorde_full)
+
+            def renderizar():
+                # Misturar todas as notas do acorde de uma vez (float32)
+                onda = self._com_efeitos(self._renderizar(frequencias, timbre, 1.0))
+                # Normalizar para evitar distorção
+                return self._para_pcm_estereo(onda, pico=1.0)
 
-            som = pygame.sndarray.make_sound(audio_final)
-            self.cache_acordes[cache_key] = som
+            som = self._som_em_cache(
+                f"acorde|{nome_acorde_full}|{timbre.value}|1.0|{self.motor}{self._chave_efeitos()}", renderizar
+            )
+            self.cache_acordes.put(cache_key, som)
             return som
         except Exception as e:
             print(f"Erro ao gerar acorde {nome_acorde_full}: {e}")
             return None
 
-    def gerar_acorde_curto(self, nome_acorde_full: str, duracao: float = 0.3):
+    def acorde_para_tocar(self, nome_acorde_full: str, duracao: float = 0.3, camada: int = CAMADA_PADRAO,
+                          oitava: int = 0):
+        """
+        Acorde curto no tom da música e na oitava pedida.
+        
+        Args:
+            nome_acorde_full: Nome do acorde (ex: 'G:maj')
+            duracao: Duração do acorde curto renderizado
+            camada: Camada de brilho
+            oitava: Deslocamento de oitavas (ex: pela altura da mão)
+        
+        Returns:
+            pygame.Sound ou None
+        """
+        som = self.gerar_acorde_curto(nome_acorde_full, duracao, camada=camada)
+        semitons = self.transposicao + 12 * oitava
+        if som is None or semitons == 0:
+            return som
+        
+        chave_base = self._chave_curto(nome_acorde_full, duracao, camada)
+        cache_key = f"{chave_base}_t{semitons}"
+        transposto = self.cache_acordes.get(cache_key)
+        if transposto is None:
+            transposto = self._transpor(som, semitons)
+            self.cache_acordes.put(cache_key, transposto)
+        return transposto
+    
+    def _transpor(self, som, semitons: int):
+        """
+        Deriva um som transposto reamostrando um já renderizado.
+        
+        Como uma fita tocada mais rápida: a altura sobe e a duração (com o
+        envelope) encolhe pelo mesmo fator 2 ** (semitons / 12).
+        """
+        pcm = pygame.sndarray.samples(som)  # View do buffer, sem cópia
+        razao = 2.0 ** (semitons / 12.0)
+        n = max(1, int(len(pcm) / razao))
+        posicoes = np.arange(n, dtype=np.float64) * razao
+        indices = np.arange(len(pcm), dtype=np.float64)
+        
+        if pcm.ndim == 1:
+            # Mixer mono: sndarray usa um array 1D
+            saida = np.interp(posicoes, indices, pcm).astype(pcm.dtype)
+        else:
+            saida = np.empty((n, pcm.shape[1]), dtype=pcm.dtype)
+            for canal in range(pcm.shape[1]):
+                saida[:, canal] = np.interp(posicoes, indices, pcm[:, canal])
+        if self._buffer_direto:
+            return pygame.mixer.Sound(buffer=saida)
+        return pygame.sndarray.make_sound(saida)
+    
+    def gerar_acorde_curto(self, nome_acorde_full: str, duracao: float = 0.3, camada: int = CAMADA_PADRAO):
         """
         Gera uma versão curta do acorde para feedback imediato.
         
+        O som é o mesmo em todos os timbres (parciais e envelope próprios),
+        então é renderizado e guardado uma vez por acorde e camada.
+        
         Args:
             nome_acorde_full: Nome do acorde (ex: 'G:maj', 'A:min')
             duracao: Duração do som em segundos (padrão: 0.3s)
+            camada: Camada de brilho (ver camada_por_velocidade); o volume
+                da velocidade é aplicado ao tocar, não gravado no som
         
         Returns:
             pygame.Sound ou None
         """
-        cache_key = f"{nome_acorde_full}_{self.timbre_atual.value}_short_{duracao}"
+        cache_key = self._chave_curto(nome_acorde_full, duracao, camada)
+        
+        som = self.cache_acordes.get(cache_key)
+        if som is not None:
+            return som
         
-        if cache_key in self.cache_acordes:
-            return self.cache_acordes[cache_key]
+        # Renderização em segundo plano ainda não terminou: usar outra camada
+        if threading.current_thread() is threading.main_thread() and cache_key in self._pendentes:
+            for outra in range(len(INCLINACAO_CAMADAS)):
+                som = self.cache_acordes.get(self._chave_curto(nome_acorde_full, duracao, outra))
+                if som is not None:
+                    return som
 
         try:
-            if ":" in nome_acorde_full:
-                tonica, tipo = nome_acorde_full.split(":")
-            else:
-                tonica = nome_acorde_full
-                tipo = "maj"
-
-            freq_base = NOTAS_BASE.get(tonica, 261.63)
-            intervalos = INTERVALOS.get(tipo, INTERVALOS["maj"])
+            frequencias = chord_frequencies(nome_acorde_full)
 
-            # Criar acorde curto
-            n_samples = int(self.sample_rate * duracao)
-            t = np.linspace(0, duracao, n_samples, False)
-            
-            audio_final = np.zeros((n_samples, 2), dtype=np.float64)
-
-            for semi_tons in intervalos:
-                freq_nota = freq_base * (2 ** (semi_tons / 12.0))
-                
-                # Onda simples com harmônicos
-                onda = 0.6 * np.sin(2 * np.pi * freq_nota * t)
-                onda += 0.25 * np.sin(2 * np.pi * freq_nota * 2 * t)
-                onda += 0.1 * np.sin(2 * np.pi * freq_nota * 3 * t)
-                
-                # Envelope com ataque rápido e decay
-                envelope = np.exp(-3 * t) * (1 - np.exp(-50 * t))
-                onda = onda * envelope * 0.5
-                
-                audio_final[:, 0] += onda
-                audio_final[:, 1] += onda
-
-            # Normalizar
-            max_val = np.max(np.abs(audio_final))
-            if max_val > 0:
-                audio_final = (audio_final / max_val * 32767 * 0.8).astype(np.int16)
-            else:
-                audio_final = audio_final.astype(np.int16)
+            def renderizar():
+                # Onda simples com harmônicos e envelope com ataque rápido e decay
+                onda = self._com_efeitos(self._renderizar(frequencias, None, duracao, camada))
+                # Normalizar
+                return self._para_pcm_estereo(onda, pico=0.8)
 
-            som = pygame.sndarray.make_sound(audio_final)
-            self.cache_acordes[cache_key] = som
+            chave_pcm = f"curto|{nome_acorde_full}|{duracao}|{self.motor}{self._chave_efeitos()}"
+            if camada != CAMADA_PADRAO:
+                chave_pcm += f"|inclinacao{INCLINACAO_CAMADAS[camada]}"
+            som = self._som_em_cache(chave_pcm, renderizar)
+            self.cache_acordes.put(cache_key, som)
             return som
         except Exception as e:
             print(f"Erro ao gerar acorde curto {nome_acorde_full}: {e}")
@@ -0,0 +1,160 @@
+"""
+Gerenciador de vozes (canais do mixer) com grupos reservados.
+
+Cada grupo (acordes sintetizados, samples reais, feedback da interface e
+a própria música) recebe um conjunto fixo de canais, reservados com
+set_reserved para que nenhum Sound.play() automático os ocupe. Quando todos os canais de um
+grupo estão ocupados, a voz de menor prioridade (e mais antiga) é
+interrompida, desde que sua prioridade não seja maior que a do som novo.
+"""
+
+import time
+
+import pygame
+
+from src.audio.device import obter_audio
+from src.utils.config import AUDIO_VOICE_GROUPS
+
+
+GRUPO_SYNTH = "synth"
+GRUPO_SAMPLES = "samples"
+GRUPO_UI = "ui"
+GRUPO_MUSICA = "music"
+
+PRIORIDADE_BAIXA = 0
+PRIORIDADE_NORMAL = 1
+PRIORIDADE_ALTA = 2
+
+
+class _Voz:
+    """Estado de um canal do mixer."""
+
+    __slots__ = ("canal", "prioridade", "inicio")
+
+    def __init__(self, canal):
+        self.canal = canal
+        self.prioridade = PRIORIDADE_BAIXA
+        self.inicio = 0.0
+
+
+class VoiceManager:
+    """Distribui os sons entre grupos de canais com roubo de voz por prioridade."""
+
+    def __init__(self, grupos: dict = None):
+        """
+        Args:
+            grupos: Canais por grupo, na ordem de alocação (padrão: AUDIO_VOICE_GROUPS)
+        """
+        grupos = dict(grupos or AUDIO_VOICE_GROUPS)
+        total = sum(grupos.values())
+        dispositivo = obter_audio()
+        if dispositivo.num_channels < total:
+            pygame.mixer.set_num_channels(total)
+            dispositivo.num_channels = total
+        # Os canais 0..total-1 ficam fora da escolha automática do pygame
+        pygame.mixer.set_reserved(total)
+
+        self._vozes = {}
+        self.volumes = {}
+        self.roubos = {}
+        self.descartes = {}
+        self.pico = {}
+        indice = 0
+        for grupo, n in grupos.items():
+            self._vozes[grupo] = [_Voz(pygame.mixer.Channel(i)) for i in range(indice, indice + n)]
+            self.volumes[grupo] = 1.0
+            self.roubos[grupo] = 0
+            self.descartes[grupo] = 0
+            self.pico[grupo] = 0
+            indice += n
+
+    def tocar(self, grupo: str, som, prioridade: int = PRIORIDADE_NORMAL, volume: float = 1.0):
+        """
+        Toca um som em um canal do grupo.
+
+        Args:
+            grupo: Grupo de canais (GRUPO_SYNTH, GRUPO_SAMPLES, GRUPO_UI)
+            som: pygame.Sound
+            prioridade: Sons de prioridade maior não são interrompidos por menores
+            volume: Volume do som (multiplicado pelo volume do grupo)
+
+        Returns:
+            pygame.mixer.Channel usado, ou None se o som foi descartado
+        """
+        canal = self.reservar(grupo, prioridade, volume)
+        if canal is not None:
+            canal.play(som)
+            self.pico[grupo] = max(self.pico[grupo], self.ativas(grupo))
+        return canal
+
+    def reservar(self, grupo: str, prioridade: int = PRIORIDADE_NORMAL, volume: float = 1.0):
+        """
+        Obtém um canal do grupo sem tocar nada (para vozes em streaming).
+
+        Returns:
+            pygame.mixer.Channel com o volume ajustado, ou None se o som foi descartado
+        """
+        voz = self._escolher_voz(grupo, prioridade)
+        if voz is None:
+            self.descartes[grupo] += 1
+            return None
+
+        voz.prioridade = prioridade
+        voz.inicio = time.monotonic()
+        voz.canal.set_volume(volume * self.volumes[grupo])
+        return voz.canal
+
+    def _escolher_voz(self, grupo: str, prioridade: int):
+        """Canal livre do grupo ou a voz a roubar (None se nenhuma pode ser interrompida)."""
+        vozes = self._vozes[grupo]
+        for voz in vozes:
+            if not voz.canal.get_busy():
+                return voz
+
+        # Menor prioridade primeiro; entre iguais, a mais antiga
+        vitima = min(vozes, key=lambda v: (v.prioridade, v.inicio))
+        if vitima.prioridade > prioridade:
+            return None
+        vitima.canal.stop()
+        self.roubos[grupo] += 1
+        return vitima
+
+    def parar(self, grupo: str = None):
+        """Para todas as vozes de um grupo (ou de todos)."""
+        grupos = [grupo] if grupo is not None else self._vozes
+        for g in grupos:
+            for voz in self._vozes[g]:
+                voz.canal.stop()
+
+    def set_volume(self, grupo: str, volume: float):
+        """Define o volume de um grupo (0.0 a 1.0) para os próximos sons."""
+        self.volumes[grupo] = max(0.0, min(1.0, volume))
+
+    def ativas(self, grupo: str = None) -> int:
+        """Quantas vozes estão tocando em um grupo (ou no total)."""
+        grupos = [grupo] if grupo is not None else self._vozes
+        return sum(voz.canal.get_busy() for g in grupos for voz in self._vozes[g])
+
+    def stats(self) -> dict:
+        """Por grupo: canais, vozes ativas, pico de vozes simultâneas, roubos e descartes."""
+        return {
+            grupo: {
+                "canais": len(vozes),
+                "ativas": self.ativas(grupo),
+                "pico": self.pico[grupo],
+                "roubos": self.roubos[grupo],
+                "descartes": self.descartes[grupo],
+            }
+            for grupo, vozes in self._vozes.items()
+        }
+
+
+_gerenciador = None
+
+
+def obter_vozes() -> VoiceManager:
+    """Gerenciador de vozes compartilhado (criado na primeira chamada)."""
+    global _gerenciador
+    if _gerenciador is None:
+        _gerenciador = VoiceManager()
+    return _gerenciador
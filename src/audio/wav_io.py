@@ -0,0 +1,187 @@
+"""
+Leitura e escrita de arquivos WAV PCM.
+
+A leitura processa apenas os cabeçalhos RIFF e expõe o chunk de dados
+como uma view NumPy sem cópia (np.memmap). O sistema operacional carrega
+as páginas sob demanda, então abrir um arquivo longo é instantâneo e não
+ocupa memória até que um trecho seja lido.
+
+A escrita grava WAVs 16-bit de forma atômica, opcionalmente com um chunk
+de assinatura usado para validar caches derivados de outro arquivo.
+"""
+
+import struct
+
+import numpy as np
+
+from src.utils.file_cache import atomic_write
+
+
+# Formatos de sample suportados (bytes por sample -> dtype)
+DTYPES_PCM = {1: np.uint8, 2: np.dtype("<i2")}
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Chunk próprio com a assinatura do arquivo fonte (ignorado por outros leitores)
+CHUNK_ASSINATURA = b"pmsg"
+
+
+class WavMapeado:
+    """Áudio PCM de um WAV mapeado em memória."""
+
+    __slots__ = ("path", "sample_rate", "num_channels", "sampwidth", "frames", "assinatura")
+
+    def __init__(self, path, sample_rate, num_channels, sampwidth, frames, assinatura=None):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.num_channels = num_channels
+        self.sampwidth = sampwidth
+        self.frames = frames  # np.memmap (n_frames, canais), somente leitura
+        self.assinatura = assinatura  # Conteúdo do chunk de assinatura, se houver
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def duracao(self) -> float:
+        return len(self.frames) / self.sample_rate
+
+
+def abrir_wav(path: str) -> WavMapeado:
+    """
+    Abre um WAV PCM 8/16-bit mapeando o chunk de dados em memória.
+
+    Raises:
+        ValueError: Se o arquivo não for um WAV PCM suportado
+    """
+    with open(path, "rb") as f:
+        cabecalho = f.read(12)
+        if len(cabecalho) < 12 or cabecalho[:4] != b"RIFF" or cabecalho[8:12] != b"WAVE":
+            raise ValueError("Arquivo não é um WAV (RIFF/WAVE)")
+
+        fmt = None
+        assinatura = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                raise ValueError("Chunk de dados não encontrado")
+            chunk_id, tamanho = struct.unpack("<4sI", chunk)
+
+            if chunk_id == b"fmt ":
+                fmt = f.read(tamanho)
+                if tamanho % 2:
+                    f.seek(1, 1)
+            elif chunk_id == CHUNK_ASSINATURA:
+                assinatura = f.read(tamanho).rstrip(b"\0").decode("utf-8", errors="replace")
+                if tamanho % 2:
+                    f.seek(1, 1)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError("Chunk 'fmt ' ausente antes dos dados")
+                offset = f.tell()
+                break
+            else:
+                # Chunks RIFF são alinhados em 2 bytes
+                f.seek(tamanho + (tamanho % 2), 1)
+
+        f.seek(0, 2)
+        tamanho_arquivo = f.tell()
+
+    formato, canais, sample_rate = struct.unpack("<HHI", fmt[:8])
+    bits = struct.unpack("<H", fmt[14:16])[0]
+    if formato == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        formato = struct.unpack("<H", fmt[24:26])[0]  # Subformato (GUID)
+    sampwidth = bits // 8
+    if formato != WAVE_FORMAT_PCM or sampwidth not in DTYPES_PCM or canais < 1:
+        raise ValueError(f"Formato não suportado: formato {formato}, {bits} bits, {canais} canais")
+
+    # Tamanho declarado pode estar errado (gravações interrompidas, streaming)
+    bytes_frame = sampwidth * canais
+    tamanho = min(tamanho, tamanho_arquivo - offset)
+    n_frames = tamanho // bytes_frame
+
+    dtype = DTYPES_PCM[sampwidth]
+    if n_frames == 0:
+        frames = np.zeros((0, canais), dtype=dtype)
+    else:
+        frames = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(n_frames, canais))
+    return WavMapeado(path, sample_rate, canais, sampwidth, frames, assinatura)
+
+
+def para_int16_estereo(trecho: np.ndarray) -> np.ndarray:
+    """
+    Converte um trecho (frames, canais) de um WavMapeado para int16 estéreo.
+
+    Sempre retorna um array novo e gravável (a view mapeada não é alterada).
+    """
+    if trecho.dtype == np.uint8:
+        trecho = (trecho.astype(np.int16) - 128) << 8
+    else:
+        trecho = trecho.astype(np.int16)  # Cópia (memmap -> memória)
+
+    canais = trecho.shape[1]
+    if canais == 2:
+        return trecho
+    if canais == 1:
+        return np.repeat(trecho, 2, axis=1)
+    # Mais de dois canais: usar os dois primeiros
+    return np.ascontiguousarray(trecho[:, :2])
+
+
+def mono_para_int16_estereo(onda: np.ndarray) -> np.ndarray:
+    """Onda mono float32 (-1.0 a 1.0) -> int16 estéreo, saturando o que passar do limite."""
+    pcm = np.empty((len(onda), 2), dtype=np.int16)
+    pcm[:, 0] = np.clip(onda * 32767, -32768, 32767)
+    pcm[:, 1] = pcm[:, 0]
+    return pcm
+
+
+def escrever_wav(path: str, pcm: np.ndarray, sample_rate: int, assinatura: str = None):
+    """
+    Grava PCM int16 (frames, canais) como WAV, de forma atômica.
+
+    Args:
+        path: Arquivo de destino
+        pcm: Áudio int16 com shape (frames, canais)
+        sample_rate: Taxa de amostragem
+        assinatura: Texto gravado em um chunk próprio antes dos dados
+    """
+    if pcm.ndim == 1:
+        pcm = pcm[:, None]
+    escrever_wav_em_blocos(path, (pcm,), len(pcm), pcm.shape[1], sample_rate, assinatura)
+
+
+def escrever_wav_em_blocos(path: str, blocos, n_frames: int, canais: int, sample_rate: int,
+                           assinatura: str = None):
+    """
+    Grava um WAV 16-bit a partir de blocos int16 (frames, canais), de forma atômica.
+
+    Só um bloco fica em memória por vez; n_frames (o total) é necessário
+    para o cabeçalho.
+    """
+    extra = b""
+    if assinatura is not None:
+        texto = assinatura.encode("utf-8")
+        if len(texto) % 2:
+            texto += b"\0"
+        extra = struct.pack("<4sI", CHUNK_ASSINATURA, len(texto)) + texto
+
+    tamanho_dados = n_frames * canais * 2
+    fmt = struct.pack("<HHIIHH", WAVE_FORMAT_PCM, canais, sample_rate, sample_rate * canais * 2, canais * 2, 16)
+    tamanho_riff = 4 + (8 + len(fmt)) + len(extra) + 8 + tamanho_dados
+
+    def gravar(f):
+        f.write(struct.pack("<4sI4s", b"RIFF", tamanho_riff, b"WAVE"))
+        f.write(struct.pack("<4sI", b"fmt ", len(fmt)) + fmt)
+        f.write(extra)
+        f.write(struct.pack("<4sI", b"data", tamanho_dados))
+        escritos = 0
+        for bloco in blocos:
+            bloco = np.ascontiguousarray(bloco, dtype="<i2")
+            f.write(memoryview(bloco).cast("B"))
+            escritos += bloco.nbytes
+        if escritos != tamanho_dados:
+            raise ValueError(f"WAV com {escritos} bytes de dados, esperado {tamanho_dados}")
+
+    atomic_write(path, gravar)
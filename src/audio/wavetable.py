@@ -0,0 +1,161 @@
+"""
+Oscilador de wavetable para os timbres do sintetizador.
+
+Cada timbre vira um conjunto de tabelas de ciclo único (uma por oitava,
+band-limited para não gerar aliasing). Qualquer frequência é renderizada
+com um acumulador de fase de 32 bits que lê a tabela com interpolação
+linear, em vez de avaliar ``np.sin`` para cada harmônico. O custo por nota
+não depende do número de harmônicos, e a fase pode continuar entre
+renderizações (usado em blocos/streaming).
+"""
+
+import numpy as np
+
+TAMANHO_TABELA = 2048   # Amostras por ciclo
+FREQ_MINIMA = 20.0      # Frequência inferior da primeira banda (Hz)
+BLOCO_WAVETABLE = 4096  # Amostras por bloco de renderização
+
+
+class Wavetable:
+    """
+    Tabelas band-limited de um conjunto de parciais.
+
+    Parciais com razão inteira entram na tabela de ciclo único; parciais
+    inarmônicas (ex: 2.01, 1.005, 0.5) viram osciladores senoidais extras
+    que leem a mesma tabela de seno.
+    """
+
+    def __init__(self, parciais, sample_rate: int, tamanho: int = TAMANHO_TABELA):
+        """
+        Args:
+            parciais: Sequência de (razão da fundamental, amplitude)
+            sample_rate: Taxa de amostragem de saída
+            tamanho: Amostras por ciclo da tabela
+        """
+        self.sample_rate = sample_rate
+        self.tamanho = tamanho
+        self.nyquist = sample_rate / 2
+
+        harmonicos = [(int(r), a) for r, a in parciais if float(r).is_integer()]
+        self.inarmonicos = tuple((float(r), a) for r, a in parciais if not float(r).is_integer())
+
+        # Uma banda por oitava a partir de FREQ_MINIMA até Nyquist
+        self.n_bandas = max(1, int(np.ceil(np.log2(self.nyquist / FREQ_MINIMA))))
+
+        # +1 ponto de guarda (tabela[tamanho] == tabela[0]) para a interpolação
+        fase = 2 * np.pi * np.arange(tamanho + 1) / tamanho
+        tabelas = np.zeros((self.n_bandas + 1, tamanho + 1), dtype=np.float64)
+        for banda in range(self.n_bandas):
+            freq_max = FREQ_MINIMA * 2 ** (banda + 1)
+            for h, amp in harmonicos:
+                # A fundamental sempre entra; harmônicos só abaixo de Nyquist
+                if h == 1 or h * freq_max < self.nyquist:
+                    tabelas[banda] += amp * np.sin(h * fase)
+
+        # Última linha: senoide pura para as parciais inarmônicas
+        self.indice_seno = self.n_bandas
+        tabelas[self.indice_seno] = np.sin(fase)
+
+        self.tabelas = tabelas.astype(np.float32)
+        self.tabelas.flags.writeable = False
+
+        # Fase uint32: bits altos = índice na tabela, bits baixos = fração
+        bits_indice = int(np.log2(tamanho))
+        if 2 ** bits_indice != tamanho:
+            raise ValueError(f"Tamanho da tabela deve ser potência de 2: {tamanho}")
+        self._bits_frac = np.uint32(32 - bits_indice)
+        self._mascara_frac = np.uint32((1 << (32 - bits_indice)) - 1)
+        self._escala_frac = np.float32(2.0 ** -(32 - bits_indice))
+
+    def _banda(self, freq: float) -> int:
+        """Índice da tabela band-limited para uma frequência."""
+        banda = int(np.log2(max(freq, FREQ_MINIMA) / FREQ_MINIMA))
+        return min(banda, self.n_bandas - 1)
+
+    def osciladores(self, frequencias):
+        """
+        Monta os osciladores de um conjunto de notas.
+
+        Os incrementos de fase são inteiros de 32 bits (acumulador de fase
+        em ponto fixo): o overflow natural do uint32 faz o "mod" do ciclo.
+
+        Returns:
+            tuple: (incrementos uint32, deslocamentos na tabela achatada,
+            amplitudes float32)
+        """
+        incrementos, tabelas, amplitudes = [], [], []
+
+        for freq in frequencias:
+            incrementos.append(freq)
+            tabelas.append(self._banda(freq))
+            amplitudes.append(1.0 if freq < self.nyquist else 0.0)
+
+            for razao, amp in self.inarmonicos:
+                incrementos.append(razao * freq)
+                tabelas.append(self.indice_seno)
+                # Parcial acima de Nyquist fica muda (mantém o nº de osciladores)
+                amplitudes.append(amp if razao * freq < self.nyquist else 0.0)
+
+        incrementos = np.round(np.array(incrementos) / self.sample_rate * 2.0 ** 32)
+        return (
+            np.mod(incrementos, 2 ** 32).astype(np.uint32),
+            np.array(tabelas, dtype=np.intp) * (self.tamanho + 1),
+            np.array(amplitudes, dtype=np.float32),
+        )
+
+    def renderizar(self, frequencias, n_samples: int, fases=None):
+        """
+        Renderiza a soma das notas por acumulador de fase.
+
+        Args:
+            frequencias: Frequências (Hz) das notas
+            n_samples: Número de amostras a gerar
+            fases: Fases iniciais (uint32) dos osciladores, retornadas por
+                uma renderização anterior para continuar sem cliques.
+                None = fase zero.
+
+        Returns:
+            tuple: (onda mono float32, fases finais dos osciladores)
+        """
+        incrementos, deslocamentos, amplitudes = self.osciladores(frequencias)
+        n_osc = len(incrementos)
+        if fases is None:
+            fases = np.zeros(n_osc, dtype=np.uint32)
+
+        onda = np.empty(n_samples, dtype=np.float32)
+        bloco = max(1, min(BLOCO_WAVETABLE, n_samples))
+        passos = np.arange(bloco, dtype=np.uint32)
+        tabela = self.tabelas.ravel()
+
+        # Buffers reutilizados entre blocos
+        posicao = np.empty((n_osc, bloco), dtype=np.uint32)
+        indice = np.empty((n_osc, bloco), dtype=np.intp)
+        frac = np.empty((n_osc, bloco), dtype=np.float32)
+
+        for inicio in range(0, n_samples, bloco):
+            m = min(bloco, n_samples - inicio)
+            pos, idx, fr = posicao[:, :m], indice[:, :m], frac[:, :m]
+
+            # Fração entre duas amostras da tabela (bits baixos da fase)
+            np.multiply(incrementos[:, None], passos[:m], out=pos)
+            pos += fases[:, None]
+            np.bitwise_and(pos, self._mascara_frac, out=pos)
+            np.multiply(pos, self._escala_frac, out=fr)
+
+            # Índice na tabela (bits altos da fase)
+            np.multiply(incrementos[:, None], passos[:m], out=pos)
+            pos += fases[:, None]
+            np.right_shift(pos, self._bits_frac, out=pos)
+            np.add(pos, deslocamentos[:, None], out=idx)
+
+            # Interpolação linear entre tabela[i] e tabela[i + 1]
+            a = tabela.take(idx)
+            b = tabela.take(idx + 1)
+            b -= a
+            b *= fr
+            a += b
+            np.dot(amplitudes, a, out=onda[inicio:inicio + m])
+
+            fases = fases + incrementos * np.uint32(m)
+
+        return onda, fases
@@ -13,23 +13,58 @@ import math
 import numpy as np
 import os
 from enum import Enum
-from src.audio.synthesizer import Sintetizador, Timbre
+from src.audio.device import iniciar_audio
+from src.audio.voices import obter_vozes, GRUPO_SYNTH
+from src.audio.synthesizer import (
+    Sintetizador,
+    Timbre,
+    CAMADA_PADRAO,
+    camada_por_velocidade,
+    ganho_por_velocidade,
+)
+from src.audio.streaming import SintetizadorStreaming
 from src.audio.chord_sampler import ChordSampler
+from src.audio.lookahead import LookaheadPreparer
+from src.audio.backing_track import gerar_backing_track
+from src.audio.music_player import MusicPlayer
+from src.audio.audio_cache import AudioCacheManager
 from src.vision.tracker import HandTracker
+from src.vision.hand_motion import MedidorVelocidade, oitava_por_altura
 from src.vision.gesture_recognizer import GestureRecognizer, GestureType, GESTURE_EMOJI, GESTURE_NAMES
-from src.utils.data_loader import load_chords
+from src.utils.data_loader import load_chart
+from src.utils.latency import LatencyProbe
 from src.utils.paths import get_assets_path
+from src.game.layout import RenderTarget
+from src.game.scheduler import Scheduler
 from src.utils.config import (
     GESTURE_HOLD_TIME,
     SHOW_GESTURE_DEBUG,
     FAIL_MODE_ENABLED,
     PENALTY_TIME_SECONDS,
+    FAIL_RETRY_CHORD,
     SYNTH_ENABLED,
     REAL_AUDIO_ENABLED,
     REAL_SAMPLE_DURATION,
     SYNTH_DURATION,
+    SYNTH_STREAMING,
+    VELOCITY_ENABLED,
+    OCTAVE_FROM_HAND_HEIGHT,
+    VELOCITY_GAIN_MIN,
+    VELOCITY_GAIN_MAX,
+    LOOKAHEAD_CHORDS,
+    AUDIO_CACHE_MAX_MB,
+    BACKING_TRACK_ENABLED,
+    BACKING_TIMBRE,
+    BACKING_STRIKE_SECONDS,
     HINT_ENABLED,
     PREVIEW_DURATION,
+    SEEK_STEP_SECONDS,
+    TARGET_FPS,
+    LATENCY_PROBE,
+    RENDER_RESOLUTION,
+    WINDOW_RESOLUTION,
+    FULLSCREEN,
+    SMOOTH_UPSCALE,
 )
 
 
@@ -45,23 +80,60 @@ class GameState(Enum):
 
 
 class MusicGame:
-    def __init__(self):
+    def __init__(self, captura=None, tracker=None, chart=None, sonda=None, com_musica: bool = True):
+        """
+        Args:
+            captura: Fonte de quadros com read()/release() (padrão: webcam 0)
+            tracker: Detector de mãos com process(frame) (padrão: HandTracker)
+            chart: Mapa de acordes compilado (padrão: chords.json dos assets)
+            sonda: LatencyProbe que marca as etapas de cada gesto aceito
+                (padrão: uma nova se LATENCY_PROBE, senão nenhuma). Uma sonda
+                recebida é resumida por quem a passou, não ao sair do jogo
+            com_musica: False para não carregar a música nem gerar o backing
+                track (só os acordes sintetizados soam)
+        """
+        # Mixer antes de pygame.init(), senão o buffer pedido não tem efeito
+        self.audio = iniciar_audio()
+        self.vozes = obter_vozes()
         pygame.init()
-        self.WIDTH, self.HEIGHT = 1000, 700
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
+        # A cena é desenhada na resolução interna e ampliada uma vez para a janela
+        self.render_target = RenderTarget(
+            RENDER_RESOLUTION, WINDOW_RESOLUTION, FULLSCREEN, SMOOTH_UPSCALE
+        )
+        self.screen = self.render_target.surface
+        self.layout = self.render_target.layout
+        self.WIDTH, self.HEIGHT = self.screen.get_size()
         pygame.display.set_caption("Chord Hero AI - Gesture Game")
-        self.clock = pygame.time.Clock()
+        # Prazos das transições de estado (relógio monotônico)
+        self.scheduler = Scheduler()
 
-        self.synth = Sintetizador()
-        self.tracker = HandTracker()
+        # Sons prontos (acordes sintetizados e samples reais) com orçamento de memória
+        self.audio_cache = AudioCacheManager(AUDIO_CACHE_MAX_MB * 1024 * 1024)
+        self.synth = Sintetizador(cache=self.audio_cache)
+        # Acorde sustentado enquanto o gesto é mantido (opcional)
+        self.synth_stream = SintetizadorStreaming(self.synth) if SYNTH_STREAMING else None
+        self.voz_sustentada = None
+        self.tracker = tracker if tracker is not None else HandTracker()
+        # Velocidade da mão ao entrar no gesto (intensidade do acorde)
+        self.medidor_velocidade = MedidorVelocidade()
+        self.intensidade_gesto = 0.5
+        self.oitava_gesto = 0  # Pela altura da mão (OCTAVE_FROM_HAND_HEIGHT)
         self.gesture_recognizer = GestureRecognizer()
-        self.cap = cv2.VideoCapture(0)
+        self.cap = captura if captura is not None else cv2.VideoCapture(0)
+        # Latência gesto -> som por etapa (src.utils.latency)
+        self.sonda = sonda if sonda is not None else (LatencyProbe() if LATENCY_PROBE else None)
+        self._resumir_sonda = sonda is None
 
-        # Carregar dados
-        self.dados_chords = load_chords()
+        # Carregar e compilar o mapa de acordes (gestos e frequências já resolvidos)
+        self.dados_chords = chart if chart is not None else load_chart()
 
-        # Preparar áudio
-        self.carregar_musica()
+        # Preparar áudio (a música toca em blocos com relógio em amostras)
+        self.musica = MusicPlayer()
+        if com_musica:
+            self.carregar_musica()
+        else:
+            self.musica_path = None
+            self.usando_musica_real = False
         self.pre_carregar_acordes()
 
         # Estado do jogo
@@ -85,8 +157,6 @@ class MusicGame:
         self.TRANSITION_DURATION = 0.5    # Tempo mostrando "CORRETO!"
         
         # Controle de música
-        self.music_paused = True
-        self.pause_position = 0
         self.waiting_start_time = 0      # Quando começou a esperar o gesto
         
         # Controle de FAIL
@@ -110,41 +180,75 @@ class MusicGame:
         self.show_expected_gesture = True       # Mostrar gesto esperado (G para toggle)
         self.preview_start_time = 0             # Quando começou o preview
         
+        # Modo prática: loop A-B entre índices de acordes ([ e ] marcam, L limpa)
+        self.loop_a = None
+        self.loop_b = None
+        
         # Sampler de acordes reais
-        musica_path = os.path.join(get_assets_path(), "musica.mp3")
-        self.chord_sampler = ChordSampler(musica_path, REAL_SAMPLE_DURATION)
+        self.chord_sampler = ChordSampler(self.musica_path, REAL_SAMPLE_DURATION, cache=self.audio_cache)
+        # Quando o WAV mapeado estiver pronto, a música passa a tocar por ele
+        self.musica.fonte_pcm = self.chord_sampler.audio_mapeado
+        self.chord_sampler.extrair_samples(self.dados_chords.starts.tolist())
+        
+        # Sons dos próximos acordes preparados em segundo plano
+        self.lookahead = LookaheadPreparer(
+            self.synth, self.chord_sampler, self.dados_chords, LOOKAHEAD_CHORDS, SYNTH_DURATION
+        )
         
         # Fontes
         self.font_big = None
         self.font_medium = None
         self.font_small = None
         self.emoji_font = None  # Fonte especial para emojis
+        self.font_tiny = None
+        self.emoji_font_small = None
+        self.overlay = None
 
     def carregar_musica(self):
         # Preferir WAV (melhor para samples) sobre MP3
         wav_path = os.path.join(get_assets_path(), "musica.wav")
         mp3_path = os.path.join(get_assets_path(), "musica.mp3")
+        # Fonte dos samples reais (o sampler prefere o .wav de mesmo nome)
+        self.musica_path = mp3_path
+        ogg_path = os.path.join(get_assets_path(), "musica.ogg")
         
         if os.path.exists(wav_path):
-            pygame.mixer.music.load(wav_path)
-            pygame.mixer.music.set_volume(0.7)
+            self.musica.carregar(wav_path, 0.7)
             self.usando_musica_real = True
             print(f"Música WAV carregada: {wav_path}")
         elif os.path.exists(mp3_path):
-            pygame.mixer.music.load(mp3_path)
-            pygame.mixer.music.set_volume(0.5)
+            self.musica.carregar(mp3_path, 0.5)
             self.usando_musica_real = True
             print(f"Música MP3 carregada: {mp3_path}")
+        elif os.path.exists(ogg_path):
+            self.musica.carregar(ogg_path, 0.5)
+            self.usando_musica_real = True
+            print(f"Música OGG carregada: {ogg_path}")
         else:
-            print(f"Aviso: Nenhuma música encontrada.")
-            self.usando_musica_real = False
+            # Sem música: acompanhamento sintetizado do mapa de acordes
+            backing_path = None
+            if BACKING_TRACK_ENABLED:
+                backing_path = gerar_backing_track(
+                    self.dados_chords, self.synth, Timbre(BACKING_TIMBRE), BACKING_STRIKE_SECONDS
+                )
+            if backing_path:
+                self.musica.carregar(backing_path, 0.6)
+                self.usando_musica_real = True
+                self.musica_path = backing_path
+                print(f"Backing track carregado: {backing_path}")
+            else:
+                print(f"Aviso: Nenhuma música encontrada.")
+                self.usando_musica_real = False
 
     def pre_carregar_acordes(self):
         print("Sintetizando acordes...")
-        unique_chords = set(d["chord_majmin"] for d in self.dados_chords)
+        unique_chords = self.dados_chords.majmin_names
         for chord in unique_chords:
             self.synth.gerar_acorde(chord)
+            self.synth.gerar_acorde_curto(chord, SYNTH_DURATION)
         print(f"Acordes prontos! ({len(unique_chords)} acordes únicos)")
+        # Demais timbres em segundo plano (trocar com T não trava o jogo)
+        self.synth.pre_renderizar(unique_chords, SYNTH_DURATION)
 
     def iniciar_jogo(self):
         """Inicia o jogo com tela de preview."""
@@ -152,72 +256,199 @@ class MusicGame:
         self.score = 0
         self.acertos = 0
         self.erros = 0
+        self.limpar_loop()
         
         if self.acorde_index < len(self.dados_chords):
             self.acorde_atual = self.dados_chords[self.acorde_index]
+            self.lookahead.preparar(self.acorde_index)
             # Ir para preview primeiro
-            self.game_state = GameState.PREVIEW
-            self.preview_start_time = time.time()
+            self._trocar_estado(GameState.PREVIEW)
+            self.preview_start_time = self.scheduler.now()
+            self.scheduler.call_later(
+                PREVIEW_DURATION, self._iniciar_primeiro_acorde, start=self.preview_start_time
+            )
             print(f"Mostrando preview dos acordes por {PREVIEW_DURATION} segundos...")
     
-    def _iniciar_primeiro_acorde(self):
+    def _trocar_estado(self, novo_estado):
+        """Muda o estado do jogo e cancela os timers do estado anterior."""
+        self.scheduler.cancel_all()
+        self.game_state = novo_estado
+        # O acorde sustentado só continua durante o acerto e o trecho
+        if novo_estado not in (GameState.GESTURE_CORRECT, GameState.PLAYING):
+            self._soltar_voz_sustentada()
+    
+    def _soltar_voz_sustentada(self):
+        """Inicia o release do acorde sustentado, se houver."""
+        if self.voz_sustentada is not None:
+            self.voz_sustentada.soltar()
+            self.voz_sustentada = None
+
+    def _iniciar_primeiro_acorde(self, inicio=None):
         """Inicia o primeiro acorde após o preview."""
-        self.game_state = GameState.WAITING_FOR_GESTURE
-        self.waiting_start_time = time.time()
+        self._trocar_estado(GameState.WAITING_FOR_GESTURE)
+        self.waiting_start_time = inicio if inicio is not None else self.scheduler.now()
+        self._agendar_timeout()
         
         # Iniciar música pausada no início
         if self.usando_musica_real:
-            pygame.mixer.music.play()
-            pygame.mixer.music.pause()
-            self.music_paused = True
+            self.musica.posicionar(0.0)
         
-        print(f"Aguardando gesto para: {self.acorde_atual['chord_simple_pop']}")
+        print(f"Aguardando gesto para: {self.acorde_atual.chord_simple_pop}")
 
-    def avancar_acorde(self):
-        """Avança para o próximo acorde."""
+    def avancar_acorde(self, inicio=None):
+        """
+        Avança para o próximo acorde.
+        
+        Args:
+            inicio: Instante em que a espera começa (padrão: agora). Timers
+                passam o próprio vencimento para não acumular atraso.
+        """
+        # Loop A-B: ao passar do acorde B, voltar para o acorde A
+        if self.loop_b is not None and self.acorde_index >= self.loop_b:
+            self.ir_para_acorde(self.loop_a)
+            return
+        
+        # Após um FAIL a música ficou parada no início do acorde perdido
+        if self.game_state == GameState.FAIL:
+            self.ir_para_acorde(self.acorde_index + 1)
+            return
+        
         self.acorde_index += 1
         
         if self.acorde_index >= len(self.dados_chords):
-            # Fim da música
-            self.game_state = GameState.FINISHED
-            if self.usando_musica_real:
-                pygame.mixer.music.stop()
-            print("Fim do jogo!")
+            self._finalizar_jogo()
             return
         
         self.acorde_atual = self.dados_chords[self.acorde_index]
-        self.game_state = GameState.WAITING_FOR_GESTURE
-        self.waiting_start_time = time.time()  # Marcar início da espera
+        self.lookahead.preparar(self.acorde_index)
+        self._trocar_estado(GameState.WAITING_FOR_GESTURE)
+        # Marcar início da espera
+        self.waiting_start_time = inicio if inicio is not None else self.scheduler.now()
+        self._agendar_timeout()
         
         # Pausar música no início do novo acorde
         if self.usando_musica_real:
-            pygame.mixer.music.pause()
-            self.music_paused = True
+            self.musica.pausar()
         
         # Reset do estado de gesto
         self.gesture_start_time = 0
         self.gesture_hold_duration = 0
         self.last_correct_gesture = False
         
-        print(f"Próximo acorde: {self.acorde_atual['chord_simple_pop']}")
+        print(f"Próximo acorde: {self.acorde_atual.chord_simple_pop}")
+
+    def _finalizar_jogo(self):
+        """Fim da música."""
+        self._trocar_estado(GameState.FINISHED)
+        if self.usando_musica_real:
+            self.musica.parar()
+        print("Fim do jogo!")
+
+    def ir_para_acorde(self, index):
+        """Reinicia música e estado de acorde em qualquer acorde do mapa."""
+        if index >= len(self.dados_chords):
+            self.acorde_index = len(self.dados_chords)
+            self._finalizar_jogo()
+            return
+        
+        self.acorde_index = max(0, index)
+        self.acorde_atual = self.dados_chords[self.acorde_index]
+        self.lookahead.preparar(self.acorde_index)
+        self._trocar_estado(GameState.WAITING_FOR_GESTURE)
+        self.waiting_start_time = self.scheduler.now()
+        self._agendar_timeout()
+        
+        # Reposicionar a música no início do acorde, pausada
+        if self.usando_musica_real:
+            self._posicionar_musica(self.acorde_atual.start)
+        
+        if self.chord_sampler.is_playing:
+            self.chord_sampler.parar_sample()
+        
+        # Reset do estado de gesto
+        self.gesture_start_time = 0
+        self.gesture_hold_duration = 0
+        self.last_correct_gesture = False
+        
+        print(f"Indo para o acorde {self.acorde_index + 1}: {self.acorde_atual.chord_simple_pop}")
+
+    def repetir_acorde(self, inicio=None):
+        """Volta a música ao início do acorde atual (ex: tentar de novo após um FAIL)."""
+        self.ir_para_acorde(self.acorde_index)
+
+    def reiniciar_rapido(self):
+        """Recomeça do primeiro acorde, sem intro/preview e sem recarregar a música."""
+        self.score = 0
+        self.acertos = 0
+        self.erros = 0
+        self.ir_para_acorde(0)
+
+    def buscar_tempo(self, tempo):
+        """Vai para o acorde ativo em um instante da música (busca O(log n))."""
+        index = self.dados_chords.index_at(tempo)
+        if index >= 0:
+            self.ir_para_acorde(index)
+
+    def _posicionar_musica(self, tempo):
+        """Reinicia a música pausada a partir de uma posição em segundos."""
+        self.musica.posicionar(tempo)
+
+    def marcar_loop(self, ponto):
+        """Marca o ponto A ou B do loop de prática no acorde atual."""
+        if ponto == "A":
+            self.loop_a = self.acorde_index
+            if self.loop_b is not None and self.loop_b < self.loop_a:
+                self.loop_b = None
+        else:
+            self.loop_b = self.acorde_index
+            if self.loop_a is None or self.loop_a > self.loop_b:
+                self.loop_a = self.loop_b
+        print(f"Loop: A={self.loop_a} B={self.loop_b}")
+
+    def limpar_loop(self):
+        """Desativa o loop de prática."""
+        if self.loop_a is None and self.loop_b is None:
+            return
+        self.loop_a = None
+        self.loop_b = None
+        print("Loop desativado")
 
     def tocar_acorde_e_avancar(self):
         """Toca o som do acorde e prepara para tocar a música."""
         if self.acorde_atual is None:
             return
         
-        nome_completo = self.acorde_atual["chord_majmin"]
+        nome_completo = self.acorde_atual.chord_majmin
+        if self.sonda is not None:
+            self.sonda.gesto_aceito()
         
         # 1. Tocar som sintetizado (feedback rápido) - opcional
-        if self.synth_enabled:
-            som_synth = self.synth.gerar_acorde_curto(nome_completo, SYNTH_DURATION)
+        # Intensidade: volume na reprodução e camada de brilho pré-renderizada
+        if VELOCITY_ENABLED:
+            volume = ganho_por_velocidade(self.intensidade_gesto, VELOCITY_GAIN_MIN, VELOCITY_GAIN_MAX)
+            camada = camada_por_velocidade(self.intensidade_gesto)
+        else:
+            volume, camada = 0.5, CAMADA_PADRAO
+        
+        if self.synth_enabled and self.synth_stream is not None:
+            # Soa enquanto o gesto for mantido
+            self._soltar_voz_sustentada()
+            self.voz_sustentada = self.synth_stream.iniciar(
+                nome_completo, volume=volume, oitava=self.oitava_gesto, camada=camada
+            )
+        elif self.synth_enabled:
+            som_synth = self.synth.acorde_para_tocar(
+                nome_completo, SYNTH_DURATION, camada=camada, oitava=self.oitava_gesto
+            )
             if som_synth:
-                som_synth.set_volume(0.5)
-                som_synth.play()
+                self.vozes.tocar(GRUPO_SYNTH, som_synth, volume=volume)
+        
+        if self.sonda is not None:
+            self.sonda.som_disparado(nome_completo)
         
         # 2. Tocar sample real da música - opcional
         if self.real_audio_enabled and self.chord_sampler.music_loaded:
-            chord_start_time = self.acorde_atual["start"]
+            chord_start_time = self.acorde_atual.start
             self.chord_sampler.tocar_sample(chord_start_time)
         
         # Atualizar score
@@ -225,64 +456,92 @@ class MusicGame:
         self.acertos += 1
         
         # Mostrar feedback de acerto
-        self.game_state = GameState.GESTURE_CORRECT
-        self.transition_start_time = time.time()
+        self._trocar_estado(GameState.GESTURE_CORRECT)
+        self.transition_start_time = self.scheduler.now()
+        self.scheduler.call_later(
+            self.TRANSITION_DURATION, self._iniciar_trecho, start=self.transition_start_time
+        )
         
         # Despausar música - ela toca o acorde naturalmente
-        if self.usando_musica_real and self.music_paused:
+        if self.usando_musica_real and self.musica.pausada:
             # Parar sample para evitar duplicação (música principal assume)
             if self.chord_sampler.is_playing:
                 self.chord_sampler.parar_sample()
-            pygame.mixer.music.unpause()
-            self.music_paused = False
+            self.musica.retomar()
 
     def get_music_time(self):
         """Retorna o tempo atual da música em segundos."""
         if self.usando_musica_real:
-            return pygame.mixer.music.get_pos() / 1000.0
+            # Posição em amostras do stream da música, descontada a latência de saída
+            return self.musica.tempo()
         else:
             return 0
 
-    def update_game_logic(self, landmarks):
-        """Atualiza a lógica do jogo baseada no estado atual."""
+    def _agendar_timeout(self):
+        """Agenda (ou cancela) o timeout do FAIL MODE para o acorde em espera."""
+        self.scheduler.cancel_tag("timeout")
+        if self.fail_mode_enabled and self.game_state == GameState.WAITING_FOR_GESTURE:
+            # Tempo limite baseado na duração do acorde
+            self.scheduler.call_at(
+                self.waiting_start_time + self.acorde_atual.duration,
+                self._entrar_fail_mode,
+                tag="timeout",
+            )
+
+    def _iniciar_trecho(self, inicio):
+        """Fim do feedback de acerto: tocar música até o fim do acorde."""
+        self._trocar_estado(GameState.PLAYING)
         
-        if self.game_state == GameState.INTRO:
-            # Aguardando início
-            return
+        if self.usando_musica_real:
+            restante = self.acorde_atual.end - self.get_music_time()
+        else:
+            # Sem música: o trecho dura o que sobra do acorde após a transição
+            restante = self.acorde_atual.duration - self.TRANSITION_DURATION
+        self.scheduler.call_at(inicio + max(0.0, restante), self._fim_do_trecho)
+
+    def _fim_do_trecho(self, vencimento):
+        """Prazo do fim do acorde: confere o relógio da música e avança."""
+        if self.usando_musica_real and self.musica.ocupado():
+            restante = self.acorde_atual.end - self.get_music_time()
+            if restante > 0.001:
+                # A música atrasou em relação ao relógio (buffer/pausa): reagendar
+                self.scheduler.call_at(vencimento + restante, self._fim_do_trecho)
+                return
+        self.avancar_acorde(vencimento)
+
+    def update_game_logic(self, landmarks):
+        """
+        Atualiza a lógica do jogo baseada no estado atual.
         
-        elif self.game_state == GameState.PREVIEW:
-            # Tela de preview - aguardar tempo ou ESPAÇO para pular
-            elapsed = time.time() - self.preview_start_time
-            if elapsed >= PREVIEW_DURATION:
-                self._iniciar_primeiro_acorde()
+        As transições por tempo (preview, acerto, fim do trecho, penalidade
+        e timeout) são timers do ``self.scheduler``; aqui fica apenas o que
+        depende do frame da câmera.
+        """
         
-        elif self.game_state == GameState.WAITING_FOR_GESTURE:
+        if self.game_state == GameState.WAITING_FOR_GESTURE:
             if self.acorde_atual is None:
                 return
             
-            # Calcular tempo limite baseado na duração do acorde
-            chord_duration = self.acorde_atual["end"] - self.acorde_atual["start"]
-            time_waiting = time.time() - self.waiting_start_time
-            
-            # Verificar timeout (FAIL MODE)
-            if self.fail_mode_enabled and time_waiting >= chord_duration:
-                self._entrar_fail_mode()
-                return
-            
             # Verificar gesto
-            chord_name = self.acorde_atual["chord_simple_pop"]
-            is_correct, confidence, detected_gesture = self.gesture_recognizer.is_gesture_correct(
-                landmarks, chord_name
+            is_correct, confidence, detected_gesture = self.gesture_recognizer.check_gesture(
+                landmarks, self.acorde_atual.gesture
             )
             
             if is_correct:
                 if not self.last_correct_gesture:
                     # Começou a fazer o gesto correto agora
-                    self.gesture_start_time = time.time()
+                    if self.sonda is not None:
+                        self.sonda.gesto_iniciado()
+                    self.gesture_start_time = self.scheduler.now()
                     self.last_correct_gesture = True
+                    # Velocidade do movimento até a posição do gesto
+                    self.intensidade_gesto = self.medidor_velocidade.intensidade()
+                    posicao = self.medidor_velocidade.posicao()
+                    if OCTAVE_FROM_HAND_HEIGHT and posicao is not None:
+                        self.oitava_gesto = oitava_por_altura(posicao[1])
                 
                 # Calcular quanto tempo está segurando
-                self.gesture_hold_duration = time.time() - self.gesture_start_time
+                self.gesture_hold_duration = self.scheduler.now() - self.gesture_start_time
                 
                 # Se segurou tempo suficiente, aceitar
                 if self.gesture_hold_duration >= GESTURE_HOLD_TIME:
@@ -293,43 +552,22 @@ class MusicGame:
                 self.gesture_start_time = 0
                 self.gesture_hold_duration = 0
         
-        elif self.game_state == GameState.GESTURE_CORRECT:
-            # Mostrando feedback de acerto
-            elapsed = time.time() - self.transition_start_time
-            
-            if elapsed >= self.TRANSITION_DURATION:
-                # Estado de transição: tocar música até o fim do acorde
-                self.game_state = GameState.PLAYING
-        
-        elif self.game_state == GameState.PLAYING:
-            # Música tocando, verificar se chegou no próximo acorde
-            if self.acorde_atual is None:
-                return
-            
-            music_time = self.get_music_time()
-            
-            # Verificar se passou do fim do acorde atual
-            if music_time >= self.acorde_atual["end"]:
-                self.avancar_acorde()
-        
-        elif self.game_state == GameState.FAIL:
-            # Modo FAIL - aguardar tempo de penalidade
-            tempo_na_penalidade = time.time() - self.fail_start_time
-            
-            if tempo_na_penalidade >= PENALTY_TIME_SECONDS:
-                # Sair do FAIL e avançar para próximo acorde
-                self.avancar_acorde()
-        
-        elif self.game_state == GameState.FINISHED:
-            # Jogo terminou
-            pass
+        elif self.voz_sustentada is not None:
+            # Acorde sustentado: soltar quando o jogador desfizer o gesto
+            is_correct, _, _ = self.gesture_recognizer.check_gesture(landmarks, self.acorde_atual.gesture)
+            if not is_correct:
+                self._soltar_voz_sustentada()
     
-    def _entrar_fail_mode(self):
+    def _entrar_fail_mode(self, inicio=None):
         """Entra no modo de penalidade quando o jogador não faz o gesto a tempo."""
-        self.game_state = GameState.FAIL
-        self.fail_start_time = time.time()
+        self._trocar_estado(GameState.FAIL)
+        self.fail_start_time = inicio if inicio is not None else self.scheduler.now()
         self.erros += 1
         
+        # Após a penalidade, repetir o acorde perdido ou avançar para o próximo
+        depois = self.repetir_acorde if FAIL_RETRY_CHORD else self.avancar_acorde
+        self.scheduler.call_later(PENALTY_TIME_SECONDS, depois, start=self.fail_start_time)
+        
         # Tocar som de erro
         self.synth.tocar_som_erro()
         
@@ -338,10 +576,11 @@ class MusicGame:
     def draw_ui(self, frame_cv, landmarks):
         """Desenha a interface do jogo."""
         # Preparar fontes (lazy loading)
+        s = self.layout.s
         if self.font_big is None:
-            self.font_big = pygame.font.SysFont("Arial", 80, bold=True)
-            self.font_medium = pygame.font.SysFont("Arial", 40, bold=True)
-            self.font_small = pygame.font.SysFont("Arial", 28)
+            self.font_big = pygame.font.SysFont("Arial", s(80), bold=True)
+            self.font_medium = pygame.font.SysFont("Arial", s(40), bold=True)
+            self.font_small = pygame.font.SysFont("Arial", s(28))
         
         # Converter câmera para Pygame
         frame_cv = np.rot90(frame_cv)
@@ -349,13 +588,14 @@ class MusicGame:
         frame_surf = pygame.surfarray.make_surface(frame_cv)
         frame_surf = pygame.transform.scale(frame_surf, (self.WIDTH, self.HEIGHT))
 
-        # Overlay escuro
-        overlay = pygame.Surface((self.WIDTH, self.HEIGHT))
-        overlay.set_alpha(120)
-        overlay.fill((20, 20, 40))
+        # Overlay escuro (criado uma vez na resolução interna)
+        if self.overlay is None:
+            self.overlay = pygame.Surface((self.WIDTH, self.HEIGHT))
+            self.overlay.set_alpha(120)
+            self.overlay.fill((20, 20, 40))
 
         self.screen.blit(frame_surf, (0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
 
         cx, cy = self.WIDTH // 2, self.HEIGHT // 2
 
@@ -389,39 +629,40 @@ class MusicGame:
 
     def _draw_intro_screen(self, cx, cy):
         """Tela inicial do jogo."""
+        s = self.layout.s
         # Inicializar emoji_font se necessário
         if self.emoji_font is None:
             try:
-                self.emoji_font = pygame.freetype.SysFont("Segoe UI Emoji", 60)
+                self.emoji_font = pygame.freetype.SysFont("Segoe UI Emoji", self.layout.s(60))
             except:
-                self.emoji_font = pygame.freetype.SysFont("Arial", 60)
+                self.emoji_font = pygame.freetype.SysFont("Arial", self.layout.s(60))
         
         # Título
         title = self.font_big.render("CHORD HERO AI", True, (0, 200, 255))
-        title_rect = title.get_rect(center=(cx, cy - 120))
+        title_rect = title.get_rect(center=(cx, cy - s(120)))
         self.screen.blit(title, title_rect)
         
         # Subtítulo
         subtitle = self.font_medium.render("Jogo de Gestos Musicais", True, (255, 255, 255))
-        subtitle_rect = subtitle.get_rect(center=(cx, cy - 50))
+        subtitle_rect = subtitle.get_rect(center=(cx, cy - s(50)))
         self.screen.blit(subtitle, subtitle_rect)
         
         # Instruções
         instr1 = self.font_small.render("Faça o gesto correto para cada acorde!", True, (200, 200, 200))
-        instr1_rect = instr1.get_rect(center=(cx, cy + 10))
+        instr1_rect = instr1.get_rect(center=(cx, cy + s(10)))
         self.screen.blit(instr1, instr1_rect)
         
         # Gestos disponíveis - usando emojis renderizados com freetype
         gestos_label = self.font_small.render("Gestos disponíveis:", True, (150, 200, 255))
-        gestos_label_rect = gestos_label.get_rect(center=(cx, cy + 50))
+        gestos_label_rect = gestos_label.get_rect(center=(cx, cy + s(50)))
         self.screen.blit(gestos_label, gestos_label_rect)
         
         # Desenhar emojis dos gestos em linha
         emojis = ["✋", "✊", "✌", "👍", "👆"]  # ✌ sem variation selector para centralizar melhor
         nomes = ["Mão", "Punho", "Paz", "Joinha", "Apontar"]
-        icon_spacing = 130
+        icon_spacing = s(130)
         start_x = cx - (len(emojis) - 1) * icon_spacing // 2
-        icon_y = cy + 100
+        icon_y = cy + s(100)
         
         for i, (emoji, nome) in enumerate(zip(emojis, nomes)):
             icon_x = start_x + i * icon_spacing
@@ -433,46 +674,37 @@ class MusicGame:
             
             # Nome abaixo
             nome_text = self.font_small.render(nome, True, (120, 160, 200))
-            nome_rect = nome_text.get_rect(center=(icon_x, icon_y + 45))
+            nome_rect = nome_text.get_rect(center=(icon_x, icon_y + s(45)))
             self.screen.blit(nome_text, nome_rect)
         
         # Botão de start (pulsando)
-        pulse = math.sin(time.time() * 4) * 10
+        pulse = math.sin(time.time() * 4) * s(10)
         start_text = self.font_medium.render("PRESSIONE ESPAÇO PARA INICIAR", True, (0, 255, 100))
-        start_rect = start_text.get_rect(center=(cx, cy + 200 + pulse))
+        start_rect = start_text.get_rect(center=(cx, cy + s(200) + pulse))
         self.screen.blit(start_text, start_rect)
 
     def _draw_preview_screen(self, cx, cy):
         """Tela de preview mostrando todos os acordes e gestos da música."""
+        s = self.layout.s
         # Inicializar fontes se necessário
         if self.emoji_font is None:
             try:
-                self.emoji_font = pygame.freetype.SysFont("Segoe UI Emoji", 40)
+                self.emoji_font = pygame.freetype.SysFont("Segoe UI Emoji", self.layout.s(40))
             except:
-                self.emoji_font = pygame.freetype.SysFont("Arial", 40)
+                self.emoji_font = pygame.freetype.SysFont("Arial", self.layout.s(40))
         
         # Calcular tempo restante
-        elapsed = time.time() - self.preview_start_time
+        elapsed = self.scheduler.now() - self.preview_start_time
         tempo_restante = max(0, PREVIEW_DURATION - elapsed)
         progresso = elapsed / PREVIEW_DURATION
         
         # Subtítulo (título removido para layout mais limpo)
         subtitle = self.font_small.render("Estude os gestos antes de jogar!", True, (200, 200, 200))
-        subtitle_rect = subtitle.get_rect(center=(cx, 80))
+        subtitle_rect = subtitle.get_rect(center=(cx, s(80)))
         self.screen.blit(subtitle, subtitle_rect)
         
-        # Coletar acordes únicos com seus gestos
-        acordes_unicos = {}
-        for chord_data in self.dados_chords:
-            chord_name = chord_data["chord_simple_pop"]
-            if chord_name not in acordes_unicos:
-                expected_gesture = self.gesture_recognizer.get_expected_gesture(chord_name)
-                emoji = self.gesture_recognizer.get_gesture_emoji(expected_gesture)
-                nome_gesto = self.gesture_recognizer.get_gesture_name(expected_gesture)
-                acordes_unicos[chord_name] = (emoji, nome_gesto)
-        
-        # Desenhar lista de acordes em grid
-        acordes_list = list(acordes_unicos.items())
+        # Acordes únicos com seus gestos (resolvidos na compilação do mapa)
+        acordes_list = self.dados_chords.pop_chords
         num_acordes = len(acordes_list)
         
         # Layout: máximo 3 colunas
@@ -481,15 +713,15 @@ class MusicGame:
         rows = (num_acordes + cols - 1) // cols
         
         # Dimensões do card (compacto: só acorde + emoji)
-        card_width = 180
-        card_height = 70
-        spacing_x = 20
-        spacing_y = 10
+        card_width = s(180)
+        card_height = s(70)
+        spacing_x = s(20)
+        spacing_y = s(10)
         
         # Calcular posição inicial (movida mais para baixo)
         total_width = cols * card_width + (cols - 1) * spacing_x
         start_x = cx - total_width // 2
-        start_y = 180
+        start_y = s(180)
         
         # Área de scroll se necessário
         max_visible_rows = 5
@@ -500,7 +732,7 @@ class MusicGame:
             scroll_offset = 0
         
         # Desenhar cada acorde
-        for idx, (chord_name, (emoji, nome_gesto)) in enumerate(acordes_list):
+        for idx, chord in enumerate(acordes_list):
             row = idx // cols
             col = idx % cols
             
@@ -516,17 +748,17 @@ class MusicGame:
             # Fundo do card
             card_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
             card_surface.fill((30, 40, 60, 200))
-            pygame.draw.rect(card_surface, (80, 100, 140), (0, 0, card_width, card_height), 2, border_radius=8)
+            pygame.draw.rect(card_surface, (80, 100, 140), (0, 0, card_width, card_height), s(2), border_radius=s(8))
             self.screen.blit(card_surface, (x, y))
             
             # Nome do acorde
-            chord_text = self.font_medium.render(chord_name, True, (255, 255, 255))
-            chord_rect = chord_text.get_rect(midleft=(x + 20, y + card_height // 2))
+            chord_text = self.font_medium.render(chord.chord_simple_pop, True, (255, 255, 255))
+            chord_rect = chord_text.get_rect(midleft=(x + s(20), y + card_height // 2))
             self.screen.blit(chord_text, chord_rect)
             
             # Emoji do gesto (centralizado à direita do card)
-            emoji_surf, emoji_rect = self.emoji_font.render(emoji, (150, 200, 255))
-            emoji_rect.midright = (x + card_width - 20, y + card_height // 2)
+            emoji_surf, emoji_rect = self.emoji_font.render(chord.emoji, (150, 200, 255))
+            emoji_rect.midright = (x + card_width - s(20), y + card_height // 2)
             self.screen.blit(emoji_surf, emoji_rect)
         
         # Contador de acordes
@@ -534,43 +766,43 @@ class MusicGame:
             f"Total: {len(self.dados_chords)} acordes ({num_acordes} únicos)", 
             True, (150, 150, 180)
         )
-        total_rect = total_text.get_rect(center=(cx, self.HEIGHT - 130))
+        total_rect = total_text.get_rect(center=(cx, self.HEIGHT - s(130)))
         self.screen.blit(total_text, total_rect)
         
         # Barra de progresso
-        bar_width = 500
-        bar_height = 20
+        bar_width = s(500)
+        bar_height = s(20)
         bar_x = cx - bar_width // 2
-        bar_y = self.HEIGHT - 90
+        bar_y = self.HEIGHT - s(90)
         
         # Fundo da barra
-        pygame.draw.rect(self.screen, (50, 50, 70), (bar_x, bar_y, bar_width, bar_height), border_radius=10)
+        pygame.draw.rect(self.screen, (50, 50, 70), (bar_x, bar_y, bar_width, bar_height), border_radius=s(10))
         # Progresso
         fill_width = int(bar_width * progresso)
         if fill_width > 0:
-            pygame.draw.rect(self.screen, (0, 200, 255), (bar_x, bar_y, fill_width, bar_height), border_radius=10)
+            pygame.draw.rect(self.screen, (0, 200, 255), (bar_x, bar_y, fill_width, bar_height), border_radius=s(10))
         # Borda
-        pygame.draw.rect(self.screen, (100, 150, 200), (bar_x, bar_y, bar_width, bar_height), 2, border_radius=10)
+        pygame.draw.rect(self.screen, (100, 150, 200), (bar_x, bar_y, bar_width, bar_height), s(2), border_radius=s(10))
         
         # Tempo restante
         tempo_text = self.font_medium.render(f"Iniciando em {tempo_restante:.1f}s", True, (255, 255, 255))
-        tempo_rect = tempo_text.get_rect(center=(cx, self.HEIGHT - 50))
+        tempo_rect = tempo_text.get_rect(center=(cx, self.HEIGHT - s(50)))
         self.screen.blit(tempo_text, tempo_rect)
         
         # Dica para pular
         pular_text = self.font_small.render("Pressione ESPAÇO para pular", True, (100, 150, 100))
-        pular_rect = pular_text.get_rect(center=(cx, self.HEIGHT - 20))
+        pular_rect = pular_text.get_rect(center=(cx, self.HEIGHT - s(20)))
         self.screen.blit(pular_text, pular_rect)
 
     def _draw_waiting_screen(self, cx, cy, landmarks):
         """Tela de espera pelo gesto correto."""
         if self.acorde_atual is None:
             return
+        s = self.layout.s
         
-        chord_name = self.acorde_atual["chord_simple_pop"]
-        expected_gesture = self.gesture_recognizer.get_expected_gesture(chord_name)
-        expected_emoji = self.gesture_recognizer.get_gesture_emoji(expected_gesture)
-        expected_name = self.gesture_recognizer.get_gesture_name(expected_gesture)
+        chord_name = self.acorde_atual.chord_simple_pop
+        expected_emoji = self.acorde_atual.emoji
+        expected_name = self.acorde_atual.gesture_name
         
         # Detectar gesto atual
         detected_gesture, confidence = self.gesture_recognizer.detect_gesture(landmarks)
@@ -578,25 +810,25 @@ class MusicGame:
         
         # Nome do acorde
         chord_text = self.font_big.render(chord_name, True, (255, 255, 255))
-        chord_rect = chord_text.get_rect(center=(cx, cy - 150))
+        chord_rect = chord_text.get_rect(center=(cx, cy - s(150)))
         self.screen.blit(chord_text, chord_rect)
         
         # Inicializar emoji_font se necessário
         if self.emoji_font is None:
             try:
-                self.emoji_font = pygame.freetype.SysFont("Segoe UI Emoji", 60)
+                self.emoji_font = pygame.freetype.SysFont("Segoe UI Emoji", self.layout.s(60))
             except:
-                self.emoji_font = pygame.freetype.SysFont("Arial", 60)
+                self.emoji_font = pygame.freetype.SysFont("Arial", self.layout.s(60))
         
         if self.show_expected_gesture:
             # Instrução
             instr = self.font_small.render("Faça o gesto:", True, (200, 200, 200))
-            instr_rect = instr.get_rect(center=(cx, cy - 80))
+            instr_rect = instr.get_rect(center=(cx, cy - s(80)))
             self.screen.blit(instr, instr_rect)
             
             # Círculo do gesto esperado
-            raio = 100
-            centro_y = cy + 30  # Centro Y do círculo
+            raio = s(100)
+            centro_y = cy + s(30)  # Centro Y do círculo
             cor_circulo = (0, 200, 255)  # Azul
             
             # Se está fazendo o gesto correto, mudar cor
@@ -609,7 +841,7 @@ class MusicGame:
                 )  # Transição para verde
                 
                 # Arco de progresso (centralizado, um pouco maior que o círculo)
-                raio_arco = raio + 15
+                raio_arco = raio + s(15)
                 rect_arc = pygame.Rect(
                     cx - raio_arco, 
                     centro_y - raio_arco, 
@@ -618,18 +850,18 @@ class MusicGame:
                 )
                 angulo_inicio = math.pi / 2
                 angulo_fim = angulo_inicio - (2 * math.pi * progress)
-                pygame.draw.arc(self.screen, (0, 255, 100), rect_arc, angulo_fim, angulo_inicio, 8)
+                pygame.draw.arc(self.screen, (0, 255, 100), rect_arc, angulo_fim, angulo_inicio, s(8))
             
-            pygame.draw.circle(self.screen, cor_circulo, (cx, centro_y), raio, 5)
+            pygame.draw.circle(self.screen, cor_circulo, (cx, centro_y), raio, s(5))
             
             # Emoji do gesto esperado (grande, no centro)
             emoji_surface, emoji_rect = self.emoji_font.render(expected_emoji, (255, 255, 255))
-            emoji_rect.center = (cx, cy + 30)
+            emoji_rect.center = (cx, centro_y)
             self.screen.blit(emoji_surface, emoji_rect)
             
             # Nome do gesto esperado
             gesto_name = self.font_small.render(expected_name, True, (200, 200, 200))
-            gesto_rect = gesto_name.get_rect(center=(cx, cy + 150))
+            gesto_rect = gesto_name.get_rect(center=(cx, cy + s(150)))
             self.screen.blit(gesto_name, gesto_rect)
         else:
             # Modo sem dica - mostrar painel de referência de todos os gestos no lado direito
@@ -638,8 +870,8 @@ class MusicGame:
         # Mostrar gesto detectado (canto inferior direito, layout vertical)
         if landmarks is not None and self.emoji_font:
             # Posição base (canto inferior direito)
-            base_x = self.WIDTH - 120
-            base_y = self.HEIGHT - 120
+            base_x = self.WIDTH - s(120)
+            base_y = self.HEIGHT - s(120)
             
             # Emoji do gesto detectado (grande, em cima)
             emoji_surf, emoji_rect = self.emoji_font.render(detected_emoji, (255, 255, 255))
@@ -649,34 +881,34 @@ class MusicGame:
             # Nome do gesto (abaixo do emoji)
             detected_name = self.gesture_recognizer.get_gesture_name(detected_gesture)
             name_text = self.font_small.render(detected_name, True, (180, 180, 180))
-            name_rect = name_text.get_rect(center=(base_x, base_y + 45))
+            name_rect = name_text.get_rect(center=(base_x, base_y + s(45)))
             self.screen.blit(name_text, name_rect)
             
             # Barra de confiança (abaixo do nome)
-            bar_width = 100
-            bar_height = 8
+            bar_width = s(100)
+            bar_height = s(8)
             bar_x = base_x - bar_width // 2
-            bar_y = base_y + 70
+            bar_y = base_y + s(70)
             
             # Fundo da barra
-            pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
+            pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height), border_radius=s(4))
             # Preenchimento
             fill_width = int(bar_width * confidence)
             if fill_width > 0:
-                pygame.draw.rect(self.screen, (0, 200, 255), (bar_x, bar_y, fill_width, bar_height), border_radius=4)
+                pygame.draw.rect(self.screen, (0, 200, 255), (bar_x, bar_y, fill_width, bar_height), border_radius=s(4))
         
         # Barra de tempo restante (se FAIL mode ativo)
         if self.fail_mode_enabled and self.acorde_atual:
-            chord_duration = self.acorde_atual["end"] - self.acorde_atual["start"]
-            time_waiting = time.time() - self.waiting_start_time
+            chord_duration = self.acorde_atual.duration
+            time_waiting = self.scheduler.now() - self.waiting_start_time
             tempo_restante = chord_duration - time_waiting
             progresso_tempo = time_waiting / chord_duration
             
             # Barra de tempo no topo
-            bar_width = 600
-            bar_height = 12
+            bar_width = s(600)
+            bar_height = s(12)
             bar_x = cx - bar_width // 2
-            bar_y = 660
+            bar_y = self.HEIGHT - s(40)
             
             # Cor muda de verde para vermelho conforme o tempo passa
             if progresso_tempo < 0.5:
@@ -687,15 +919,15 @@ class MusicGame:
                 cor_barra = (255, 100, 100)  # Vermelho
             
             # Fundo da barra
-            pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height), border_radius=3)
+            pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height), border_radius=s(3))
             # Preenchimento (diminui conforme tempo passa)
             fill_width = int(bar_width * (1 - progresso_tempo))
             if fill_width > 0:
-                pygame.draw.rect(self.screen, cor_barra, (bar_x, bar_y, fill_width, bar_height), border_radius=3)
+                pygame.draw.rect(self.screen, cor_barra, (bar_x, bar_y, fill_width, bar_height), border_radius=s(3))
             
             # Texto do tempo
             tempo_text = self.font_small.render(f"Tempo: {tempo_restante:.1f}s", True, cor_barra)
-            tempo_rect = tempo_text.get_rect(center=(cx, bar_y - 20))
+            tempo_rect = tempo_text.get_rect(center=(cx, bar_y - s(20)))
             self.screen.blit(tempo_text, tempo_rect)
         
         # Debug de gestos
@@ -710,15 +942,17 @@ class MusicGame:
         if self.acorde_atual is None:
             return
         
+        s = self.layout.s
+        
         # Configurações do painel (posicionado abaixo do HUD)
-        panel_x = 15
-        panel_y = 200  # Movido para baixo para não sobrepor o HUD
-        panel_width = 200
-        line_height = 22
+        panel_x = s(15)
+        panel_y = s(200)  # Movido para baixo para não sobrepor o HUD
+        panel_width = s(200)
+        line_height = s(22)
         
         # Fonte menor para o painel
-        if not hasattr(self, 'font_tiny') or self.font_tiny is None:
-            self.font_tiny = pygame.font.SysFont("Arial", 16)
+        if self.font_tiny is None:
+            self.font_tiny = pygame.font.SysFont("Arial", s(16))
         
         # Campos a exibir (label: key)
         chord_fields = [
@@ -736,101 +970,96 @@ class MusicGame:
         
         # Calcular altura do painel
         num_fields = len(chord_fields) + 2  # +2 para timing info
-        panel_height = num_fields * line_height + 30
+        panel_height = num_fields * line_height + s(30)
         
         # Desenhar fundo do painel com transparência
         panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
         panel_surface.fill((20, 20, 40, 180))
-        pygame.draw.rect(panel_surface, (80, 80, 120), (0, 0, panel_width, panel_height), 2, border_radius=5)
+        pygame.draw.rect(panel_surface, (80, 80, 120), (0, 0, panel_width, panel_height), s(2), border_radius=s(5))
         self.screen.blit(panel_surface, (panel_x, panel_y))
         
         # Título do painel
         title = self.font_tiny.render("📋 Acorde (chords.json)", True, (150, 200, 255))
-        self.screen.blit(title, (panel_x + 8, panel_y + 6))
+        self.screen.blit(title, (panel_x + s(8), panel_y + s(6)))
         
         # Desenhar cada campo
-        y_offset = panel_y + 28
+        y_offset = panel_y + s(28)
         for label, key in chord_fields:
-            value = self.acorde_atual.get(key, "N/A")
-            if value is None:
-                value = "-"
+            value = self.acorde_atual.fields[key]
             
             # Label
             label_text = self.font_tiny.render(f"{label}:", True, (120, 140, 180))
-            self.screen.blit(label_text, (panel_x + 8, y_offset))
+            self.screen.blit(label_text, (panel_x + s(8), y_offset))
             
             # Valor (destacado)
-            value_text = self.font_tiny.render(str(value), True, (255, 255, 255))
-            self.screen.blit(value_text, (panel_x + 100, y_offset))
+            value_text = self.font_tiny.render(value, True, (255, 255, 255))
+            self.screen.blit(value_text, (panel_x + s(100), y_offset))
             
             y_offset += line_height
         
         # Timing info
-        y_offset += 5
-        start = self.acorde_atual.get("start", 0)
-        end = self.acorde_atual.get("end", 0)
+        y_offset += s(5)
+        start = self.acorde_atual.start
+        end = self.acorde_atual.end
         timing_text = self.font_tiny.render(f"⏱ {start:.2f}s → {end:.2f}s", True, (180, 180, 200))
-        self.screen.blit(timing_text, (panel_x + 8, y_offset))
+        self.screen.blit(timing_text, (panel_x + s(8), y_offset))
 
     def _draw_gesture_reference_panel(self):
         """Desenha um painel de referência com todos os gestos possíveis (acorde + emoji)."""
+        s = self.layout.s
+        
         # Inicializar fontes se necessário
         if self.emoji_font is None:
             try:
-                self.emoji_font = pygame.freetype.SysFont("Segoe UI Emoji", 40)
+                self.emoji_font = pygame.freetype.SysFont("Segoe UI Emoji", self.layout.s(40))
             except:
-                self.emoji_font = pygame.freetype.SysFont("Arial", 40)
+                self.emoji_font = pygame.freetype.SysFont("Arial", self.layout.s(40))
         
-        if not hasattr(self, 'font_tiny') or self.font_tiny is None:
-            self.font_tiny = pygame.font.SysFont("Arial", 16)
+        if self.font_tiny is None:
+            self.font_tiny = pygame.font.SysFont("Arial", s(16))
         
-        # Coletar acordes únicos com seus gestos
-        acordes_unicos = {}
-        for chord_data in self.dados_chords:
-            chord_name = chord_data["chord_simple_pop"]
-            if chord_name not in acordes_unicos:
-                expected_gesture = self.gesture_recognizer.get_expected_gesture(chord_name)
-                emoji = self.gesture_recognizer.get_gesture_emoji(expected_gesture)
-                acordes_unicos[chord_name] = emoji
+        if self.emoji_font_small is None:
+            self.emoji_font_small = pygame.freetype.SysFont("Segoe UI Emoji", s(22))
         
-        acordes_list = list(acordes_unicos.items())
+        # Acordes únicos com seus gestos (resolvidos na compilação do mapa)
+        acordes_list = self.dados_chords.pop_chords
         num_acordes = len(acordes_list)
         
         # Painel no lado direito
-        panel_width = 140
-        row_height = 35
-        padding = 10
+        panel_width = s(140)
+        row_height = s(35)
+        padding = s(10)
         panel_height = num_acordes * row_height + padding * 2
         
-        panel_x = self.WIDTH - panel_width - 20
-        panel_y = 120  # Abaixo do HUD
+        panel_x = self.WIDTH - panel_width - s(20)
+        panel_y = s(120)  # Abaixo do HUD
         
         # Fundo do painel com transparência
         panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
         panel_surface.fill((20, 25, 40, 200))
-        pygame.draw.rect(panel_surface, (60, 80, 120), (0, 0, panel_width, panel_height), 2, border_radius=8)
+        pygame.draw.rect(panel_surface, (60, 80, 120), (0, 0, panel_width, panel_height), s(2), border_radius=s(8))
         self.screen.blit(panel_surface, (panel_x, panel_y))
         
         # Desenhar cada acorde + emoji (sem labels, apenas o básico)
         y_offset = panel_y + padding
-        for chord_name, emoji in acordes_list:
+        for chord in acordes_list:
             # Nome do acorde (à esquerda)
-            chord_text = self.font_tiny.render(chord_name, True, (200, 200, 220))
-            self.screen.blit(chord_text, (panel_x + 10, y_offset + 8))
+            chord_text = self.font_tiny.render(chord.chord_simple_pop, True, (200, 200, 220))
+            self.screen.blit(chord_text, (panel_x + s(10), y_offset + s(8)))
             
             # Emoji (à direita)
-            small_emoji_font = pygame.freetype.SysFont("Segoe UI Emoji", 22)
-            emoji_surf, emoji_rect = small_emoji_font.render(emoji, (150, 200, 255))
-            emoji_rect.midright = (panel_x + panel_width - 12, y_offset + row_height // 2)
+            emoji_surf, emoji_rect = self.emoji_font_small.render(chord.emoji, (150, 200, 255))
+            emoji_rect.midright = (panel_x + panel_width - s(12), y_offset + row_height // 2)
             self.screen.blit(emoji_surf, emoji_rect)
             
             y_offset += row_height
 
     def _draw_correct_screen(self, cx, cy):
         """Tela de acerto (breve transição)."""
+        s = self.layout.s
         # Efeito de flash verde
         flash = pygame.Surface((self.WIDTH, self.HEIGHT))
-        elapsed = time.time() - self.transition_start_time
+        elapsed = self.scheduler.now() - self.transition_start_time
         alpha = int(150 * (1 - elapsed / self.TRANSITION_DURATION))
         flash.set_alpha(max(0, alpha))
         flash.fill((0, 255, 100))
@@ -838,7 +1067,7 @@ class MusicGame:
         
         # Texto "CORRETO!"
         scale = 1 + 0.3 * math.sin(elapsed * 20)
-        font_size = int(100 * scale)
+        font_size = s(100 * scale)
         font_correct = pygame.font.SysFont("Arial", font_size, bold=True)
         correct_text = font_correct.render("CORRETO!", True, (255, 255, 255))
         correct_rect = correct_text.get_rect(center=(cx, cy))
@@ -848,9 +1077,9 @@ class MusicGame:
         if len(self.feedback_visual) < 20:
             for _ in range(3):
                 self.feedback_visual.append({
-                    "x": cx + np.random.randint(-100, 100),
-                    "y": cy + np.random.randint(-100, 100),
-                    "r": 10,
+                    "x": cx + s(np.random.randint(-100, 100)),
+                    "y": cy + s(np.random.randint(-100, 100)),
+                    "r": s(10),
                     "alpha": 255,
                     "cor": (0, 255, 100)
                 })
@@ -859,53 +1088,53 @@ class MusicGame:
         """Tela durante a reprodução do trecho."""
         if self.acorde_atual is None:
             return
+        s = self.layout.s
         
-        chord_name = self.acorde_atual["chord_simple_pop"]
+        chord_name = self.acorde_atual.chord_simple_pop
         
         # Mostrar acorde atual tocando
         playing_text = self.font_medium.render(f"♪ {chord_name} ♪", True, (0, 255, 100))
-        playing_rect = playing_text.get_rect(center=(cx, cy - 50))
+        playing_rect = playing_text.get_rect(center=(cx, cy - s(50)))
         self.screen.blit(playing_text, playing_rect)
         
         # Barra de progresso do trecho
         music_time = self.get_music_time()
-        start = self.acorde_atual["start"]
-        end = self.acorde_atual["end"]
-        duracao = end - start
+        start = self.acorde_atual.start
+        duracao = self.acorde_atual.duration
         
         if duracao > 0:
             progress = min((music_time - start) / duracao, 1.0)
             progress = max(0, progress)
             
-            bar_width = 400
-            bar_height = 20
+            bar_width = s(400)
+            bar_height = s(20)
             bar_x = cx - bar_width // 2
-            bar_y = cy + 50
+            bar_y = cy + s(50)
             
             pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
             pygame.draw.rect(self.screen, (0, 255, 100), (bar_x, bar_y, int(bar_width * progress), bar_height))
-            pygame.draw.rect(self.screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2)
+            pygame.draw.rect(self.screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), s(2))
         
         # Próximo acorde (preview) - apenas se hint habilitado
         if self.hint_enabled and self.acorde_index + 1 < len(self.dados_chords):
             next_chord = self.dados_chords[self.acorde_index + 1]
-            next_name = next_chord["chord_simple_pop"]
-            next_gesture = self.gesture_recognizer.get_expected_gesture(next_name)
-            next_emoji = self.gesture_recognizer.get_gesture_emoji(next_gesture)
+            next_name = next_chord.chord_simple_pop
+            next_emoji = next_chord.emoji
             
             # Label "Próximo:"
             next_label = self.font_small.render(f"Próximo: {next_name}", True, (150, 150, 200))
-            next_label_rect = next_label.get_rect(center=(cx - 30, cy + 120))
+            next_label_rect = next_label.get_rect(center=(cx - s(30), cy + s(120)))
             self.screen.blit(next_label, next_label_rect)
             
             # Emoji do próximo gesto
             if self.emoji_font:
                 next_emoji_surf, _ = self.emoji_font.render(next_emoji, (150, 150, 200))
-                self.screen.blit(next_emoji_surf, (cx + 50, cy + 105))
+                self.screen.blit(next_emoji_surf, (cx + s(50), cy + s(105)))
 
     def _draw_fail_screen(self, cx, cy):
         """Tela de penalidade (FAIL)."""
-        tempo_na_penalidade = time.time() - self.fail_start_time
+        s = self.layout.s
+        tempo_na_penalidade = self.scheduler.now() - self.fail_start_time
         
         # Overlay vermelho pulsante
         pulse_intensity = int(150 + 50 * math.sin(time.time() * 8))
@@ -915,66 +1144,69 @@ class MusicGame:
         self.screen.blit(overlay, (0, 0))
         
         # Texto "ERROU!" com sombra
-        font_erro = pygame.font.SysFont("Arial", 100, bold=True)
+        font_erro = pygame.font.SysFont("Arial", s(100), bold=True)
         
         # Sombra
         sombra = font_erro.render("ERROU!", True, (100, 0, 0))
-        sombra_rect = sombra.get_rect(center=(cx + 4, cy - 50 + 4))
+        sombra_rect = sombra.get_rect(center=(cx + s(4), cy - s(50) + s(4)))
         self.screen.blit(sombra, sombra_rect)
         
         # Texto principal
         erro_text = font_erro.render("ERROU!", True, (255, 255, 255))
-        erro_rect = erro_text.get_rect(center=(cx, cy - 50))
+        erro_rect = erro_text.get_rect(center=(cx, cy - s(50)))
         self.screen.blit(erro_text, erro_rect)
         
         # Mostrar qual gesto era esperado
         if self.acorde_atual and self.emoji_font:
-            chord_name = self.acorde_atual["chord_simple_pop"]
-            expected_gesture = self.gesture_recognizer.get_expected_gesture(chord_name)
-            expected_emoji = self.gesture_recognizer.get_gesture_emoji(expected_gesture)
-            expected_name = self.gesture_recognizer.get_gesture_name(expected_gesture)
+            chord_name = self.acorde_atual.chord_simple_pop
+            expected_emoji = self.acorde_atual.emoji
             
             esperado_text = self.font_small.render(f"Esperado: {chord_name}", True, (255, 200, 200))
-            esperado_rect = esperado_text.get_rect(center=(cx, cy + 30))
+            esperado_rect = esperado_text.get_rect(center=(cx, cy + s(30)))
             self.screen.blit(esperado_text, esperado_rect)
             
             # Emoji do gesto esperado
             emoji_surf, emoji_rect = self.emoji_font.render(expected_emoji, (255, 200, 200))
-            emoji_rect.center = (cx, cy + 80)
+            emoji_rect.center = (cx, cy + s(80))
             self.screen.blit(emoji_surf, emoji_rect)
         
         # Barra de progresso da penalidade
         tempo_restante = PENALTY_TIME_SECONDS - tempo_na_penalidade
         progresso = tempo_na_penalidade / PENALTY_TIME_SECONDS
         
-        bar_width = 400
-        bar_height = 25
+        bar_width = s(400)
+        bar_height = s(25)
         bar_x = cx - bar_width // 2
-        bar_y = cy + 140
+        bar_y = cy + s(140)
         
         # Fundo da barra
-        pygame.draw.rect(self.screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), border_radius=5)
+        pygame.draw.rect(self.screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), border_radius=s(5))
         # Progresso
         fill_width = int(bar_width * progresso)
-        pygame.draw.rect(self.screen, (255, 255, 255), (bar_x, bar_y, fill_width, bar_height), border_radius=5)
+        pygame.draw.rect(self.screen, (255, 255, 255), (bar_x, bar_y, fill_width, bar_height), border_radius=s(5))
         # Borda
-        pygame.draw.rect(self.screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 3, border_radius=5)
+        pygame.draw.rect(self.screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), s(3), border_radius=s(5))
         
         # Texto do tempo restante
         tempo_text = self.font_medium.render(f"Aguarde {tempo_restante:.1f}s", True, (255, 255, 255))
-        tempo_rect = tempo_text.get_rect(center=(cx, bar_y + bar_height + 40))
+        tempo_rect = tempo_text.get_rect(center=(cx, bar_y + bar_height + s(40)))
         self.screen.blit(tempo_text, tempo_rect)
+        
+        retry_text = self.font_small.render("ENTER para repetir o acorde", True, (255, 200, 200))
+        retry_rect = retry_text.get_rect(center=(cx, bar_y + bar_height + s(90)))
+        self.screen.blit(retry_text, retry_rect)
 
     def _draw_finished_screen(self, cx, cy):
         """Tela de fim de jogo."""
+        s = self.layout.s
         # Título
         title = self.font_big.render("FIM!", True, (0, 255, 100))
-        title_rect = title.get_rect(center=(cx, cy - 120))
+        title_rect = title.get_rect(center=(cx, cy - s(120)))
         self.screen.blit(title, title_rect)
         
         # Score
         score_text = self.font_medium.render(f"Pontuação: {self.score}", True, (255, 255, 255))
-        score_rect = score_text.get_rect(center=(cx, cy - 30))
+        score_rect = score_text.get_rect(center=(cx, cy - s(30)))
         self.screen.blit(score_text, score_rect)
         
         # Acertos
@@ -983,7 +1215,7 @@ class MusicGame:
             f"✓ Acertos: {self.acertos}/{self.total_acordes} ({percent:.0f}%)", 
             True, (100, 255, 100)
         )
-        acertos_rect = acertos_text.get_rect(center=(cx, cy + 30))
+        acertos_rect = acertos_text.get_rect(center=(cx, cy + s(30)))
         self.screen.blit(acertos_text, acertos_rect)
         
         # Erros
@@ -992,76 +1224,90 @@ class MusicGame:
                 f"✗ Erros: {self.erros}", 
                 True, (255, 100, 100)
             )
-            erros_rect = erros_text.get_rect(center=(cx, cy + 70))
+            erros_rect = erros_text.get_rect(center=(cx, cy + s(70)))
             self.screen.blit(erros_text, erros_rect)
         
         # Replay
         replay_text = self.font_small.render("Pressione ESPAÇO para jogar novamente", True, (150, 200, 255))
-        replay_rect = replay_text.get_rect(center=(cx, cy + 150))
+        replay_rect = replay_text.get_rect(center=(cx, cy + s(150)))
         self.screen.blit(replay_text, replay_rect)
+        
+        restart_text = self.font_small.render("ENTER para recomeçar direto do primeiro acorde", True, (150, 200, 255))
+        restart_rect = restart_text.get_rect(center=(cx, cy + s(190)))
+        self.screen.blit(restart_text, restart_rect)
 
     def _draw_hud(self):
         """Desenha o HUD (score, progresso, configurações)."""
+        s = self.layout.s
+        
         # Score
         score_text = self.font_small.render(f"Score: {self.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (20, 20))
+        self.screen.blit(score_text, (s(20), s(20)))
         
         # Progresso
         progress_text = self.font_small.render(
             f"Acorde: {self.acorde_index + 1}/{self.total_acordes}", 
             True, (200, 200, 200)
         )
-        self.screen.blit(progress_text, (self.WIDTH - progress_text.get_width() - 20, 20))
+        self.screen.blit(progress_text, (self.WIDTH - progress_text.get_width() - s(20), s(20)))
         
         # Acorde atual (nome grande no canto superior direito)
         if self.acorde_atual and self.game_state != GameState.INTRO:
-            chord_name = self.acorde_atual.get("chord_simple_pop", "?")
+            chord_name = self.acorde_atual.chord_simple_pop
             chord_hud = self.font_medium.render(chord_name, True, (0, 200, 255))
-            self.screen.blit(chord_hud, (self.WIDTH - chord_hud.get_width() - 20, 55))
+            self.screen.blit(chord_hud, (self.WIDTH - chord_hud.get_width() - s(20), s(55)))
         
         # Sidebar de configurações (canto superior esquerdo, abaixo do score)
-        sidebar_y = 55
+        sidebar_x = s(20)
+        sidebar_y = s(55)
+        line_step = s(28)
         
         # Timbre atual
         timbre_nome = self.timbres[self.timbre_index].value.upper()
         timbre_text = self.font_small.render(f"[T] {timbre_nome}", True, (100, 200, 255))
-        self.screen.blit(timbre_text, (20, sidebar_y))
+        self.screen.blit(timbre_text, (sidebar_x, sidebar_y))
         
         # Fail Mode status
         if self.fail_mode_enabled:
             fail_text = self.font_small.render("[M] FAIL: ON", True, (255, 100, 100))
         else:
             fail_text = self.font_small.render("[M] FAIL: OFF", True, (100, 255, 100))
-        self.screen.blit(fail_text, (20, sidebar_y + 28))
+        self.screen.blit(fail_text, (sidebar_x, sidebar_y + 1 * line_step))
         
         # Audio status - Synth
         synth_status = "ON" if self.synth_enabled else "OFF"
         synth_color = (100, 255, 100) if self.synth_enabled else (150, 150, 150)
         synth_text = self.font_small.render(f"[S] Synth: {synth_status}", True, synth_color)
-        self.screen.blit(synth_text, (20, sidebar_y + 56))
+        self.screen.blit(synth_text, (sidebar_x, sidebar_y + 2 * line_step))
         
         # Audio status - Real Audio
         real_status = "ON" if self.real_audio_enabled else "OFF"
         real_color = (100, 255, 100) if self.real_audio_enabled else (150, 150, 150)
         real_text = self.font_small.render(f"[R] Real: {real_status}", True, real_color)
-        self.screen.blit(real_text, (20, sidebar_y + 84))
+        self.screen.blit(real_text, (sidebar_x, sidebar_y + 3 * line_step))
         
         # Hint status (dica do próximo gesto)
         hint_status = "ON" if self.hint_enabled else "OFF"
         hint_color = (100, 255, 100) if self.hint_enabled else (150, 150, 150)
         hint_text = self.font_small.render(f"[H] Dica: {hint_status}", True, hint_color)
-        self.screen.blit(hint_text, (20, sidebar_y + 112))
+        self.screen.blit(hint_text, (sidebar_x, sidebar_y + 4 * line_step))
         
         # Show expected gesture status
         gesto_status = "ON" if self.show_expected_gesture else "OFF"
         gesto_color = (100, 255, 100) if self.show_expected_gesture else (150, 150, 150)
         gesto_text = self.font_small.render(f"[G] Gesto: {gesto_status}", True, gesto_color)
-        self.screen.blit(gesto_text, (20, sidebar_y + 140))
+        self.screen.blit(gesto_text, (sidebar_x, sidebar_y + 5 * line_step))
+        
+        # Loop de prática A-B (só quando marcado)
+        if self.loop_a is not None:
+            loop_b = self.loop_b + 1 if self.loop_b is not None else "?"
+            loop_text = self.font_small.render(f"[L] Loop: {self.loop_a + 1}-{loop_b}", True, (255, 200, 0))
+            self.screen.blit(loop_text, (sidebar_x, sidebar_y + 6 * line_step))
 
     def _draw_particles(self):
         """Desenha partículas de feedback."""
         for p in self.feedback_visual[:]:
-            p["r"] += 2
+            p["r"] += self.layout.s(2)
             p["alpha"] -= 8
             if p["alpha"] <= 0:
                 self.feedback_visual.remove(p)
@@ -1076,16 +1322,65 @@ class MusicGame:
             return
         
         # Mostrar landmarks
-        debug_y = 100
+        debug_y = self.layout.s(100)
         debug_text = self.font_small.render(
             f"Gesto: {detected_gesture.value} ({confidence:.2f})", 
             True, (255, 255, 0)
         )
-        self.screen.blit(debug_text, (20, debug_y))
+        self.screen.blit(debug_text, (self.layout.s(20), debug_y))
+
+    # Estados em que seek e loop de prática estão disponíveis
+    ESTADOS_EM_JOGO = (
+        GameState.WAITING_FOR_GESTURE,
+        GameState.GESTURE_CORRECT,
+        GameState.PLAYING,
+        GameState.FAIL,
+    )
+
+    def _tratar_tecla_pratica(self, key):
+        """Teclas de navegação e loop de prática durante o jogo."""
+        if key == pygame.K_LEFT:
+            # Acorde anterior
+            self.ir_para_acorde(self.acorde_index - 1)
+        elif key == pygame.K_RIGHT:
+            # Próximo acorde
+            self.ir_para_acorde(self.acorde_index + 1)
+        elif key == pygame.K_PAGEUP:
+            self.buscar_tempo(self.acorde_atual.start - SEEK_STEP_SECONDS)
+        elif key == pygame.K_PAGEDOWN:
+            self.buscar_tempo(self.acorde_atual.start + SEEK_STEP_SECONDS)
+        elif key == pygame.K_LEFTBRACKET:
+            self.marcar_loop("A")
+        elif key == pygame.K_RIGHTBRACKET:
+            self.marcar_loop("B")
+        elif key == pygame.K_l:
+            self.limpar_loop()
+
+    def _aguardar_proximo_frame(self, frame_start):
+        """
+        Limita o loop a TARGET_FPS sem atrasar as transições agendadas.
+        
+        Em vez de dormir até a fronteira do frame, acorda no prazo do
+        próximo timer, dispara os vencidos e volta a dormir.
+        """
+        frame_deadline = frame_start + 1.0 / TARGET_FPS
+        while True:
+            self.scheduler.run_due()
+            agora = self.scheduler.now()
+            if agora >= frame_deadline:
+                return
+            
+            acordar = frame_deadline
+            proximo = self.scheduler.next_due()
+            if proximo is not None:
+                acordar = min(acordar, proximo)
+            time.sleep(max(0.0, acordar - agora))
 
     def run(self):
         """Loop principal do jogo."""
         while self.running:
+            frame_start = self.scheduler.now()
+            
             # 1. Input
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -1100,10 +1395,17 @@ class MusicGame:
                             # Pular preview e ir direto para o jogo
                             self._iniciar_primeiro_acorde()
                         elif self.game_state == GameState.FINISHED:
-                            self.game_state = GameState.INTRO
+                            self._trocar_estado(GameState.INTRO)
+                    elif event.key == pygame.K_RETURN:
+                        # Repetir o acorde após um FAIL / recomeçar direto no fim
+                        if self.game_state == GameState.FAIL:
+                            self.repetir_acorde()
+                        elif self.game_state == GameState.FINISHED:
+                            self.reiniciar_rapido()
                     elif event.key == pygame.K_m:
                         # Toggle fail mode
                         self.fail_mode_enabled = not self.fail_mode_enabled
+                        self._agendar_timeout()
                         status = "ATIVADO" if self.fail_mode_enabled else "DESATIVADO"
                         print(f"Fail Mode: {status}")
                     elif event.key == pygame.K_t:
@@ -1112,6 +1414,11 @@ class MusicGame:
                         novo_timbre = self.timbres[self.timbre_index]
                         self.synth.set_timbre(novo_timbre)
                         print(f"Timbre: {novo_timbre.value}")
+                    elif event.key in (pygame.K_MINUS, pygame.K_EQUALS):
+                        # Transpor a música meio tom (sons derivados do cache)
+                        passo = 1 if event.key == pygame.K_EQUALS else -1
+                        self.synth.set_transposicao(self.synth.transposicao + passo)
+                        self.lookahead.preparar(self.acorde_index)
                     elif event.key == pygame.K_s:
                         # Toggle som sintetizado
                         self.synth_enabled = not self.synth_enabled
@@ -1132,23 +1439,48 @@ class MusicGame:
                         self.show_expected_gesture = not self.show_expected_gesture
                         status = "ATIVADO" if self.show_expected_gesture else "DESATIVADO"
                         print(f"Mostrar Gesto Esperado: {status}")
+                    elif self.game_state in self.ESTADOS_EM_JOGO:
+                        self._tratar_tecla_pratica(event.key)
 
             # 2. Captura de vídeo
             ret, frame = self.cap.read()
             if not ret:
                 continue
+            if self.sonda is not None:
+                self.sonda.frame_capturado()
             
             # 3. Processamento de visão
             frame, is_pinching, pinch_pos, landmarks = self.tracker.process(frame)
+            if self.sonda is not None:
+                self.sonda.landmarks_prontos()
+            self.medidor_velocidade.atualizar(landmarks, self.scheduler.now())
 
-            # 4. Lógica do jogo
+            # 4. Lógica do jogo (timers vencidos durante a captura primeiro)
+            self.scheduler.run_due()
             self.update_game_logic(landmarks)
 
             # 5. Renderização
             self.draw_ui(frame, landmarks)
-            pygame.display.flip()
-            self.clock.tick(30)
+            self.render_target.present()
+            self._aguardar_proximo_frame(frame_start)
 
         self.cap.release()
+        self.lookahead.encerrar()
+        if self.synth_stream is not None:
+            self.synth_stream.encerrar()
+        self.synth.encerrar()
+        self.musica.encerrar()
+        if self.sonda is not None and self._resumir_sonda:
+            self.sonda.imprimir_resumo()
+        stats = self.audio_cache.stats()
+        print(
+            f"Cache de áudio: {stats['hits']} acertos, {stats['misses']} falhas, "
+            f"{stats['evictions']} remoções, {stats['bytes'] / 1024 / 1024:.1f} MB em {stats['entries']} sons"
+        )
+        for grupo, info in self.vozes.stats().items():
+            print(
+                f"Vozes '{grupo}': pico {info['pico']}/{info['canais']}, "
+                f"{info['roubos']} roubadas, {info['descartes']} descartadas"
+            )
         pygame.quit()
 
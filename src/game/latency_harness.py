@@ -0,0 +1,309 @@
+"""
+Harness de latência gesto -> som, sem câmera e sem janela.
+
+Roda o MusicGame completo (loop, tracker, reconhecimento, HOLD, disparo e
+mixer) com:
+
+- um stream de landmarks reproduzido quadro a quadro no lugar da webcam
+  e do MediaPipe: poses sintéticas do gesto esperado (padrão) ou um
+  arquivo gravado com ``--gravar``;
+- o driver de áudio em disco do SDL (SDL_AUDIODRIVER=disk): tudo o que
+  sai do mixer vai para um arquivo PCM cru. Uma thread acompanha o
+  tamanho do arquivo com perf_counter, então cada amostra gravada tem o
+  instante em que saiu do mixer. O início (onset) do acorde depois de
+  cada gesto aceito fecha a etapa "mixer" da LatencyProbe.
+
+Uso:
+    python -m src.game.latency_harness --gestos 8 --saida latencia.json --max-ms 150
+    python -m src.game.latency_harness --gravar gestos.json --segundos 20
+    python -m src.game.latency_harness --landmarks gestos.json
+
+Com ``--max-ms``, o processo termina com código 1 se o p95 do total
+passar do limite (para checagem automática).
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from src.audio.device import iniciar_audio
+from src.game.engine import MusicGame, GameState
+from src.utils.chart import compile_chart
+from src.utils.latency import LatencyProbe
+from src.vision.tracker import HandTracker
+
+# Poses sintéticas: dedos estendidos de cada gesto
+DEDOS_GESTO = {
+    "OPEN_HAND": ("thumb", "index", "middle", "ring", "pinky"),
+    "FIST": (),
+    "THUMB_UP": ("thumb",),
+    "PEACE": ("index", "middle"),
+    "INDEX_POINT": ("index",),
+    "ROCK": ("index", "pinky"),
+}
+
+# Mapa curto cobrindo os gestos (um acorde por gesto, em ciclo)
+ACORDES_HARNESS = (
+    ("G:maj", "G"), ("A:min", "Am"), ("C:maj", "C"),
+    ("D:maj", "D"), ("F:maj", "F"), ("E:maj", "E"),
+)
+
+FPS_CAMERA = 30
+QUADROS_SEM_MAO = 6      # Quadros sem mão antes de cada gesto (a mão "entra" na imagem)
+LIMIAR_ONSET = 0.01      # Fração do fundo de escala que conta como início do som
+JANELA_ONSET = 1.0       # Segundos procurados após o gesto aceito
+
+
+class Ponto:
+    """Landmark com a mesma interface do MediaPipe (x, y, z normalizados)."""
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z=0.0):
+        self.x, self.y, self.z = x, y, z
+
+
+def pose_gesto(gesto: str, x0: float = 0.5, y0: float = 0.8):
+    """21 landmarks de uma mão com os dedos de DEDOS_GESTO estendidos."""
+    estendidos = DEDOS_GESTO[gesto]
+    pontos = [Ponto(x0, y0)] + [None] * 20
+
+    # Polegar (1-4): estendido = ponta longe do pulso na horizontal
+    ponta_polegar = x0 - 0.22 if "thumb" in estendidos else x0 - 0.05
+    for i, (x, y) in enumerate(((x0 - 0.08, 0.72), (x0 - 0.12, 0.66), (x0 - 0.16, 0.62), (ponta_polegar, 0.58)), 1):
+        pontos[i] = Ponto(x, y)
+
+    # Demais dedos (MCP, PIP, DIP, ponta): estendido = ponta acima da PIP
+    for dedo, mcp, dx in (("index", 5, -0.06), ("middle", 9, -0.02), ("ring", 13, 0.02), ("pinky", 17, 0.06)):
+        alturas = (0.6, 0.5, 0.45, 0.4) if dedo in estendidos else (0.6, 0.5, 0.55, 0.58)
+        for k, y in enumerate(alturas):
+            pontos[mcp + k] = Ponto(x0 + dx, y)
+    return pontos
+
+
+class CapturaReproduzida:
+    """Substitui a webcam: quadros pretos no ritmo da câmera até o fim da medição."""
+
+    def __init__(self, gestos: int, fps: int = FPS_CAMERA, limite: float = 120.0):
+        self.gestos = gestos
+        self.periodo = 1.0 / fps
+        self.limite = limite
+        self.jogo = None
+        self._quadro = np.zeros((480, 640, 3), dtype=np.uint8)
+        self._proximo = None
+        self._inicio = None
+
+    def read(self):
+        agora = time.perf_counter()
+        if self._proximo is None:
+            self._proximo = self._inicio = agora
+        # A câmera entrega um quadro por período
+        if agora < self._proximo:
+            time.sleep(self._proximo - agora)
+        self._proximo += self.periodo
+
+        if len(self.jogo.sonda.registros) >= self.gestos or agora - self._inicio > self.limite:
+            self.jogo.running = False
+            return False, None
+        return True, self._quadro
+
+    def release(self):
+        pass
+
+
+class TrackerReproduzido:
+    """Substitui o HandTracker: landmarks de um stream gravado ou do gesto esperado."""
+
+    def __init__(self, gravados=None, sem_mao: int = QUADROS_SEM_MAO):
+        """
+        Args:
+            gravados: Lista de quadros (None ou 21 [x, y, z]) para reproduzir em ordem
+            sem_mao: Quadros sem mão antes de cada gesto sintético
+        """
+        self.gravados = gravados
+        self.sem_mao = sem_mao
+        self.jogo = None
+        self._quadro = 0
+        self._acorde = None
+        self._espera = 0
+
+    def process(self, img):
+        return img, False, (0, 0), self._landmarks()
+
+    def _landmarks(self):
+        if self.gravados is not None:
+            quadro = self.gravados[self._quadro % len(self.gravados)]
+            self._quadro += 1
+            return None if quadro is None else [Ponto(*p) for p in quadro]
+
+        jogo = self.jogo
+        if jogo.game_state != GameState.WAITING_FOR_GESTURE:
+            return None
+        # Novo acorde esperando: a mão entra depois de alguns quadros
+        if jogo.acorde_index != self._acorde:
+            self._acorde = jogo.acorde_index
+            self._espera = self.sem_mao
+        if self._espera > 0:
+            self._espera -= 1
+            return None
+        return pose_gesto(jogo.acorde_atual.gesture.name)
+
+
+class SaidaEmDisco:
+    """Acompanha o arquivo do driver de áudio em disco e localiza os inícios de som."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._observacoes = []  # (perf_counter, bytes no arquivo) quando o tamanho muda
+        self._ativo = True
+        self._thread = threading.Thread(target=self._monitorar, name="disk-audio", daemon=True)
+        self._thread.start()
+
+    def _monitorar(self):
+        ultimo = -1
+        while self._ativo:
+            try:
+                tamanho = os.path.getsize(self.path)
+            except OSError:
+                tamanho = -1
+            if tamanho != ultimo:
+                self._observacoes.append((time.perf_counter(), tamanho))
+                ultimo = tamanho
+            time.sleep(0.0005)
+
+    def encerrar(self):
+        self._ativo = False
+        self._thread.join()
+
+    def analisar(self, registros, sample_rate: int, canais: int):
+        """Preenche ``saida`` de cada registro com o instante do início do acorde."""
+        obs = np.array([o for o in self._observacoes if o[1] > 0])
+        if len(obs) < 2:
+            print("Harness: driver de áudio em disco não gravou nada")
+            return
+        tempos, tamanhos = obs[:, 0], obs[:, 1]
+        bytes_frame = 2 * canais
+        # Taxa real de escrita (o driver em disco não segue o relógio exatamente)
+        taxa = np.polyfit(tempos, tamanhos, 1)[0]
+
+        audio = np.fromfile(self.path, dtype="<i2")
+        audio = audio[:len(audio) // canais * canais].reshape(-1, canais)
+        nivel = np.abs(audio.astype(np.int32)).max(axis=1)
+        limiar = LIMIAR_ONSET * 32767
+
+        for registro in registros:
+            # Nada depois do aceite pode estar em bytes já gravados antes dele
+            i = np.searchsorted(tempos, registro["aceito"], side="right") - 1
+            inicio = int(tamanhos[max(i, 0)]) // bytes_frame
+            fim = min(len(nivel), inicio + int(JANELA_ONSET * sample_rate))
+            acima = np.flatnonzero(nivel[inicio:fim] > limiar)
+            if len(acima) == 0:
+                continue
+            byte = (inicio + int(acima[0]) + 1) * bytes_frame
+            # Escrita que contém a amostra; amostras anteriores do mesmo write saíram antes
+            j = min(np.searchsorted(tamanhos, byte), len(tamanhos) - 1)
+            registro["saida"] = float(tempos[j] - (tamanhos[j] - byte) / taxa)
+
+
+def gravar_landmarks(path: str, segundos: float):
+    """Grava os landmarks da webcam (MediaPipe) para reproduzir depois com --landmarks."""
+    cap = cv2.VideoCapture(0)
+    tracker = HandTracker(draw_landmarks=False)
+    quadros = []
+    fim = time.perf_counter() + segundos
+    print(f"Gravando landmarks por {segundos:.0f}s...")
+    while time.perf_counter() < fim:
+        ok, frame = cap.read()
+        if not ok:
+            continue
+        landmarks = tracker.process(frame)[3]
+        quadros.append(None if landmarks is None else [[p.x, p.y, p.z] for p in landmarks])
+    cap.release()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(quadros, f)
+    print(f"{len(quadros)} quadros gravados em {path}")
+
+
+def medir(gestos: int, gravados=None, saida_json: str = None, duracao_acorde: float = 1.5):
+    """Roda o jogo sem câmera e sem janela e retorna a LatencyProbe com as medições."""
+    raw = os.path.join(tempfile.mkdtemp(prefix="pymusicy-latency-"), "saida.raw")
+    # Drivers escolhidos antes de o SDL abrir o áudio e o vídeo
+    os.environ["SDL_AUDIODRIVER"] = "disk"
+    os.environ["SDL_DISKAUDIOFILE"] = raw
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+    dispositivo = iniciar_audio()
+    disco = SaidaEmDisco(raw)
+
+    dados = []
+    for i in range(gestos):
+        majmin, pop = ACORDES_HARNESS[i % len(ACORDES_HARNESS)]
+        dados.append({
+            "start": i * duracao_acorde, "end": (i + 1) * duracao_acorde,
+            "chord_majmin": majmin, "chord_simple_pop": pop,
+        })
+
+    captura = CapturaReproduzida(gestos)
+    tracker = TrackerReproduzido(gravados)
+    sonda = LatencyProbe()
+    # Sem música: o início do som é o do acorde sintetizado
+    jogo = MusicGame(captura=captura, tracker=tracker, chart=compile_chart(dados), sonda=sonda, com_musica=False)
+    captura.jogo = tracker.jogo = jogo
+
+    jogo.real_audio_enabled = False
+    jogo.fail_mode_enabled = False
+    jogo.iniciar_jogo()
+    jogo._iniciar_primeiro_acorde()
+    jogo.run()  # Fecha o mixer ao sair (arquivo completo)
+
+    disco.encerrar()
+    disco.analisar(sonda.registros, dispositivo.frequency, dispositivo.channels)
+    sonda.imprimir_resumo()
+    if saida_json:
+        sonda.salvar(saida_json)
+        print(f"Medições gravadas em {saida_json}")
+    os.remove(raw)
+    return sonda
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latência gesto -> som (headless)")
+    parser.add_argument("--gestos", type=int, default=8, help="Gestos aceitos a medir")
+    parser.add_argument("--landmarks", help="Stream de landmarks gravado (JSON) para reproduzir")
+    parser.add_argument("--saida", help="Arquivo JSON com as medições")
+    parser.add_argument("--max-ms", type=float, help="Falhar se o p95 do total passar deste valor")
+    parser.add_argument("--gravar", help="Gravar landmarks da webcam neste arquivo e sair")
+    parser.add_argument("--segundos", type=float, default=20.0, help="Duração da gravação")
+    args = parser.parse_args(argv)
+
+    if args.gravar:
+        gravar_landmarks(args.gravar, args.segundos)
+        return 0
+
+    gravados = None
+    if args.landmarks:
+        with open(args.landmarks, encoding="utf-8") as f:
+            gravados = json.load(f)
+
+    sonda = medir(args.gestos, gravados, args.saida)
+    resumo = sonda.resumo()
+    if len(sonda.registros) < args.gestos:
+        print(f"Harness: só {len(sonda.registros)} de {args.gestos} gestos foram aceitos")
+        return 1
+    if args.max_ms is not None:
+        p95 = resumo["total"]["p95"]
+        if p95 > args.max_ms:
+            print(f"Harness: p95 total {p95:.1f} ms acima de {args.max_ms:.1f} ms")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
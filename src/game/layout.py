@@ -0,0 +1,70 @@
+"""Camada de layout independente de resolução.
+
+As telas do jogo foram desenhadas sobre uma referência de 1000x700.
+O ``Layout`` converte as medidas dessa referência para a resolução interna
+de renderização, e o ``RenderTarget`` desenha a cena em uma superfície
+offscreen que é ampliada uma única vez para o tamanho da janela.
+"""
+
+import pygame
+
+# Resolução de referência usada para desenhar as telas
+DESIGN_WIDTH, DESIGN_HEIGHT = 1000, 700
+
+
+class Layout:
+    """Converte medidas da resolução de referência para a resolução interna."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        # Escala uniforme para não distorcer círculos, fontes e emojis
+        self.scale = min(width / DESIGN_WIDTH, height / DESIGN_HEIGHT)
+
+    def s(self, value: float) -> int:
+        """Escala uma medida (posição, tamanho, fonte) da referência.
+
+        Medidas positivas nunca viram zero: em ``pygame.draw`` uma largura
+        de borda 0 preencheria a forma inteira.
+        """
+        scaled = int(round(value * self.scale))
+        if value > 0:
+            return max(1, scaled)
+        return scaled
+
+
+class RenderTarget:
+    """
+    Superfície de renderização interna com ampliação única para a janela.
+
+    Quando a resolução interna é igual à da janela, a cena é desenhada
+    diretamente na superfície do display (sem cópia extra).
+    """
+
+    def __init__(self, render_size, window_size=None, fullscreen: bool = False,
+                 smooth: bool = True):
+        if fullscreen:
+            self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            self.window = pygame.display.set_mode(window_size or render_size)
+
+        self.smooth = smooth
+        window_size = self.window.get_size()
+
+        if tuple(render_size) == tuple(window_size):
+            self.surface = self.window
+            self._upscale = False
+        else:
+            self.surface = pygame.Surface(render_size).convert()
+            self._upscale = True
+
+        self.layout = Layout(*self.surface.get_size())
+
+    def present(self):
+        """Amplia a cena para a janela (se necessário) e atualiza o display."""
+        if self._upscale:
+            if self.smooth:
+                pygame.transform.smoothscale(self.surface, self.window.get_size(), self.window)
+            else:
+                pygame.transform.scale(self.surface, self.window.get_size(), self.window)
+        pygame.display.flip()
@@ -0,0 +1,105 @@
+"""
+Agendador de eventos baseado em heap.
+
+Mantém os prazos das transições de estado em uma fila de prioridade, para
+que cada transição dispare no instante exato em que vence (e não na
+próxima fronteira de frame). Timers podem ser cancelados individualmente
+ou por tag quando o estado muda.
+"""
+
+import heapq
+import itertools
+import time
+
+
+class Timer:
+    """Um evento agendado. Use ``cancel()`` para descartá-lo."""
+
+    __slots__ = ("due", "callback", "tag", "cancelled")
+
+    def __init__(self, due: float, callback, tag=None):
+        self.due = due
+        self.callback = callback
+        self.tag = tag
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancela o timer (removido da fila quando chegar ao topo)."""
+        self.cancelled = True
+
+
+class Scheduler:
+    """
+    Fila de prioridade de timers.
+    
+    Os callbacks recebem o instante em que o timer venceu (``due``), o que
+    permite encadear prazos a partir do tempo exato e não do frame atual.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._heap = []
+        self._seq = itertools.count()  # Desempate estável para prazos iguais
+
+    def now(self) -> float:
+        """Tempo atual no relógio do agendador."""
+        return self.clock()
+
+    def call_at(self, due: float, callback, tag=None) -> Timer:
+        """Agenda ``callback(due)`` para um instante absoluto."""
+        timer = Timer(due, callback, tag)
+        heapq.heappush(self._heap, (due, next(self._seq), timer))
+        return timer
+
+    def call_later(self, delay: float, callback, tag=None, start: float = None) -> Timer:
+        """Agenda ``callback(due)`` para daqui a ``delay`` segundos.
+
+        Args:
+            delay: Atraso em segundos.
+            callback: Função chamada com o instante de vencimento.
+            tag: Tag opcional para cancelamento em grupo.
+            start: Instante de referência (padrão: agora).
+        """
+        if start is None:
+            start = self.clock()
+        return self.call_at(start + delay, callback, tag)
+
+    def cancel_tag(self, tag):
+        """Cancela todos os timers pendentes com a tag."""
+        for _, _, timer in self._heap:
+            if timer.tag == tag:
+                timer.cancelled = True
+
+    def cancel_all(self):
+        """Cancela todos os timers pendentes."""
+        self._heap.clear()
+
+    def next_due(self):
+        """Instante do próximo timer ativo (ou None se a fila estiver vazia)."""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        if self._heap:
+            return self._heap[0][0]
+        return None
+
+    def run_due(self, now: float = None) -> int:
+        """Dispara, em ordem, todos os timers vencidos.
+
+        Timers agendados pelos próprios callbacks também disparam se já
+        estiverem vencidos.
+
+        Returns:
+            int: Número de callbacks executados.
+        """
+        if now is None:
+            now = self.clock()
+
+        executados = 0
+        while self._heap and self._heap[0][0] <= now:
+            _, _, timer = heapq.heappop(self._heap)
+            if timer.cancelled:
+                continue
+            timer.cancelled = True
+            timer.callback(timer.due)
+            executados += 1
+        return executados
@@ -0,0 +1,237 @@
+"""Representação compilada do mapa de acordes.
+
+Converte a lista de dicionários do chords.json em registros compactos
+(``__slots__``) com gesto, emoji, frequências e duração já resolvidos.
+A compilação acontece uma vez no carregamento e o resultado é
+compartilhado pela lógica do jogo e pela UI.
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+from src.utils.music_theory import chord_frequencies
+from src.vision.gesture_recognizer import (
+    GESTURE_EMOJI,
+    GESTURE_NAMES,
+    gesture_for_chord,
+)
+
+# Campos textuais do chords.json exibidos no painel de informações
+CHORD_TEXT_FIELDS = (
+    "chord_majmin",
+    "chord_complex_jazz",
+    "chord_simple_jazz",
+    "chord_basic_jazz",
+    "chord_complex_pop",
+    "chord_simple_pop",
+    "chord_basic_pop",
+    "chord_complex_nashville",
+    "chord_simple_nashville",
+    "chord_basic_nashville",
+)
+
+
+class ChordInfo:
+    """Dados resolvidos de um acorde único do mapa."""
+
+    __slots__ = (
+        "chord_id",
+        "chord_majmin",
+        "chord_simple_pop",
+        "gesture",
+        "emoji",
+        "gesture_name",
+        "frequencies",
+    )
+
+    def __init__(self, chord_id, chord_majmin, chord_simple_pop):
+        self.chord_id = chord_id
+        self.chord_majmin = chord_majmin
+        self.chord_simple_pop = chord_simple_pop
+        self.gesture = gesture_for_chord(chord_simple_pop)
+        self.emoji = GESTURE_EMOJI.get(self.gesture, "❓")
+        self.gesture_name = GESTURE_NAMES.get(self.gesture, "Desconhecido")
+        self.frequencies = chord_frequencies(chord_majmin)
+
+    def __repr__(self):
+        return f"ChordInfo({self.chord_id}, {self.chord_majmin!r}, {self.chord_simple_pop!r})"
+
+
+class ChordEvent:
+    """Um acorde posicionado na linha do tempo da música.
+
+    Os atributos mais usados a cada frame (nomes, gesto e emoji) são
+    copiados do ``ChordInfo`` para evitar uma indireção extra.
+    """
+
+    __slots__ = (
+        "index",
+        "start",
+        "end",
+        "duration",
+        "chord",
+        "chord_majmin",
+        "chord_simple_pop",
+        "gesture",
+        "emoji",
+        "gesture_name",
+        "fields",
+    )
+
+    def __init__(self, index, start, end, chord, fields):
+        self.index = index
+        self.start = start
+        self.end = end
+        self.duration = end - start
+        self.chord = chord
+        self.chord_majmin = chord.chord_majmin
+        self.chord_simple_pop = chord.chord_simple_pop
+        self.gesture = chord.gesture
+        self.emoji = chord.emoji
+        self.gesture_name = chord.gesture_name
+        self.fields = fields
+
+    def __repr__(self):
+        return f"ChordEvent({self.index}, {self.start:.2f}-{self.end:.2f}, {self.chord_simple_pop!r})"
+
+
+class Chart:
+    """
+    Mapa de acordes compilado.
+
+    Se comporta como uma sequência de ``ChordEvent`` e também expõe os
+    tempos em arrays NumPy, a tabela de acordes únicos e um índice da
+    linha do tempo para localizar o acorde de qualquer instante.
+    """
+
+    def __init__(self, events, chords):
+        self.events = events
+        self.chords = chords  # ChordInfo indexado por chord_id
+
+        self.starts = np.array([e.start for e in events], dtype=np.float64)
+        self.ends = np.array([e.end for e in events], dtype=np.float64)
+        self.chord_ids = np.array([e.chord.chord_id for e in events], dtype=np.int32)
+
+        # Índice da linha do tempo (lista ordenada para busca binária)
+        self._starts_list = self.starts.tolist()
+
+        # Nomes únicos para síntese (ordem de primeira aparição)
+        self.majmin_names = tuple(dict.fromkeys(c.chord_majmin for c in chords))
+
+        # Um ChordInfo por nome pop (preview e painel de referência)
+        pop_chords = {}
+        for chord in chords:
+            pop_chords.setdefault(chord.chord_simple_pop, chord)
+        self.pop_chords = tuple(pop_chords.values())
+
+    def __len__(self):
+        return len(self.events)
+
+    def __getitem__(self, index):
+        return self.events[index]
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def index_at(self, tempo):
+        """Retorna o índice do acorde ativo em um instante da música.
+
+        Busca binária sobre os inícios dos acordes (O(log n)). Antes do
+        primeiro acorde retorna 0 e depois do último retorna o último.
+
+        Args:
+            tempo: Posição na música em segundos.
+
+        Returns:
+            int: Índice do acorde em ``events`` (-1 se o mapa estiver vazio).
+        """
+        if not self.events:
+            return -1
+        index = bisect_right(self._starts_list, tempo) - 1
+        return min(max(index, 0), len(self.events) - 1)
+
+    def event_at(self, tempo):
+        """Retorna o ``ChordEvent`` ativo em um instante da música (ou None)."""
+        index = self.index_at(tempo)
+        if index < 0:
+            return None
+        return self.events[index]
+
+
+def _texto_campo(value):
+    """Formata um campo textual para exibição (None vira '-')."""
+    if value is None:
+        return "-"
+    return str(value)
+
+
+def compile_chart(dados_chords):
+    """Compila a lista de dicionários do chords.json em um ``Chart``.
+
+    Args:
+        dados_chords: Lista de dicionários com 'start', 'end',
+            'chord_majmin' e 'chord_simple_pop' (demais campos opcionais).
+
+    Returns:
+        Chart: Mapa compilado com gestos, frequências e índices resolvidos.
+    """
+    chords = []
+    chord_ids = {}
+    events = []
+
+    for index, dados in enumerate(dados_chords):
+        chave = (dados["chord_majmin"], dados["chord_simple_pop"])
+        chord_id = chord_ids.get(chave)
+        if chord_id is None:
+            chord_id = len(chords)
+            chord_ids[chave] = chord_id
+            chords.append(ChordInfo(chord_id, *chave))
+
+        fields = {key: _texto_campo(dados.get(key, "N/A")) for key in CHORD_TEXT_FIELDS}
+        start = float(dados["start"])
+        end = float(dados["end"])
+        events.append(ChordEvent(index, start, end, chords[chord_id], fields))
+
+    return Chart(events, chords)
+
+
+def chart_to_arrays(chart):
+    """Serializa um ``Chart`` em arrays NumPy (sem objetos Python).
+
+    Gestos e frequências não são gravados: são resolvidos a partir dos
+    nomes na leitura, para que mudanças no CHORD_GESTURE_MAP valham mesmo
+    com um cache existente.
+
+    Returns:
+        dict: Arrays prontos para ``np.savez``.
+    """
+    fields = [[event.fields[key] for key in CHORD_TEXT_FIELDS] for event in chart.events]
+    return {
+        "starts": chart.starts,
+        "ends": chart.ends,
+        "chord_ids": chart.chord_ids,
+        "chord_majmin": np.array([c.chord_majmin for c in chart.chords], dtype=np.str_),
+        "chord_simple_pop": np.array([c.chord_simple_pop for c in chart.chords], dtype=np.str_),
+        "fields": np.array(fields, dtype=np.str_).reshape(len(chart.events), len(CHORD_TEXT_FIELDS)),
+    }
+
+
+def chart_from_arrays(arrays):
+    """Reconstrói um ``Chart`` a partir dos arrays de ``chart_to_arrays``."""
+    chords = [
+        ChordInfo(chord_id, str(majmin), str(pop))
+        for chord_id, (majmin, pop) in enumerate(zip(arrays["chord_majmin"], arrays["chord_simple_pop"]))
+    ]
+
+    starts = arrays["starts"].tolist()
+    ends = arrays["ends"].tolist()
+    chord_ids = arrays["chord_ids"].tolist()
+    fields = arrays["fields"].tolist()
+
+    events = [
+        ChordEvent(index, starts[index], ends[index], chords[chord_ids[index]],
+                   dict(zip(CHORD_TEXT_FIELDS, fields[index])))
+        for index in range(len(starts))
+    ]
+    return Chart(events, chords)
@@ -67,6 +67,7 @@ FAIL_MODE_ENABLED = (
     True  # Ativar/desativar o modo de penalidade (True = ativado, False = desativado)
 )
 PENALTY_TIME_SECONDS = 3.0  # Tempo de penalidade quando erra (em segundos)
+FAIL_RETRY_CHORD = False  # Após a penalidade, repetir o acorde perdido (False = avançar)
 FAIL_COOLDOWN_SECONDS = (
     2.0  # Tempo de imunidade após sair de um FAIL (não dá FAIL novamente)
 )
@@ -78,6 +79,9 @@ MIN_CHORD_DURATION = (
 GESTURE_TOLERANCE = 0.7  # Confiança mínima para aceitar gesto (0.0-1.0)
 GESTURE_HOLD_TIME = 0.3  # Tempo que o gesto deve ser mantido (segundos)
 SHOW_GESTURE_DEBUG = False  # Mostrar debug dos landmarks/detecção
+LATENCY_PROBE = False  # Medir a latência gesto -> som por etapa (resumo ao sair)
+VELOCITY_WINDOW = 0.25   # Segundos de movimento considerados para a intensidade do gesto
+VELOCITY_MAX = 3.0       # Velocidade da mão (larguras de imagem/s) com intensidade máxima
 
 # Mapeamento de acordes → gestos
 # Gestos disponíveis: OPEN_HAND, FIST, PEACE, THUMB_UP, INDEX_POINT, ROCK
@@ -100,11 +104,51 @@ CHORD_GESTURE_MAP = {
 }
 
 # --- CONFIGURAÇÕES DE ÁUDIO ---
+AUDIO_FREQUENCY = 44100        # Taxa de amostragem pedida ao mixer
+AUDIO_BUFFER = 512             # Buffer do mixer em amostras (menor = menos latência, mais risco de falhas)
+AUDIO_NUM_CHANNELS = 16        # Canais de mixagem (sons simultâneos)
+AUDIO_VOICE_GROUPS = {         # Canais reservados por grupo de sons
+    "synth": 6,                # Acordes sintetizados
+    "samples": 2,              # Samples reais da música
+    "ui": 4,                   # Feedback de gesto e erro
+    "music": 1,                # Música tocada em blocos (relógio em amostras)
+}
+MUSIC_IN_MEMORY = True         # Copiar a música decodificada para a memória (seek/repetição sem disco)
 SYNTH_ENABLED = True           # Som sintetizado ativo por padrão
 REAL_AUDIO_ENABLED = True      # Som real (sample da música) ativo por padrão
 REAL_SAMPLE_DURATION = 1.5     # Duração do sample real em segundos
 SYNTH_DURATION = 0.3           # Duração do som sintetizado curto
+TRANSPOSE_SEMITONES = 0        # Tom da música em semitons (- e = no teclado)
+OCTAVE_FROM_HAND_HEIGHT = False  # Oitava do acorde pela altura da mão (cima/meio/baixo)
+VELOCITY_ENABLED = True        # Velocidade da mão controla volume e brilho do acorde
+VELOCITY_GAIN_MIN = 0.25       # Volume do acorde com a mão parada
+VELOCITY_GAIN_MAX = 0.8        # Volume do acorde no movimento mais rápido
+SYNTH_ENGINE = "aditivo"       # Motor dos acordes: "aditivo" (sin vetorizado) ou "wavetable"
+PCM_CACHE_ENABLED = True       # Guardar os sons sintetizados em disco entre execuções
+PCM_CACHE_MAX_MB = 64          # Tamanho máximo do cache de sons em disco
+SYNTH_STREAMING = False        # Acorde sustentado enquanto o gesto é mantido (em vez do som curto)
+SYNTH_STREAM_BLOCK = 1024      # Amostras por bloco do streaming (latência do ataque)
+SYNTH_WORKERS = 2              # Threads que pré-renderizam os outros timbres em segundo plano
+EFFECTS_ENABLED = False        # Reverb/chorus no som sintetizado
+REVERB_TYPE = "sala"           # IR procedural: "sala", "salao" ou "placa" (None = sem reverb)
+REVERB_MIX = 0.25              # Nível do reverb somado ao som seco
+CHORUS_MIX = 0.0               # Nível do chorus (0 = desligado)
+BACKING_TRACK_ENABLED = True   # Sem música nos assets: gerar um acompanhamento pelo mapa de acordes
+BACKING_TIMBRE = "pad"         # Timbre do acompanhamento (piano, guitar, synth, pad, organ)
+BACKING_STRIKE_SECONDS = 2.0   # Acordes longos são re-atacados a cada N segundos
+LOOKAHEAD_CHORDS = 4           # Acordes à frente com sons (synth e sample) já preparados
+AUDIO_CACHE_MAX_MB = 48        # Memória máxima dos sons prontos (acordes + samples), LRU
 
 # --- CONFIGURAÇÕES DE PREVIEW E DICAS ---
 HINT_ENABLED = True            # Mostrar dica do próximo gesto (H para toggle)
 PREVIEW_DURATION = 15.0        # Duração da tela de preview em segundos
+
+# --- CONFIGURAÇÕES DE PRÁTICA ---
+SEEK_STEP_SECONDS = 10.0       # Salto das teclas PageUp/PageDown (segundos)
+
+# --- CONFIGURAÇÕES DE VÍDEO ---
+TARGET_FPS = 30                  # Taxa de frames do loop principal
+RENDER_RESOLUTION = (1000, 700)  # Resolução interna em que a cena é desenhada
+WINDOW_RESOLUTION = None         # Tamanho da janela (None = igual à resolução interna)
+FULLSCREEN = False               # Tela cheia na resolução nativa do monitor
+SMOOTH_UPSCALE = True            # Suavizar a ampliação final (smoothscale)
@@ -2,14 +2,24 @@
 
 Responsável por carregar dados de acordes a partir de arquivos JSON
 ou utilizar dados padrão quando o arquivo não está disponível.
+O mapa compilado é guardado em um cache binário (.npz) ao lado do JSON,
+reconstruído automaticamente quando o arquivo fonte muda.
 """
 
 import json
 import os
 
+import numpy as np
+
+from src.utils.chart import chart_from_arrays, chart_to_arrays, compile_chart
 from src.utils.config import DADOS_CHORDS_PADRAO
+from src.utils.file_cache import atomic_write, cache_path_for, source_signature
 from src.utils.paths import get_assets_path
 
+# Incrementar quando o formato do cache ou a compilação mudar
+CHART_CACHE_VERSION = 1
+CHART_CACHE_SUFFIX = ".chart.npz"
+
 
 def load_chords(json_path=None):
     """Carrega dados de acordes de um arquivo JSON.
@@ -29,3 +39,63 @@ def load_chords(json_path=None):
             return json.load(f)
 
     return DADOS_CHORDS_PADRAO
+
+
+def load_chart(json_path=None, use_cache=True):
+    """Carrega e compila o mapa de acordes.
+
+    Usa o cache binário quando ele corresponde ao JSON atual (caminho,
+    tamanho, mtime e versão do carregador); caso contrário compila o JSON
+    e regrava o cache de forma atômica.
+
+    Args:
+        json_path: Caminho opcional para o arquivo JSON de acordes.
+            Se None, usa o caminho padrão em assets.
+        use_cache: Se False, ignora e não grava o cache binário.
+
+    Returns:
+        Chart: Mapa compilado (ver ``src.utils.chart``).
+    """
+    if json_path is None:
+        json_path = os.path.join(get_assets_path(), "chords.json")
+
+    if not os.path.exists(json_path):
+        return compile_chart(DADOS_CHORDS_PADRAO)
+
+    if not use_cache:
+        return compile_chart(load_chords(json_path))
+
+    signature = source_signature(json_path, CHART_CACHE_VERSION)
+    cache_path = cache_path_for(json_path, CHART_CACHE_SUFFIX, "charts")
+
+    chart = _read_chart_cache(cache_path, signature)
+    if chart is not None:
+        return chart
+
+    chart = compile_chart(load_chords(json_path))
+    _write_chart_cache(cache_path, signature, chart)
+    return chart
+
+
+def _read_chart_cache(cache_path, signature):
+    """Lê o cache binário se existir e for do mesmo arquivo fonte."""
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            if str(data["signature"]) != signature:
+                return None
+            return chart_from_arrays(data)
+    except Exception as e:
+        print(f"Cache de acordes inválido, recompilando: {e}")
+        return None
+
+
+def _write_chart_cache(cache_path, signature, chart):
+    """Grava o cache binário do mapa compilado (falhas só geram aviso)."""
+    arrays = chart_to_arrays(chart)
+    try:
+        atomic_write(cache_path, lambda f: np.savez(f, signature=np.array(signature), **arrays))
+    except OSError as e:
+        print(f"Aviso: não foi possível gravar o cache de acordes: {e}")
@@ -0,0 +1,73 @@
+"""Utilitários para arquivos de cache derivados de arquivos fonte.
+
+Um cache é válido enquanto a assinatura do arquivo fonte (caminho,
+tamanho, mtime e versão do gerador) não muda. A escrita é atômica:
+o conteúdo vai para um arquivo temporário que depois substitui o destino.
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+from src.utils.paths import get_user_cache_path
+
+
+def source_signature(source_path, version):
+    """Gera a assinatura de um arquivo fonte para validar caches.
+
+    Args:
+        source_path: Caminho do arquivo fonte.
+        version: Versão do código que gera o cache.
+
+    Returns:
+        str: Assinatura com caminho absoluto, tamanho, mtime e versão.
+    """
+    stat = os.stat(source_path)
+    return f"{os.path.abspath(source_path)}|{stat.st_size}|{stat.st_mtime_ns}|{version}"
+
+
+def cache_path_for(source_path, suffix, subdir):
+    """Escolhe onde guardar o cache de um arquivo fonte.
+
+    Prefere gravar ao lado do arquivo fonte (``<nome><suffix>``). Quando
+    empacotado com PyInstaller ou sem permissão de escrita, usa a pasta
+    de cache do usuário com um nome derivado do caminho absoluto.
+
+    Args:
+        source_path: Caminho do arquivo fonte.
+        suffix: Sufixo do arquivo de cache (ex: ".chart.npz").
+        subdir: Subpasta no cache do usuário (ex: "charts").
+
+    Returns:
+        str: Caminho do arquivo de cache.
+    """
+    source_dir = os.path.dirname(os.path.abspath(source_path))
+    base_name = os.path.splitext(os.path.basename(source_path))[0]
+
+    if not getattr(sys, "frozen", False) and os.access(source_dir, os.W_OK):
+        return os.path.join(source_dir, base_name + suffix)
+
+    digest = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(get_user_cache_path(subdir), f"{base_name}_{digest}{suffix}")
+
+
+def atomic_write(path, write_fn, mode="wb"):
+    """Grava um arquivo de forma atômica.
+
+    Args:
+        path: Caminho final do arquivo.
+        write_fn: Função que recebe o arquivo temporário aberto e escreve nele.
+        mode: Modo de abertura do arquivo temporário.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, mode) as f:
+            write_fn(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,121 @@
+"""
+Medição da latência entre o gesto e o som.
+
+A sonda marca, com ``time.perf_counter``, cada etapa do caminho de um
+gesto aceito: o quadro capturado, os landmarks prontos (tracker), o
+acúmulo do GESTURE_HOLD_TIME, o disparo do acorde e, quando disponível
+(harness com o driver de áudio em disco), a saída do som do mixer.
+
+Etapas de cada registro (ms):
+    processamento: landmarks prontos - quadro capturado
+    segurar:       gesto aceito - landmarks do primeiro quadro correto
+    disparo:       som entregue ao mixer - gesto aceito
+    mixer:         som saindo do mixer - som entregue (só com a saída medida)
+    total:         do quadro capturado até a saída (ou até o disparo)
+
+O tempo de captura é o retorno de ``cap.read()``: a exposição da câmera
+acontece antes e não entra na medida.
+"""
+
+import json
+import time
+
+import numpy as np
+
+ETAPAS = ("processamento", "segurar", "disparo", "mixer", "total")
+
+
+class LatencyProbe:
+    """Marca as etapas de cada gesto aceito e resume a latência por etapa."""
+
+    def __init__(self, relogio=time.perf_counter):
+        self.relogio = relogio
+        self.registros = []
+        self._captura = None    # Quadro atual
+        self._landmarks = None
+        self._inicio = None     # (captura, landmarks) do primeiro quadro com o gesto correto
+        self._aceito = None
+
+    # --- Marcas (chamadas pelo engine) ---
+
+    def frame_capturado(self):
+        self._captura = self.relogio()
+
+    def landmarks_prontos(self):
+        self._landmarks = self.relogio()
+
+    def gesto_iniciado(self):
+        """O quadro atual é o primeiro com o gesto correto."""
+        self._inicio = (self._captura, self._landmarks)
+
+    def gesto_aceito(self):
+        self._aceito = self.relogio()
+
+    def som_disparado(self, acorde: str):
+        """Fecha o registro do gesto aceito (som já entregue ao mixer)."""
+        if self._inicio is None or self._aceito is None:
+            return None
+        captura, landmarks = self._inicio
+        registro = {
+            "acorde": acorde,
+            "captura": captura,
+            "landmarks": landmarks,
+            "aceito": self._aceito,
+            "disparo": self.relogio(),
+            "saida": None,  # Preenchido por quem mede a saída de áudio
+        }
+        self.registros.append(registro)
+        self._inicio = self._aceito = None
+        return registro
+
+    # --- Resultados ---
+
+    @staticmethod
+    def detalhar(registro: dict) -> dict:
+        """Latência de cada etapa de um registro, em ms (mixer None sem a saída medida)."""
+        ms = lambda a, b: (registro[b] - registro[a]) * 1000.0
+        saida = registro["saida"]
+        return {
+            "processamento": ms("captura", "landmarks"),
+            "segurar": ms("landmarks", "aceito"),
+            "disparo": ms("aceito", "disparo"),
+            "mixer": (saida - registro["disparo"]) * 1000.0 if saida is not None else None,
+            "total": ((saida if saida is not None else registro["disparo"]) - registro["captura"]) * 1000.0,
+        }
+
+    def resumo(self) -> dict:
+        """Por etapa: n, média, p50, p95 e máximo em ms."""
+        detalhes = [self.detalhar(r) for r in self.registros]
+        resumo = {}
+        for etapa in ETAPAS:
+            valores = np.array([d[etapa] for d in detalhes if d[etapa] is not None])
+            if len(valores) == 0:
+                continue
+            resumo[etapa] = {
+                "n": int(len(valores)),
+                "media": float(valores.mean()),
+                "p50": float(np.percentile(valores, 50)),
+                "p95": float(np.percentile(valores, 95)),
+                "max": float(valores.max()),
+            }
+        return resumo
+
+    def imprimir_resumo(self):
+        """Mostra a tabela de latência por etapa no terminal."""
+        resumo = self.resumo()
+        if not resumo:
+            print("Latência: nenhum gesto aceito")
+            return
+        print(f"Latência gesto -> som ({len(self.registros)} gestos aceitos), em ms:")
+        print(f"  {'etapa':<14}{'média':>8}{'p50':>8}{'p95':>8}{'máx':>8}")
+        for etapa, r in resumo.items():
+            print(f"  {etapa:<14}{r['media']:>8.1f}{r['p50']:>8.1f}{r['p95']:>8.1f}{r['max']:>8.1f}")
+
+    def salvar(self, path: str):
+        """Grava registros (tempos absolutos em s), etapas e resumo em JSON."""
+        dados = {
+            "registros": [dict(r, etapas=self.detalhar(r)) for r in self.registros],
+            "resumo": self.resumo(),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dados, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,42 @@
+"""Utilitários de teoria musical.
+
+Converte nomes de acordes (ex: 'G:maj', 'A:min') em frequências usando
+as tabelas de notas e intervalos da configuração.
+"""
+
+from functools import lru_cache
+
+from src.utils.config import NOTAS_BASE, INTERVALOS
+
+
+def parse_chord_name(nome_acorde_full):
+    """Separa um nome de acorde em tônica e tipo.
+
+    Args:
+        nome_acorde_full: Nome do acorde (ex: 'G:maj', 'A:min' ou 'C').
+
+    Returns:
+        tuple: (tônica, tipo). Sem ':' o tipo padrão é 'maj'.
+    """
+    if ":" in nome_acorde_full:
+        tonica, tipo = nome_acorde_full.split(":", 1)
+    else:
+        tonica = nome_acorde_full
+        tipo = "maj"
+    return tonica, tipo
+
+
+@lru_cache(maxsize=None)
+def chord_frequencies(nome_acorde_full):
+    """Calcula as frequências (Hz) das notas de um acorde.
+
+    Args:
+        nome_acorde_full: Nome do acorde (ex: 'G:maj', 'A:min').
+
+    Returns:
+        tuple: Frequências de cada nota do acorde, da tônica para cima.
+    """
+    tonica, tipo = parse_chord_name(nome_acorde_full)
+    freq_base = NOTAS_BASE.get(tonica, 261.63)
+    intervalos = INTERVALOS.get(tipo, INTERVALOS["maj"])
+    return tuple(freq_base * (2 ** (semi_tons / 12.0)) for semi_tons in intervalos)
@@ -17,3 +17,27 @@ def get_assets_path():
         return os.path.join(sys._MEIPASS, "assets")
     else:
         return "src/assets"
+
+
+def get_user_cache_path(*parts):
+    """Retorna (e cria) uma pasta de cache do usuário para o jogo.
+
+    Usada quando não é possível gravar ao lado dos assets, por exemplo
+    quando empacotado com PyInstaller (``sys._MEIPASS`` é temporário).
+
+    Args:
+        *parts: Subpastas dentro do cache do jogo (ex: "charts").
+
+    Returns:
+        str: Caminho absoluto da pasta de cache.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    path = os.path.join(base, "pymusicy", *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
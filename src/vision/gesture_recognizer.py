@@ -44,6 +44,30 @@ GESTURE_NAMES = {
     GestureType.ROCK: "Rock",
 }
 
+# Conversão dos nomes usados no CHORD_GESTURE_MAP para o enum
+GESTURE_BY_NAME = {
+    "OPEN_HAND": GestureType.OPEN_HAND,
+    "FIST": GestureType.FIST,
+    "PEACE": GestureType.PEACE,
+    "THUMB_UP": GestureType.THUMB_UP,
+    "INDEX_POINT": GestureType.INDEX_POINT,
+    "ROCK": GestureType.ROCK,
+}
+
+
+def gesture_for_chord(chord_name: str, chord_gesture_map: dict = None) -> GestureType:
+    """
+    Retorna o gesto esperado para um acorde.
+    
+    Args:
+        chord_name: Nome simples do acorde (ex: "G", "Am", "C")
+        chord_gesture_map: Mapeamento acorde → gesto (padrão: CHORD_GESTURE_MAP)
+    """
+    if chord_gesture_map is None:
+        chord_gesture_map = CHORD_GESTURE_MAP
+    gesture_str = chord_gesture_map.get(chord_name, "OPEN_HAND")
+    return GESTURE_BY_NAME.get(gesture_str, GestureType.OPEN_HAND)
+
 
 class GestureRecognizer:
     """
@@ -200,19 +224,7 @@ class GestureRecognizer:
         Args:
             chord_name: Nome simples do acorde (ex: "G", "Am", "C")
         """
-        gesture_str = self.chord_gesture_map.get(chord_name, "OPEN_HAND")
-        
-        # Converter string para enum
-        gesture_map = {
-            "OPEN_HAND": GestureType.OPEN_HAND,
-            "FIST": GestureType.FIST,
-            "PEACE": GestureType.PEACE,
-            "THUMB_UP": GestureType.THUMB_UP,
-            "INDEX_POINT": GestureType.INDEX_POINT,
-            "ROCK": GestureType.ROCK,
-        }
-        
-        return gesture_map.get(gesture_str, GestureType.OPEN_HAND)
+        return gesture_for_chord(chord_name, self.chord_gesture_map)
     
     def is_gesture_correct(self, landmarks, chord_name: str) -> tuple[bool, float, GestureType]:
         """
@@ -225,8 +237,21 @@ class GestureRecognizer:
         Returns:
             Tuple de (está_correto, confiança, gesto_detectado)
         """
-        detected_gesture, confidence = self.detect_gesture(landmarks)
         expected_gesture = self.get_expected_gesture(chord_name)
+        return self.check_gesture(landmarks, expected_gesture)
+    
+    def check_gesture(self, landmarks, expected_gesture: GestureType) -> tuple[bool, float, GestureType]:
+        """
+        Verifica se o gesto atual corresponde a um gesto já resolvido.
+        
+        Args:
+            landmarks: Landmarks da mão do MediaPipe
+            expected_gesture: Gesto esperado (ex: ChordEvent.gesture)
+            
+        Returns:
+            Tuple de (está_correto, confiança, gesto_detectado)
+        """
+        detected_gesture, confidence = self.detect_gesture(landmarks)
         
         is_correct = (detected_gesture == expected_gesture and 
                       confidence >= self.tolerance)
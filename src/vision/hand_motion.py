@@ -0,0 +1,68 @@
+"""
+Velocidade da mão a partir dos landmarks do MediaPipe.
+
+Guarda as posições recentes da palma e calcula a velocidade em larguras
+de imagem por segundo. O jogo usa o pico de velocidade logo antes de o
+gesto começar (o "golpe" até a posição) como intensidade do acorde.
+"""
+
+import math
+from collections import deque
+
+from src.utils.config import VELOCITY_WINDOW, VELOCITY_MAX
+
+# Landmark usado como posição da mão (base do dedo médio, centro da palma)
+PONTO_PALMA = 9
+
+
+def oitava_por_altura(y: float) -> int:
+    """Oitava pela altura da mão na imagem: terço de cima +1, meio 0, de baixo -1."""
+    if y < 1 / 3:
+        return 1
+    if y > 2 / 3:
+        return -1
+    return 0
+
+
+class MedidorVelocidade:
+    """Histórico curto da posição da palma para medir a velocidade da mão."""
+
+    def __init__(self, janela: float = VELOCITY_WINDOW, velocidade_max: float = VELOCITY_MAX):
+        """
+        Args:
+            janela: Segundos de histórico considerados
+            velocidade_max: Velocidade (larguras/s) que corresponde a intensidade 1.0
+        """
+        self.janela = janela
+        self.velocidade_max = velocidade_max
+        self._posicoes = deque()  # (tempo, x, y) normalizados
+
+    def atualizar(self, landmarks, agora: float):
+        """Registra a posição da palma no frame atual (sem mão limpa o histórico)."""
+        if landmarks is None:
+            self._posicoes.clear()
+            return
+        ponto = landmarks[PONTO_PALMA]
+        self._posicoes.append((agora, ponto.x, ponto.y))
+        while self._posicoes and agora - self._posicoes[0][0] > self.janela:
+            self._posicoes.popleft()
+
+    def pico(self) -> float:
+        """Maior velocidade entre frames consecutivos na janela (larguras/s)."""
+        maior = 0.0
+        anterior = None
+        for t, x, y in self._posicoes:
+            if anterior is not None and t > anterior[0]:
+                maior = max(maior, math.hypot(x - anterior[1], y - anterior[2]) / (t - anterior[0]))
+            anterior = (t, x, y)
+        return maior
+
+    def posicao(self):
+        """Última posição (x, y) normalizada da palma, ou None sem mão."""
+        if not self._posicoes:
+            return None
+        return self._posicoes[-1][1:]
+
+    def intensidade(self) -> float:
+        """Pico de velocidade normalizado para 0.0 a 1.0."""
+        return min(self.pico() / self.velocidade_max, 1.0)